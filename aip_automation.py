@@ -42,16 +42,25 @@ class AIPAutomation:
         """Setup Chrome WebDriver with appropriate options"""
         chrome_options = Options()
         if headless:
-            chrome_options.add_argument("--headless")
+            chrome_options.add_argument("--headless=new")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--window-size=1920,1080")
         
+        # Return from get() at DOMContentLoaded; explicit waits cover the rest
+        chrome_options.page_load_strategy = 'eager'
+        
         self.driver = webdriver.Chrome(options=chrome_options)
-        self.driver.implicitly_wait(10)
+        # No implicit wait: every lookup that needs to wait uses an explicit WebDriverWait,
+        # and an implicit wait would stack on top of those and on every missed probe
+        self.driver.implicitly_wait(0)
         logger.info("WebDriver initialized successfully")
     
+    def _wait(self, timeout: float = 5) -> WebDriverWait:
+        """Explicit wait polling every 200ms instead of Selenium's default 500ms"""
+        return WebDriverWait(self.driver, timeout, poll_frequency=0.2)
+    
     def navigate_to_aip(self, country_code: str) -> bool:
         """Navigate to the AIP website for the specified country"""
         if country_code not in self.config['countries']:
@@ -77,11 +86,11 @@ class AIPAutomation:
         for element_selector in wait_elements:
             try:
                 # Wait for element to be present
-                WebDriverWait(self.driver, 5).until(
+                self._wait(5).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, element_selector))
                 )
                 # Wait for element to disappear
-                WebDriverWait(self.driver, 10).until_not(
+                self._wait(10).until_not(
                     EC.presence_of_element_located((By.CSS_SELECTOR, element_selector))
                 )
                 logger.info(f"Loading element {element_selector} disappeared")
@@ -98,23 +107,25 @@ class AIPAutomation:
         for action in additional_actions:
             try:
                 if action['type'] == 'click':
-                    element = self.driver.find_element(By.CSS_SELECTOR, action['selector'])
+                    element = self._wait(action.get('timeout', 10)).until(
+                        EC.element_to_be_clickable((By.CSS_SELECTOR, action['selector']))
+                    )
                     element.click()
                     logger.info(f"Clicked element: {action['selector']}")
                     
                 elif action['type'] == 'select':
-                    select_element = Select(self.driver.find_element(By.CSS_SELECTOR, action['selector']))
+                    select_element = Select(self._wait(action.get('timeout', 10)).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, action['selector']))
+                    ))
                     select_element.select_by_value(action['value'])
                     logger.info(f"Selected value '{action['value']}' in {action['selector']}")
                     
                 elif action['type'] == 'wait':
-                    WebDriverWait(self.driver, action.get('timeout', 10)).until(
+                    self._wait(action.get('timeout', 10)).until(
                         EC.presence_of_element_located((By.CSS_SELECTOR, action['selector']))
                     )
                     logger.info(f"Waited for element: {action['selector']}")
                 
-                time.sleep(1)  # Small delay between actions
-                
             except (NoSuchElementException, TimeoutException) as e:
                 if action.get('required', True):
                     logger.error(f"Failed to perform action {action}: {e}")
@@ -141,7 +152,7 @@ class AIPAutomation:
         
         try:
             # Wait for element to be clickable
-            element = WebDriverWait(self.driver, 10).until(
+            element = self._wait(10).until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
             )
             element.click()
@@ -170,13 +181,10 @@ class AIPAutomation:
         if not self.perform_additional_actions(country_code):
             return False
         
-        # Click accept terms if available
-        if self.click_button(country_code, 'accept_terms'):
-            time.sleep(2)
-        
-        # Click proceed button if available
-        if self.click_button(country_code, 'proceed_button'):
-            time.sleep(2)
+        # Click accept terms and proceed buttons if available. No fixed pause is
+        # needed afterwards: click_button waits for the next button to be clickable.
+        self.click_button(country_code, 'accept_terms')
+        self.click_button(country_code, 'proceed_button')
         
         # Click download button
         if not self.click_button(country_code, 'download_button'):
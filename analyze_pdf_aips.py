@@ -10,6 +10,7 @@ Analyze PDF AIP files to:
 import json
 import re
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 from collections import defaultdict
@@ -112,6 +113,23 @@ def normalize_filename(country: str) -> str:
     """Convert country name to normalized filename format (lowercase with underscores)"""
     return country.lower().replace(' ', '_').replace('-', '_').replace('(', '').replace(')', '').replace("'", '')
 
+@lru_cache(maxsize=2)
+def _pdf_page_texts(pdf_path: str) -> Tuple[str, ...]:
+    """
+    Extract the text of every page of a PDF once
+    Both the page scan and the code extraction read the same file back to back,
+    so the last couple of PDFs are kept instead of being parsed twice
+    """
+    reader = PdfReader(pdf_path)
+    texts = []
+    for page_num, page in enumerate(reader.pages):
+        try:
+            texts.append(page.extract_text() or '')
+        except Exception as e:
+            logger.warning(f"  Error processing page {page_num + 1}: {e}")
+            texts.append('')
+    return tuple(texts)
+
 def find_airport_data_pages(pdf_path: Path) -> Dict[str, List[int]]:
     """
     Scan PDF and identify pages containing airport data
@@ -119,8 +137,8 @@ def find_airport_data_pages(pdf_path: Path) -> Dict[str, List[int]]:
     """
     airport_pages = {}
     try:
-        reader = PdfReader(str(pdf_path))
-        total_pages = len(reader.pages)
+        page_texts = _pdf_page_texts(str(pdf_path))
+        total_pages = len(page_texts)
         logger.info(f"Scanning {pdf_path.name} ({total_pages} pages)")
         
         # Patterns to identify airport data sections
@@ -128,10 +146,8 @@ def find_airport_data_pages(pdf_path: Path) -> Dict[str, List[int]]:
         airport_code_pattern = re.compile(r'\b([A-Z]{4})\b')
         
         # Scan each page
-        for page_num in range(total_pages):
+        for page_num, text in enumerate(page_texts):
             try:
-                page = reader.pages[page_num]
-                text = page.extract_text()
                 if not text:
                     continue
                 
@@ -189,10 +205,7 @@ def extract_icao_codes(text: str) -> Set[str]:
 def process_pdf_for_codes(pdf_path: Path, country: Optional[str] = None) -> Set[str]:
     """Process a single PDF and extract ICAO codes"""
     try:
-        reader = PdfReader(str(pdf_path))
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() + "\n"
+        text = "\n".join(_pdf_page_texts(str(pdf_path)))
         
         if not text:
             return set()
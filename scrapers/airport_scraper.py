@@ -7,46 +7,180 @@ Scrapes tower hours and contact information from FAA database
 import time
 import re
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional
+import requests
+from bs4 import BeautifulSoup, NavigableString, Tag
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+# Lexbor-backed parser is much faster than html.parser on large pages; optional
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+# Signs of a bot challenge served instead of the airport page (403/503 are caught by
+# the status check): Cloudflare challenge tokens in the markup, challenge page
+# titles, and the challenge prompt in the visible text. Generic words such as
+# "captcha" or a noscript "enable JavaScript" also appear on ordinary pages.
+CHALLENGE_TOKENS = (b'cf-chl', b'cf_chl')
+CHALLENGE_TITLES = ('JUST A MOMENT', 'ATTENTION REQUIRED', 'ACCESS DENIED')
+CHALLENGE_TEXT = ('VERIFY YOU ARE HUMAN', 'CHECKING YOUR BROWSER')
+# Upper bound on the page text handed to the parsers, well above a full airport page
+MAX_PAGE_TEXT = 200000
+
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.woff", "*.woff2", "*.ttf", "*.css",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*"
+]
+
+# Patterns used by the text parsers, compiled once at import
+# Time range or continuous operation, matched in one scan per line
+_HOURS_RE = re.compile(r'(\d{1,2}:\d{2})\s*-\s*(\d{1,2}:\d{2})|24 HOURS|CONTINUOUS', re.IGNORECASE)
+# Every hours caption contains one of these tokens; other lines are skipped
+_HOURS_CAPTION_RE = re.compile(r'TOWER|APCH|APPROACH')
+_PHONE_RE = re.compile(r'\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}')
+# One pass over the contacts text classifying each non-blank line as a contact
+# header, a line holding a phone (checked before email), an email, or plain text.
+# Separators inside the phone number must not cross a line break.
+_CONTACT_LINE_RE = re.compile(
+    r'^[^\S\n]*(?:'
+    r'(?P<header>(?i:OWNER|MANAGER))[^\S\n]*$'
+    r'|.*?(?P<phone>\+?1?(?:[-.]|[^\S\n])?\(?[0-9]{3}\)?(?:[-.]|[^\S\n])?[0-9]{3}(?:[-.]|[^\S\n])?[0-9]{4})'
+    r'|.*?(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
+    r'|(?P<text>\S.*)'
+    r')',
+    re.MULTILINE,
+)
+# Operations and Contacts headings, and the headings that end each section. They
+# are searched case-insensitively in the page text itself: offsets found in an
+# upper-cased copy drift wherever upper() changes the length ("ß" -> "SS")
+_OPERATIONS_RE = re.compile(r'OPERATIONS', re.IGNORECASE)
+_OPERATIONS_END_RE = re.compile(r'COMMUNICATIONS|NAVAIDS|WEATHER|CONTACTS', re.IGNORECASE)
+_CONTACTS_RE = re.compile(r'CONTACTS', re.IGNORECASE)
+_CONTACTS_END_RE = re.compile(r'REMARKS|SUMMARY|OPERATIONS', re.IGNORECASE)
+
+# Layout of the HTTP page text, mirroring the browser's innerText: block elements
+# and table rows start a new line, table cells are tab-separated
+_BLOCK_TAGS = frozenset({
+    'address', 'article', 'aside', 'blockquote', 'caption', 'dd', 'div', 'dl', 'dt',
+    'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5',
+    'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section', 'table',
+    'tbody', 'tfoot', 'thead', 'tr', 'ul',
+})
+_CELL_TAGS = frozenset({'td', 'th'})
+_SKIPPED_TAGS = frozenset({'script', 'style', 'noscript', 'template', 'head'})
+
+
+def _lexbor_children(node):
+    """(tag, node) for each child of a selectolax node, or (None, text) for text nodes"""
+    for child in node.iter(include_text=True):
+        if child.tag == '-text':
+            yield None, child.text(deep=False)
+        elif not child.tag.startswith('-'):
+            yield child.tag, child
+
+
+def _soup_children(node):
+    """(tag, node) for each child of a BeautifulSoup node, or (None, text) for text nodes"""
+    for child in node.children:
+        if isinstance(child, Tag):
+            yield child.name, child
+        elif type(child) is NavigableString:
+            yield None, str(child)
+
+
+def _layout_text(root, children) -> str:
+    """
+    Text of a parsed page laid out like innerText: one block or table row per
+    line, cells joined by tabs, whitespace collapsed and blank lines dropped
+    """
+    parts: List[str] = []
+    
+    def walk(node):
+        for tag, child in children(node):
+            if tag is None:
+                parts.append(child)
+            elif tag in _SKIPPED_TAGS:
+                continue
+            elif tag == 'br':
+                parts.append('\n')
+            else:
+                block = tag in _BLOCK_TAGS
+                if block:
+                    parts.append('\n')
+                walk(child)
+                if tag in _CELL_TAGS:
+                    parts.append('\t')
+                elif block:
+                    parts.append('\n')
+    
+    walk(root)
+    lines = []
+    for line in ''.join(parts).split('\n'):
+        cells = [' '.join(cell.split()) for cell in line.split('\t')]
+        line = '\t'.join(cell for cell in cells if cell)
+        if line:
+            lines.append(line)
+    return '\n'.join(lines)
+
 class AirportScraper:
     def __init__(self):
         """Initialize the airport scraper with optimized settings"""
+        # Chrome is started on demand, only when the plain HTTP fetch is not enough
         self.driver = None
-        self.setup_driver()
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': USER_AGENT})
     
     def setup_driver(self):
         """Setup Chrome WebDriver with optimized settings for speed"""
         chrome_options = Options()
-        chrome_options.add_argument("--headless")  # Run in background
+        chrome_options.add_argument("--headless=new")  # Run in background
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
-        chrome_prefs = {"profile.managed_default_content_settings.images": 2}
+        # Only body text is read, so skip images (stylesheets are blocked via CDP below)
+        chrome_prefs = {
+            "profile.managed_default_content_settings.images": 2
+        }
         chrome_options.add_experimental_option("prefs", chrome_prefs)
         chrome_options.add_argument("--disable-plugins")
         chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--disable-default-apps")
         chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+        chrome_options.add_argument("--disable-features=VizDisplayCompositor,TranslateUI")
+        chrome_options.add_argument("--mute-audio")
+        chrome_options.add_argument("--renderer-process-limit=1")
         chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36")
+        chrome_options.add_argument(f"--user-agent={USER_AGENT}")
         
         # Page load strategy for speed
         chrome_options.page_load_strategy = 'eager'
         
         self.driver = webdriver.Chrome(options=chrome_options)
         self.driver.set_page_load_timeout(30)
-        self.driver.implicitly_wait(5)
+        # No implicit wait: the body is present once get() returns, and the section
+        # probes (find_elements) should miss immediately rather than after 5s
+        self.driver.implicitly_wait(0)
+        
+        # Block subresources the scraper never reads (stylesheets, fonts, images, analytics)
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+        except Exception as e:
+            logger.warning(f"Could not set blocked URLs: {e}")
         
         logger.info("WebDriver initialized with optimized settings")
     
@@ -69,24 +203,31 @@ class AirportScraper:
         logger.info(f"Fetching airport information for {airport_code}")
         
         try:
+            # The FAA page is server-rendered; try a plain HTTP fetch first
+            airport_info = self._try_http_path(airport_code, url)
+            if airport_info:
+                logger.info(f"Successfully extracted information for {airport_code} over HTTP")
+                return airport_info
+            
+            if self.driver is None:
+                self.setup_driver()
+            
             # Navigate to the airport page
+            # With the eager page load strategy get() returns once the DOM is ready,
+            # so the body is already there
             self.driver.get(url)
             
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
             # Debug: Log page content (commented out for production)
             # self._debug_page_content()
             
+            # Read the rendered page text once (one round-trip) and share it
+            # between the extractors; the slice bounds what crosses the driver bridge
+            body_text = self.driver.execute_script(
+                "return document.body.innerText.slice(0, arguments[0]);", MAX_PAGE_TEXT
+            ) or ''
+            
             # Extract airport information
-            airport_info = {
-                'airportCode': airport_code,
-                'airportName': self._extract_airport_name(),
-                'towerHours': self._extract_tower_hours(),
-                'contacts': self._extract_contacts()
-            }
+            airport_info = {'airportCode': airport_code, **self._extract_all(body_text, self.driver.title)}
             
             logger.info(f"Successfully extracted information for {airport_code}")
             return airport_info
@@ -98,25 +239,77 @@ class AirportScraper:
             logger.error(f"Error fetching airport information for {airport_code}: {e}")
             raise Exception(f"Failed to fetch airport information: {str(e)}")
     
-    def _extract_airport_name(self) -> str:
+    def _try_http_path(self, airport_code: str, url: str) -> Optional[Dict]:
+        """
+        Fetch and parse the airport page without a browser
+        
+        Returns None when the response is an error, a bot challenge or lacks the
+        airport sections, so the caller can fall back to Selenium.
+        """
+        try:
+            response = self.session.get(url, timeout=15)
+        except requests.RequestException as e:
+            logger.info(f"HTTP fetch failed for {airport_code}, using browser: {e}")
+            return None
+        
+        if response.status_code != 200:
+            logger.info(f"HTTP fetch returned {response.status_code} for {airport_code}, using browser")
+            return None
+        
+        body_text, title = self._html_text(response.content)
+        body_text = body_text[:MAX_PAGE_TEXT]
+        upper = body_text.upper()
+        title_upper = title.upper()
+        if (any(token in response.content for token in CHALLENGE_TOKENS)
+                or any(marker in title_upper for marker in CHALLENGE_TITLES)
+                or any(marker in upper for marker in CHALLENGE_TEXT)):
+            logger.info(f"HTTP fetch hit a challenge page for {airport_code}, using browser")
+            return None
+        
+        if 'OPERATIONS' not in upper and 'CONTACTS' not in upper:
+            logger.info(f"HTTP response for {airport_code} has no airport sections, using browser")
+            return None
+        
+        return {'airportCode': airport_code, **self._extract_all(body_text, title, upper)}
+    
+    def _html_text(self, content: bytes):
+        """Return (body text, title) of an HTML page, laid out in lines like the browser's innerText"""
+        if HTMLParser is not None:
+            tree = HTMLParser(content)
+            title_node = tree.css_first('title')
+            title = title_node.text(strip=True) if title_node else ''
+            return _layout_text(tree.body or tree.root, _lexbor_children), title
+        
+        soup = BeautifulSoup(content, 'html.parser')
+        title = soup.title.get_text(strip=True) if soup.title else ''
+        return _layout_text(soup.body or soup, _soup_children), title
+    
+    def _extract_all(self, body_text: str, title: str = '', upper: Optional[str] = None) -> Dict:
+        """Run all extractors over one shared upper-cased copy of the page text"""
+        if upper is None:
+            upper = body_text.upper()
+        return {
+            'airportName': self._extract_airport_name(body_text, upper, title),
+            'towerHours': self._extract_tower_hours(body_text),
+            'contacts': self._extract_contacts(body_text)
+        }
+    
+    def _extract_airport_name(self, body_text: str, upper: str, title: str = '') -> str:
         """Extract airport name from the page"""
         try:
-            # Get all text content
-            body_text = self.driver.find_element(By.TAG_NAME, "body").text
-            
             # Look for airport name pattern in the text
             lines = body_text.split('\n')
+            upper_lines = upper.split('\n')
             for i, line in enumerate(lines):
                 line = line.strip()
                 # Look for lines that contain airport names (usually after the code)
-                if line and len(line) > 5 and any(word in line.upper() for word in ['INTL', 'AIRPORT', 'FIELD', 'MUNICIPAL']):
+                if line and len(line) > 5 and any(word in upper_lines[i] for word in ['INTL', 'AIRPORT', 'FIELD', 'MUNICIPAL']):
                     # Check if previous line contains airport code
                     if i > 0 and any(code in lines[i-1] for code in ['KJFK', 'KLAX', 'KORD', 'KDFW', 'KATL']):
                         logger.info(f"Found airport name: {line}")
                         return line
             
             # Try to get from page title
-            title = self.driver.title
             if title and title != "Aeronautical Information Services":
                 logger.info(f"Using page title as airport name: {title}")
                 return title
@@ -127,38 +320,17 @@ class AirportScraper:
             logger.warning(f"Could not extract airport name: {e}")
             return "Unknown Airport"
     
-    def _extract_tower_hours(self) -> List[Dict]:
+    def _extract_tower_hours(self, body_text: str) -> List[Dict]:
         """Extract tower hours from Operations section"""
         tower_hours = []
         
         try:
-            # Get all text content
-            body_text = self.driver.find_element(By.TAG_NAME, "body").text
-            
-            # Look for Operations section in the text
-            lines = body_text.split('\n')
-            operations_start = -1
-            
-            for i, line in enumerate(lines):
-                if "OPERATIONS" in line.upper():
-                    operations_start = i
-                    break
-            
-            if operations_start >= 0:
-                # Extract text from Operations section until next major section
-                operations_text = []
-                for i in range(operations_start + 1, len(lines)):
-                    line = lines[i].strip()
-                    # Stop at next major section
-                    if line and any(section in line.upper() for section in ['COMMUNICATIONS', 'NAVAIDS', 'WEATHER', 'CONTACTS']):
-                        break
-                    if line:
-                        operations_text.append(line)
-                
-                if operations_text:
-                    # Parse the operations text for hours
-                    tower_hours = self._parse_hours_text('\n'.join(operations_text))
-                    logger.info(f"Found operations text: {len(operations_text)} lines")
+            # Extract text from Operations section until next major section
+            operations_text = self._section_text(body_text, _OPERATIONS_RE, _OPERATIONS_END_RE)
+            if operations_text:
+                # Parse the operations text for hours
+                tower_hours = self._parse_hours_text(operations_text)
+                logger.info(f"Found operations text: {len(operations_text)} characters")
             
             if not tower_hours:
                 # Fallback: look for any time patterns in the entire text
@@ -169,38 +341,17 @@ class AirportScraper:
         
         return tower_hours
     
-    def _extract_contacts(self) -> List[Dict]:
+    def _extract_contacts(self, body_text: str) -> List[Dict]:
         """Extract contact information from Contacts section"""
         contacts = []
         
         try:
-            # Get all text content
-            body_text = self.driver.find_element(By.TAG_NAME, "body").text
-            
-            # Look for Contacts section in the text
-            lines = body_text.split('\n')
-            contacts_start = -1
-            
-            for i, line in enumerate(lines):
-                if "CONTACTS" in line.upper():
-                    contacts_start = i
-                    break
-            
-            if contacts_start >= 0:
-                # Extract text from Contacts section until next major section or end
-                contacts_text = []
-                for i in range(contacts_start + 1, len(lines)):
-                    line = lines[i].strip()
-                    # Stop at next major section
-                    if line and any(section in line.upper() for section in ['REMARKS', 'SUMMARY', 'OPERATIONS']):
-                        break
-                    if line:
-                        contacts_text.append(line)
-                
-                if contacts_text:
-                    # Parse the contacts text
-                    contacts = self._parse_contacts_text('\n'.join(contacts_text))
-                    logger.info(f"Found contacts text: {len(contacts_text)} lines")
+            # Extract text from Contacts section until next major section or end
+            contacts_text = self._section_text(body_text, _CONTACTS_RE, _CONTACTS_END_RE)
+            if contacts_text:
+                # Parse the contacts text
+                contacts = self._parse_contacts_text(contacts_text)
+                logger.info(f"Found contacts text: {len(contacts_text)} characters")
             
             if not contacts:
                 # Fallback: look for any contact patterns in the entire text
@@ -211,6 +362,24 @@ class AirportScraper:
         
         return contacts
     
+    def _section_text(self, body_text: str, heading_re: re.Pattern, end_re: re.Pattern) -> str:
+        """
+        Slice the lines after the first line matching heading_re, up to the first
+        line matching end_re, using offsets rather than splitting the page into lines
+        """
+        heading_match = heading_re.search(body_text)
+        if not heading_match:
+            return ''
+        
+        start = body_text.find('\n', heading_match.start())
+        if start == -1:
+            return ''
+        start += 1
+        
+        end_match = end_re.search(body_text, start)
+        end = body_text.rfind('\n', start, end_match.start()) + 1 if end_match else len(body_text)
+        return body_text[start:max(start, end)].strip()
+    
     def _debug_page_content(self):
         """Debug method to log page content"""
         try:
@@ -280,6 +449,15 @@ class AirportScraper:
             logger.warning(f"Error extracting text from section: {e}")
             return ""
     
+    def _match_hours(self, line: str) -> Optional[str]:
+        """Return '24 Hours' or 'HH:MM-HH:MM' for the first hours value on a line"""
+        match = _HOURS_RE.search(line)
+        if not match:
+            return None
+        if match.group(1):
+            return f"{match.group(1)}-{match.group(2)}"
+        return '24 Hours'
+    
     def _parse_hours_text(self, hours_text: str) -> List[Dict]:
         """Parse hours text into structured data"""
         hours = []
@@ -288,71 +466,46 @@ class AirportScraper:
             lines = hours_text.split('\n')
             
             # Look for specific tower hours patterns
-            for line in lines:
+            for idx, line in enumerate(lines):
                 line = line.strip()
                 if not line:
                     continue
+                line_upper = line.upper()
+                if not _HOURS_CAPTION_RE.search(line_upper):
+                    continue
                 
                 # Look for tower hours specifically
-                if 'TOWER HOURS' in line.upper() or 'TOWER' in line.upper() and 'HOURS' in line.upper():
-                    # Extract the hours from this line or the next line
-                    time_match = re.search(r'(\d{1,2}:\d{2})\s*-\s*(\d{1,2}:\d{2})', line)
-                    if time_match:
-                        hours.append({
-                            'day': 'Tower Hours',
-                            'hours': f"{time_match.group(1)}-{time_match.group(2)}"
-                        })
-                    elif '24 HOURS' in line.upper() or 'CONTINUOUS' in line.upper():
-                        hours.append({
-                            'day': 'Tower Hours',
-                            'hours': '24 Hours'
-                        })
-                    else:
-                        # Look for hours in the next few lines
-                        for i, next_line in enumerate(lines[lines.index(line)+1:lines.index(line)+3]):
-                            if '24 HOURS' in next_line.upper() or 'CONTINUOUS' in next_line.upper():
-                                hours.append({
-                                    'day': 'Tower Hours',
-                                    'hours': '24 Hours'
-                                })
-                                break
-                            time_match = re.search(r'(\d{1,2}:\d{2})\s*-\s*(\d{1,2}:\d{2})', next_line)
-                            if time_match:
-                                hours.append({
-                                    'day': 'Tower Hours',
-                                    'hours': f"{time_match.group(1)}-{time_match.group(2)}"
-                                })
-                                break
+                if 'TOWER HOURS' in line_upper or 'TOWER' in line_upper and 'HOURS' in line_upper:
+                    # Extract the hours from this line or the next few lines
+                    for candidate in [line] + lines[idx+1:idx+3]:
+                        value = self._match_hours(candidate)
+                        if value:
+                            hours.append({
+                                'day': 'Tower Hours',
+                                'hours': value
+                            })
+                            break
                 
                 # Look for approach/departure hours
-                elif 'APCH/DEP HOURS' in line.upper() or 'APPROACH' in line.upper() and 'HOURS' in line.upper():
-                    if '24 HOURS' in line.upper() or 'CONTINUOUS' in line.upper():
+                elif 'APCH/DEP HOURS' in line_upper or 'APPROACH' in line_upper and 'HOURS' in line_upper:
+                    value = self._match_hours(line)
+                    if value:
                         hours.append({
                             'day': 'Approach/Departure',
-                            'hours': '24 Hours'
+                            'hours': value
                         })
-                    else:
-                        time_match = re.search(r'(\d{1,2}:\d{2})\s*-\s*(\d{1,2}:\d{2})', line)
-                        if time_match:
-                            hours.append({
-                                'day': 'Approach/Departure',
-                                'hours': f"{time_match.group(1)}-{time_match.group(2)}"
-                            })
             
             # If no specific hours found, look for any 24 hours or continuous operations
             # Deduplicate entries
             if hours:
-                unique = []
-                seen = set()
+                unique = {}
                 for h in hours:
-                    key = (h.get('day'), h.get('hours'))
-                    if key not in seen:
-                        seen.add(key)
-                        unique.append(h)
-                hours = unique
+                    unique.setdefault((h.get('day'), h.get('hours')), h)
+                hours = list(unique.values())
             if not hours:
                 for line in lines:
-                    if '24 HOURS' in line.upper() or 'CONTINUOUS' in line.upper():
+                    line_upper = line.upper()
+                    if '24 HOURS' in line_upper or 'CONTINUOUS' in line_upper:
                         hours.append({
                             'day': 'Operations',
                             'hours': '24 Hours'
@@ -380,49 +533,39 @@ class AirportScraper:
         contacts = []
         
         try:
-            lines = contacts_text.split('\n')
             current_contact = None
             
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
+            for match in _CONTACT_LINE_RE.finditer(contacts_text):
+                kind = match.lastgroup
                 
                 # Look for specific contact headers
-                if line.upper() in ['OWNER', 'MANAGER']:
+                if kind == 'header':
                     # Save previous contact if exists
                     if current_contact:
                         contacts.append(current_contact)
                     
                     # Start new contact
                     current_contact = {
-                        'type': line,
+                        'type': match.group('header'),
                         'phone': '',
                         'name': '',
                         'email': '',
                         'notes': ''
                     }
                 elif current_contact:
-                    # Look for phone numbers in the line
-                    phone_pattern = r'(\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4})'
-                    phone_match = re.search(phone_pattern, line)
-                    
-                    # Look for email addresses
-                    email_pattern = r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
-                    email_match = re.search(email_pattern, line)
-                    
-                    if phone_match:
+                    if kind == 'phone':
                         # Clean up phone number formatting
-                        phone = phone_match.group(1).strip()
-                        current_contact['phone'] = phone
-                    elif email_match:
-                        current_contact['email'] = email_match.group(1)
-                    elif not current_contact['name'] and len(line) > 3:
-                        # This might be a name
-                        current_contact['name'] = line
-                    elif len(line) > 3:
-                        # Additional info
-                        current_contact['notes'] += line + ' '
+                        current_contact['phone'] = match.group('phone').strip()
+                    elif kind == 'email':
+                        current_contact['email'] = match.group('email')
+                    else:
+                        line = match.group('text').rstrip()
+                        if not current_contact['name'] and len(line) > 3:
+                            # This might be a name
+                            current_contact['name'] = line
+                        elif len(line) > 3:
+                            # Additional info
+                            current_contact['notes'] += line + ' '
             
             # Add the last contact
             if current_contact:
@@ -430,8 +573,8 @@ class AirportScraper:
             
             # If no structured contacts found, look for any phone numbers
             if not contacts:
-                phone_pattern = r'(\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4})'
-                phone_matches = re.findall(phone_pattern, contacts_text)
+                # Distinct numbers in page order; a number repeated across sections counts once
+                phone_matches = list(dict.fromkeys(m.group(0).strip() for m in _PHONE_RE.finditer(contacts_text)))
                 
                 for i, phone in enumerate(phone_matches[:3]):  # Limit to first 3 phone numbers
                     contacts.append({
@@ -469,6 +612,60 @@ class AirportScraper:
         if self.driver:
             self.driver.quit()
             logger.info("WebDriver closed")
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+@lru_cache(maxsize=1)
+def get_scraper() -> AirportScraper:
+    """
+    Shared scraper reused across requests, so its HTTP session and any browser are
+    kept warm. Not thread-safe; use scrape_airports for concurrent lookups.
+    """
+    return AirportScraper()
+
+def scrape_airports(airport_codes: List[str], max_workers: int = 4) -> Dict[str, Dict]:
+    """
+    Scrape several airports in parallel, at most one Chrome session per worker
+    
+    Each worker thread creates its own AirportScraper on first use and reuses it
+    for every airport it handles, so the browser start-up (needed only when the
+    HTTP fetch falls back to Selenium) is paid at most once per worker.
+    
+    Args:
+        airport_codes: Airport codes (e.g., ['KJFK', 'KLAX'])
+        max_workers: Number of concurrent browser sessions
+        
+    Returns:
+        Dictionary mapping airport code to its information (or {'error': ...})
+    """
+    codes = [code.upper().strip() for code in airport_codes]
+    local = threading.local()
+    scrapers: List[AirportScraper] = []
+    scrapers_lock = threading.Lock()
+    
+    def scrape(code: str) -> Dict:
+        try:
+            scraper = getattr(local, 'scraper', None)
+            if scraper is None:
+                scraper = local.scraper = AirportScraper()
+                with scrapers_lock:
+                    scrapers.append(scraper)
+            return scraper.get_airport_info(code)
+        except Exception as e:
+            logger.error(f"Error scraping {code}: {e}")
+            return {'airportCode': code, 'error': str(e)}
+    
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(codes, executor.map(scrape, codes)))
+    finally:
+        for scraper in scrapers:
+            scraper.close()
 
 def main():
     """Test the scraper with a sample airport"""
@@ -1,38 +1,323 @@
 #!/usr/bin/env python3
+import os
 import re
 import time
+import types
+import inspect
 import logging
-from typing import Dict, List
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
 
+import requests
+from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright
 
+# Lexbor-backed parser is much faster than html.parser on large AIP pages; optional
+try:
+	from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+	HTMLParser = None
+
+# RE2 matches in linear time, which matters for the lazy DOTALL section
+# patterns below; optional (pip install google-re2)
+try:
+	import re2
+except ImportError:
+	re2 = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Playwright releases without _connection._capture_stack_trace call inspect.stack()
+# on every sync API call (in _sync_base._sync, and again in _connection when the
+# task has no stack), which reads the source line of every frame. Their trace
+# metadata only uses the frames, so hand both modules an inspect whose stack()
+# skips the source context. Newer releases walk the frames themselves and are left
+# alone; set PW_INSPECT_STACK=1 to keep the stock behaviour when debugging Playwright.
+if os.getenv('PW_INSPECT_STACK', '0') != '1':
+	try:
+		from playwright._impl import _connection as _pw_connection, _sync_base as _pw_sync_base
+		if not hasattr(_pw_connection, '_capture_stack_trace'):
+			_frames_only_inspect = types.ModuleType('inspect')
+			_frames_only_inspect.__dict__.update(inspect.__dict__)
+			_frames_only_inspect.stack = lambda context=0: inspect.stack(context)
+			_pw_sync_base.inspect = _frames_only_inspect
+			_pw_connection.inspect = _frames_only_inspect
+	except ImportError as e:
+		logger.debug(f"Playwright stack capture left unchanged: {e}")
+
+# Browser profile kept between runs so the eAIP pages are served from Chromium's disk
+# cache. Chromium locks a profile; a scraper that finds it in use runs without one
+PROFILE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'clearway', 'estonia_playwright')
+# Resources that never affect the extracted text
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+# Navigations get the long timeout; element lookups fail fast so fallbacks start sooner
+NAVIGATION_TIMEOUT = 30000
+ACTION_TIMEOUT = 10000
+LOOKUP_TIMEOUT = 3000
+# Airport pages are static HTML; from the navigation href "../eAIP/EE-AD-2.EETN-en-GB.html#AD-2.EETN"
+AIRPORT_URL_TEMPLATE = "https://eaip.eans.ee/2025-10-02/html/eAIP/EE-AD-2.{code}-en-GB.html#AD-2.{code}"
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+
+# Perl classes that RE2 always matches as ASCII, while re matches them as Unicode
+# unless re.ASCII is set
+_PERL_CLASS_RE = re.compile(r'\\[sSwWdDbB]')
+
+
+def _compile_linear(pattern: str, flags: int = 0):
+	"""
+	Compile with RE2 when it is installed and matches like re would, else with re.
+
+	re's IGNORECASE and DOTALL map to RE2 options. Other flags, and Perl classes
+	without re.ASCII (RE2's are ASCII-only and would miss non-breaking spaces),
+	keep re.
+	"""
+	if re2 is None:
+		return re.compile(pattern, flags)
+	if flags & ~(re.IGNORECASE | re.DOTALL | re.ASCII):
+		logger.debug(f"Compiling {pattern!r} with re: flags not mapped to RE2")
+		return re.compile(pattern, flags)
+	if not flags & re.ASCII and _PERL_CLASS_RE.search(pattern):
+		logger.debug(f"Compiling {pattern!r} with re: Unicode character classes")
+		return re.compile(pattern, flags)
+	options = re2.Options()
+	options.case_sensitive = not flags & re.IGNORECASE
+	options.dot_nl = bool(flags & re.DOTALL)
+	try:
+		return re2.compile(pattern, options)
+	except re2.error as e:
+		logger.debug(f"Compiling {pattern!r} with re: RE2 rejected it: {e}")
+		return re.compile(pattern, flags)
+
+
+# Patterns used by the text extractors, compiled once at import. Patterns without
+# \s get re.ASCII (cheaper case-insensitive literals and \d); \s stays Unicode
+# because eAIP text contains non-breaking spaces.
+# The characters re's Unicode \s matches, spelled out so that the patterns given to
+# _compile_linear keep matching non-breaking spaces on RE2 as well
+_WS_CHARS = '\t\n\v\f\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000'
+_WS = f'[{_WS_CHARS}]'
+_NAME_SUFFIX_RE = re.compile(r'\s*(militaarlennuväli|Military Aerodrome|lennuväli|Aerodrome)$', re.IGNORECASE)
+_NAME_AD_TAIL_RE = re.compile(r'\s*AD\s*2\.\d+.*$', re.IGNORECASE)
+# Lookaround-free section patterns go through _compile_linear and use RE2 when it
+# is installed; _ATS_RE keeps re for its lookbehinds
+_AD_ADMIN_RE = _compile_linear(rf'(?:^|{_WS})AD{_WS}+Administration.*?(H24|NIL)', re.IGNORECASE | re.DOTALL)
+_AD_OPERATOR_RES = (
+	_compile_linear(rf'MON-FRI{_WS}*[:\-]{_WS}*([0-9]{{2}}[:.]?[0-9]{{2}}){_WS}*[–\-]{_WS}*([0-9]{{2}}[:.]?[0-9]{{2}})', re.IGNORECASE | re.DOTALL),
+	_compile_linear(rf'(?:^|{_WS})AD{_WS}+Operator.*?(H24|NIL)', re.IGNORECASE | re.DOTALL),
+)
+_CUSTOMS_RE = _compile_linear(r'Customs.*?immigration.*?(H24|NIL|May be requested)', re.IGNORECASE | re.DOTALL | re.ASCII)
+_ATS_RE = re.compile(r'(?<!Reporting )(?<!MET\s)ATS(?![A-Z]).*?(H24|NIL)', re.IGNORECASE | re.DOTALL)
+# Literal +372 prefix, then a possessive digit/space run that never backtracks
+_PHONE_RE = re.compile(r'(\+372[0-9\s]++)')
+_EMAIL_RE = re.compile(r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})')
+_EMAIL_TAIL_RE = re.compile(r'[A-Z]{2,}.*$')
+_CATEGORY_RES = (
+	re.compile(r'AD\s+CATEGORY[:\s]+([0-9])', re.IGNORECASE),
+	re.compile(r'Category[:\s]+([0-9])', re.IGNORECASE),
+	re.compile(r'Category\s+([0-9])[:\s]+for', re.IGNORECASE),
+)
+# The value follows its caption within the same table row, so the gap is bounded:
+# a caption with no value nearby fails after 300 characters instead of scanning on
+_TRAFFIC_RES = (
+	_compile_linear(rf'Types?{_WS}+of{_WS}+traffic.{{0,300}}?(IFR[/, ]VFR|VFR[/, ]IFR|IFR|VFR)', re.IGNORECASE),
+	_compile_linear(r'Traffic.{0,300}?(IFR[/, ]VFR|VFR[/, ]IFR|IFR|VFR)', re.IGNORECASE | re.ASCII),
+	re.compile(r'(IFR/VFR|VFR/IFR)', re.IGNORECASE | re.ASCII),
+)
+_REMARKS_HEAD_RE = re.compile(r'^REMARKS[:\s]*', re.IGNORECASE)
+_AD23_TAIL_RE = _compile_linear(rf'AD{_WS}+2\.3.*$', re.IGNORECASE | re.DOTALL)
+_NEXT_AD_RE = re.compile(r'\w+\s+AD\s+2\.\d+', re.IGNORECASE)
+_COPYRIGHT_TAIL_RE = re.compile(r'©.*$', re.DOTALL)
+# RE2's \w is ASCII-only, so the word between AIP and AIRAC is a run of anything
+# but whitespace, ASCII punctuation and dashes
+_AIRAC_TAIL_RE = _compile_linear(rf'AIP{_WS}+[^{_WS_CHARS}!-/:-@\[-^`{{-~–—]+{_WS}+AIRAC.*$', re.IGNORECASE | re.DOTALL)
+_AD_HEADING_RE = re.compile(r'AD 2\.(\d+)', re.ASCII)
+
+# Body text cut down in the browser to the AD 2.1 .. AD 2.8 window the extractors
+# read, so only that part crosses the Playwright connection. Neither bound may match
+# AD 2.10-2.19 or AD 2.80-2.89. textContent (not innerText) is kept because the
+# extractors rely on its cell concatenation.
+_SECTIONS_TEXT_JS = """() => {
+	const text = document.body ? document.body.textContent : '';
+	const start = text.search(/AD 2\\.1(?!\\d)/i);
+	const end = text.search(/AD 2\\.8(?!\\d)/i);
+	return text.slice(Math.max(0, start - 200), end > start ? end + 2000 : text.length);
+}"""
+# The same bounds applied in Python to pages fetched over HTTP
+_SECTIONS_START_RE = re.compile(r'AD 2\.1(?!\d)', re.IGNORECASE | re.ASCII)
+_SECTIONS_END_RE = re.compile(r'AD 2\.8(?!\d)', re.IGNORECASE | re.ASCII)
+
+# Fields read as the first hit of a pattern list inside one AD 2.x section:
+# (field, section heading, fallback heading, next heading, patterns)
+_SECTION_FIELDS = (
+	("trafficTypes", 'AD 2.2', 'AERODROME GEOGRAPHICAL', 'AD 2.3', _TRAFFIC_RES),
+	("fireFightingCategory", 'AD 2.6', 'RESCUE AND FIRE FIGHTING', 'AD 2.7', _CATEGORY_RES),
+)
+
+
+def _collapse_ws(s: str) -> str:
+	"""Strip and collapse whitespace runs to single spaces (str.split runs in C, no regex)."""
+	return ' '.join(s.split())
+
+
+@lru_cache(maxsize=256)
+def _name_regexes(code: str) -> Tuple[re.Pattern, re.Pattern, re.Pattern]:
+	"""Per-airport name patterns: 'CODE — NAME' up to the next CODE, a trailing CODE, and a line holding CODE."""
+	escaped = re.escape(code)
+	return (
+		re.compile(rf'{escaped}\s*[—–-]\s*(.+?)(?=\s*{escaped})', re.IGNORECASE),
+		re.compile(rf'\s*{escaped}.*$', re.IGNORECASE),
+		re.compile(rf'^[^\n]*{escaped}[^\n]*$', re.MULTILINE),
+	)
+
+
+def _build_ad_index(upper: str) -> Dict[str, List[int]]:
+	"""
+	Offsets of every 'AD 2.x' heading in the upper-cased page, found in one scan.
+	Keys follow str.find semantics, so 'AD 2.21' is listed under 'AD 2.2' as well;
+	'AD 2.' lists every heading, for finding whichever one comes next.
+	"""
+	index: Dict[str, List[int]] = {}
+	for match in _AD_HEADING_RE.finditer(upper):
+		index.setdefault('AD 2.', []).append(match.start())
+		number = match.group(1)
+		for i in range(1, len(number) + 1):
+			index.setdefault(f'AD 2.{number[:i]}', []).append(match.start())
+	return index
+
+
+def _find_ad(ad_index: Dict[str, List[int]], key: str, start: int = 0) -> int:
+	"""Index equivalent of upper.find(key, start)."""
+	offsets = ad_index.get(key, ())
+	i = bisect_left(offsets, start)
+	return offsets[i] if i < len(offsets) else -1
+
+
+def _slice_sections(text: str) -> str:
+	"""Python counterpart of _SECTIONS_TEXT_JS: AD 2.1 (less 200 chars) to AD 2.8 (plus 2000)."""
+	start_match = _SECTIONS_START_RE.search(text)
+	end_match = _SECTIONS_END_RE.search(text)
+	start = start_match.start() if start_match else -1
+	end = end_match.start() if end_match else -1
+	return text[max(0, start - 200):end + 2000 if end > start else len(text)]
+
+
+def _find_ad_heading(upper: str, ad_index: Dict[str, List[int]], heading: str, start: int = 0) -> int:
+	"""Index equivalent of upper.find(heading, start) for a titled heading such as 'AD 2.3 OPERATIONAL HOURS'."""
+	key = ' '.join(heading.split(' ', 2)[:2])
+	offsets = ad_index.get(key, ())
+	for i in range(bisect_left(offsets, start), len(offsets)):
+		if upper.startswith(heading, offsets[i]):
+			return offsets[i]
+	return -1
+
+
+def _rfind_ad(ad_index: Dict[str, List[int]], key: str, end: int) -> int:
+	"""Index equivalent of upper.rfind(key, 0, end)."""
+	offsets = ad_index.get(key, ())
+	i = bisect_right(offsets, end - len(key))
+	return offsets[i - 1] if i else -1
+
 class EstoniaAIPScraperPlaywright:
-	def __init__(self, base_url: str = "https://eaip.eans.ee/2025-10-02/html/index-en-GB.html"):
+	def __init__(self, base_url: str = "https://eaip.eans.ee/2025-10-02/html/index-en-GB.html", profile_dir: str = PROFILE_DIR):
 		self.base_url = base_url
-		# Don't initialize browser in __init__ to avoid threading issues
+		# Chromium locks its profile, so concurrent scrapers need one directory each
+		self.profile_dir = profile_dir
+		# Don't initialize browser in __init__ to avoid threading issues; it is
+		# started by the first lookup and then kept until close()
 		self.playwright = None
+		# Standalone Chromium, only set when the profile was locked and a
+		# throwaway context was used instead
+		self.chromium = None
 		self.browser = None
 		self.page = None
+		self.menu_opened = False
+		# Navigation/content frames of the page at frames_url, looked up once per URL
+		self.frames_url = None
+		self.nav_frame = None
+		self.content_frame = None
+		# Pooled HTTP session for the static airport pages; the browser is only a fallback
+		self.session = requests.Session()
+		self.session.headers.update({
+			'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+			'Accept-Language': 'en-US,en;q=0.5',
+			'User-Agent': USER_AGENT
+		})
 
 	def _setup_browser(self):
 		"""Setup Playwright browser in headless mode (no visible window)."""
 		try:
 			self.playwright = sync_playwright().start()
-			self.browser = self.playwright.chromium.launch(headless=True, args=['--window-size=1600,1000'])
-			self.page = self.browser.new_page()
-			self.page.set_default_timeout(30000)
+			# A persistent context is its own browser; closing it shuts Chromium down
+			os.makedirs(self.profile_dir, exist_ok=True)
+			try:
+				self.browser = self.playwright.chromium.launch_persistent_context(self.profile_dir, headless=True, args=['--window-size=1600,1000'])
+			except Exception as e:
+				# Profile in use by another scraper: run without the disk cache
+				logger.warning(f"Browser profile {self.profile_dir} unavailable, using a fresh context: {e}")
+				self.chromium = self.playwright.chromium.launch(headless=True, args=['--window-size=1600,1000'])
+				self.browser = self.chromium.new_context()
+			self.browser.route("**/*", self._route_request)
+			self.page = self.browser.pages[0] if self.browser.pages else self.browser.new_page()
+			self.page.set_default_timeout(ACTION_TIMEOUT)
+			self.page.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
 			logger.info("Playwright browser initialized for Estonia AIP (headless)")
 		except Exception as e:
 			logger.error(f"Failed to initialize Playwright browser: {e}")
 			raise
 
+	@staticmethod
+	def _route_request(route):
+		"""Abort images, fonts, media and stylesheets; let everything else through."""
+		if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+			route.abort()
+		else:
+			route.continue_()
+
+	def _ensure_session(self):
+		"""Start the browser and open the eAIP menu on first use only."""
+		if self.browser is None:
+			self._setup_browser()
+		if not self.menu_opened:
+			self._open_eaip()
+			self._go_to_part3_ad2()
+			self.menu_opened = True
+
+	def _wait_ready(self, target=None, timeout_ms: int = 10000):
+		"""Poll document.readyState on a page or frame until it is 'complete'.
+
+		Used instead of networkidle, which pages with background requests may
+		never reach and which then stalls for the full default timeout.
+		"""
+		target = target or self.page
+		deadline = time.monotonic() + timeout_ms / 1000
+		while time.monotonic() < deadline:
+			if target.evaluate("document.readyState") == "complete":
+				return
+			self.page.wait_for_timeout(100)
+		logger.info(f"Document not complete after {timeout_ms} ms; continuing")
+
+	def _frames(self):
+		"""Return (navigation frame, content frame) of the current page, rescanning only after a navigation."""
+		if self.frames_url != self.page.url:
+			self.nav_frame = self.content_frame = None
+			for frame in self.page.frames:
+				name = (frame.name or '').lower()
+				if self.nav_frame is None and ('toc' in name or 'nav' in name):
+					self.nav_frame = frame
+				elif self.content_frame is None and 'content' in name:
+					self.content_frame = frame
+			self.frames_url = self.page.url
+		return self.nav_frame, self.content_frame
+
 	def _open_eaip(self):
 		logger.info(f"Opening Estonia eAIP: {self.base_url}")
 		self.page.goto(self.base_url)
-		self.page.wait_for_load_state("networkidle")
+		self._wait_ready()
 
 	def _go_to_part3_ad2(self):
 		"""Navigate left menu: Part 3 Aerodromes → AD 2."""
@@ -44,73 +329,37 @@ class EstoniaAIPScraperPlaywright:
 		
 		try:
 			self.page.goto(frameset_url)
-			self.page.wait_for_load_state("networkidle")
+			self._wait_ready()
 			
 			# Check for frames in the frameset
 			frames = self.page.frames
 			logger.info(f"Found {len(frames)} frames in frameset")
 			
-			for frame in frames:
-				name = frame.name or ''
-				url = frame.url or ''
-				logger.info(f"Frame: name='{name}', url='{url[:100]}'")
+			if logger.isEnabledFor(logging.DEBUG):
+				for frame in frames:
+					logger.debug(f"Frame: name='{frame.name or ''}', url='{(frame.url or '')[:100]}'")
 			
 			# Try to find the navigation frame
-			nav_frame = None
-			for frame in frames:
-				name = frame.name or ''
-				if 'toc' in name.lower() or 'nav' in name.lower() or 'eaisnavigation' in name.lower():
-					nav_frame = frame
-					break
+			nav_frame, _ = self._frames()
 			
 			if nav_frame:
 				logger.info("Found navigation frame in frameset")
 				# Wait for frame content to load
 				try:
-					nav_frame.wait_for_load_state("networkidle")
+					self._wait_ready(nav_frame)
 				except Exception as e:
 					logger.info(f"Frame load state wait failed: {e}")
 				
-				# Debug: Check what's in the navigation frame
-				try:
-					nav_text = nav_frame.text_content('body')
-					logger.info(f"Navigation frame content length: {len(nav_text)}")
-					logger.info(f"Navigation frame preview: {nav_text[:500]}")
-					
-					# Search for Part 3 in the text
-					if 'Part 3' in nav_text:
-						logger.info("Found 'Part 3' in navigation text")
-						# Find the position and show more context
-						pos = nav_text.find('Part 3')
-						logger.info(f"Part 3 context: {nav_text[pos-50:pos+200]}")
-					else:
-						logger.info("'Part 3' not found in navigation text")
-					
-					if 'AERODROMES' in nav_text:
-						logger.info("Found 'AERODROMES' in navigation text")
-						# Find the position and show more context
-						pos = nav_text.find('AERODROMES')
-						logger.info(f"AERODROMES context: {nav_text[pos-100:pos+200]}")
-					else:
-						logger.info("'AERODROMES' not found in navigation text")
-					
-					# Try to find any text containing "3" and "AERODROMES"
-					import re
-					pattern = r'.*3.*AERODROMES.*'
-					matches = re.findall(pattern, nav_text, re.IGNORECASE)
-					if matches:
-						logger.info(f"Found pattern matches: {matches}")
-					else:
-						logger.info("No pattern matches found")
-						
-				except Exception as e:
-					logger.info(f"Could not get navigation frame content: {e}")
+				# Debug: Check what's in the navigation frame. Reading the frame text is a
+				# browser round-trip, so only do it when debug logging is on.
+				if logger.isEnabledFor(logging.DEBUG):
+					self._log_nav_frame_text(nav_frame)
 				
 				# Expand Part 3 Aerodromes - try different selectors
 				try:
 					# Try just "AERODROMES" first
 					part3_link = nav_frame.locator("//a[contains(., 'AERODROMES')]").first
-					part3_link.click()
+					part3_link.click(timeout=LOOKUP_TIMEOUT)
 					logger.info("Opened AERODROMES section")
 				except Exception as e:
 					logger.info(f"Could not click AERODROMES directly: {e}; trying alternative selectors")
@@ -134,114 +383,162 @@ class EstoniaAIPScraperPlaywright:
 			logger.error(f"Failed to navigate to frameset: {e}")
 			raise
 
+	def _log_nav_frame_text(self, nav_frame):
+		"""Debug helper: log where Part 3 / AERODROMES appear in the navigation frame."""
+		try:
+			nav_text = nav_frame.text_content('body')
+			logger.debug(f"Navigation frame content length: {len(nav_text)}")
+			logger.debug(f"Navigation frame preview: {nav_text[:500]}")
+			
+			for marker, before in (('Part 3', 50), ('AERODROMES', 100)):
+				pos = nav_text.find(marker)
+				if pos != -1:
+					logger.debug(f"{marker} context: {nav_text[max(pos - before, 0):pos + 200]}")
+				else:
+					logger.debug(f"'{marker}' not found in navigation text")
+		except Exception as e:
+			logger.debug(f"Could not get navigation frame content: {e}")
+
 	def _open_airport(self, airport_code: str):
 		"""Navigate directly to airport page using the href URL."""
 		airport_code = airport_code.upper().strip()
 		logger.info(f"Navigating directly to airport {airport_code} page")
 		
 		# Construct the direct URL to the airport page
-		# From the href we saw: "../eAIP/EE-AD-2.EETN-en-GB.html#AD-2.EETN"
-		airport_url = f"https://eaip.eans.ee/2025-10-02/html/eAIP/EE-AD-2.{airport_code}-en-GB.html#AD-2.{airport_code}"
+		airport_url = AIRPORT_URL_TEMPLATE.format(code=airport_code)
 		logger.info(f"Direct URL: {airport_url}")
 		
 		try:
 			# Navigate directly to the airport page
 			self.page.goto(airport_url)
-			self.page.wait_for_load_state("networkidle")
+			self._wait_ready()
 			logger.info(f"Successfully navigated to {airport_code} page")
 		except Exception as e:
 			logger.error(f"Failed to navigate to {airport_code} page: {e}")
 			raise Exception(f"Failed to navigate to airport {airport_code} page")
 
+	def _fetch_airport_text(self, airport_code: str) -> Optional[str]:
+		"""
+		Fetch an airport page over HTTP and return its AD 2.1-2.8 text, or None
+		when the page is missing or does not mention the airport.
+		"""
+		url = AIRPORT_URL_TEMPLATE.format(code=airport_code).split('#', 1)[0]
+		try:
+			response = self.session.get(url, timeout=30)
+		except requests.RequestException as e:
+			logger.info(f"HTTP fetch of {airport_code} failed: {e}")
+			return None
+		if response.status_code != 200:
+			logger.info(f"HTTP fetch of {airport_code} returned {response.status_code}")
+			return None
+		# Same text as the browser's body.textContent: text nodes concatenated as-is
+		if HTMLParser is not None:
+			tree = HTMLParser(response.content)
+			text = (tree.body or tree.root).text(separator='')
+		else:
+			soup = BeautifulSoup(response.content, 'html.parser')
+			text = (soup.body or soup).get_text()
+		if airport_code not in text:
+			logger.info(f"HTTP page for {airport_code} does not mention the airport")
+			return None
+		return _slice_sections(text)
+
+	def _airport_text(self, airport_code: str) -> str:
+		"""AD 2.x text of an airport page: over HTTP, or through the browser as a fallback."""
+		text = self._fetch_airport_text(airport_code)
+		if text is not None:
+			logger.info(f"Fetched {airport_code} over HTTP, content length: {len(text)}")
+			return text
+		return self._render_airport_text(airport_code)
+
+	def _render_airport_text(self, airport_code: str) -> str:
+		"""AD 2.x text of an airport page rendered in the browser"""
+		self._ensure_session()
+		self._open_airport(airport_code)
+		return self._extract_sections_text()
+
 	def _extract_sections_text(self) -> str:
 		"""Return visible text of current content page."""
 		# Try to find content frame
-		content_frame = None
-		for frame in self.page.frames:
-			name = frame.name or ''
-			if 'content' in name.lower() or 'eaiscontent' in name.lower():
-				content_frame = frame
-				break
-		
+		_, content_frame = self._frames()
 		if content_frame:
 			logger.info("Using content frame for text extraction")
-			text = content_frame.text_content('body')
+			text = content_frame.evaluate(_SECTIONS_TEXT_JS)
 		else:
 			logger.info("Using main page for text extraction")
-			text = self.page.text_content('body')
+			text = self.page.evaluate(_SECTIONS_TEXT_JS)
 		
 		logger.info(f"Content length: {len(text)}")
-		logger.info(f"Preview: {text[:600]}")
+		logger.debug(f"Preview: {text[:600]}")
 		return text
 
-	def _extract_airport_name(self, text: str, airport_code: str) -> str:
-		"""Extract airport name and code from the AERODROME LOCATION INDICATOR AND NAME section."""
+	def _extract_airport_name(self, text: str, upper: str, ad_index: Dict[str, List[int]], code_upper: str) -> str:
+		"""Extract airport name and code from the AERODROME LOCATION INDICATOR AND NAME section (code already upper-cased)."""
 		try:
 			# Look for the "AERODROME LOCATION INDICATOR AND NAME" section
-			upper = text.upper()
 			start_idx = upper.find('AERODROME LOCATION INDICATOR AND NAME')
 			if start_idx == -1:
-				start_idx = upper.find('AD 2.1')
+				start_idx = _find_ad(ad_index, 'AD 2.1')
 			
 			if start_idx != -1:
 				# Find the end of this section
-				end_idx = upper.find('AD 2.2', start_idx)
+				end_idx = _find_ad(ad_index, 'AD 2.2', start_idx)
 				if end_idx == -1:
-					end_idx = start_idx + 500  # Fallback
+					# Fallback: whichever section heading comes next, else the end of the page
+					end_idx = _find_ad(ad_index, 'AD 2.', start_idx + 1)
+					if end_idx == -1:
+						end_idx = len(text)
 				
 				name_section = text[start_idx:end_idx]
 				
 				# Look for pattern like "EEEI — ÄMARI militaarlennuväli / Military Aerodrome"
 				# or "EETN — LENNART MERI TALLINN"
-				code_upper = airport_code.upper()
-				
 				# Pattern: CODE — NAME (with optional additional info)
 				# Capture everything after the dash until we hit the airport code again
-				name_pattern = rf'{re.escape(code_upper)}\s*[—–-]\s*(.+?)(?=\s*{re.escape(code_upper)})'
-				name_match = re.search(name_pattern, name_section, re.IGNORECASE)
+				name_re, code_tail_re, _ = _name_regexes(code_upper)
+				name_match = name_re.search(name_section)
 				
 				if name_match:
 					airport_name = name_match.group(1).strip()
 					# Clean up the name - remove extra whitespace and common suffixes
-					airport_name = re.sub(r'\s+', ' ', airport_name)
-					airport_name = re.sub(r'\s*(militaarlennuväli|Military Aerodrome|lennuväli|Aerodrome)$', '', airport_name, flags=re.IGNORECASE)
+					airport_name = _collapse_ws(airport_name)
+					airport_name = _NAME_SUFFIX_RE.sub('', airport_name)
 					# Remove any remaining AD 2.2 or similar text
-					airport_name = re.sub(r'\s*AD\s*2\.\d+.*$', '', airport_name, flags=re.IGNORECASE)
+					airport_name = _NAME_AD_TAIL_RE.sub('', airport_name)
 					# Remove any remaining airport code duplicates
-					airport_name = re.sub(rf'\s*{re.escape(code_upper)}.*$', '', airport_name, flags=re.IGNORECASE)
+					airport_name = code_tail_re.sub('', airport_name)
 					# Remove trailing slash and clean up
 					airport_name = airport_name.rstrip(' /').strip()
 					return f"{code_upper} — {airport_name}"
 			
-			# Fallback: try to find any line with the airport code
-			lines = [ln.strip() for ln in text.split('\n') if ln.strip()]
-			code_upper = airport_code.upper()
-			
-			for line in lines[:50]:  # Check first 50 lines
-				if code_upper in line and len(line) <= 150:
+			# Fallback: the first short line near the top of the page with the airport
+			# code, found by one regex over the first 5000 characters
+			line_re = _name_regexes(code_upper)[2]
+			for line_match in line_re.finditer(text, 0, 5000):
+				line = line_match.group(0).strip()
+				if len(line) <= 150:
 					# Look for dash or em dash pattern
 					if '—' in line or '–' in line or '-' in line:
-						return line.strip()
+						return line
 					# If no dash, return the line if it looks like a name
 					elif any(ch.isalpha() for ch in line.replace(code_upper, '')):
-						return line.strip()
+						return line
 			
 			# Final fallback
-			return airport_code.upper()
+			return code_upper
 			
 		except Exception as e:
 			logger.warning(f"Error extracting airport name: {e}")
-			return airport_code.upper()
+			return code_upper
 
-	def _parse_operational_hours(self, text: str) -> List[Dict]:
+	def _parse_operational_hours(self, text: str, upper: str, ad_index: Dict[str, List[int]]) -> List[Dict]:
 		"""Parse operational hours from AD 2.3 - return all fields"""
 		results: List[Dict] = []
-		upper = text.upper()
-		start_idx = upper.find('AD 2.3 OPERATIONAL HOURS')
+		start_idx = _find_ad_heading(upper, ad_index, 'AD 2.3 OPERATIONAL HOURS')
 		if start_idx == -1:
 			start_idx = upper.find('OPERATIONAL HOURS')
 		
-		end_idx = upper.find('AD 2.4') if start_idx != -1 else -1
+		end_idx = _find_ad(ad_index, 'AD 2.4') if start_idx != -1 else -1
 		segment = text[start_idx:end_idx] if start_idx != -1 and end_idx != -1 else text
 		operational_hours_section = segment
 
@@ -252,24 +549,15 @@ class EstoniaAIPScraperPlaywright:
 		ats_found = False
 		
 		# Search for AD Administration
-		ad_admin_patterns = [
-			r'(?:^|\s)AD\s+Administration.*?(H24|NIL)',
-		]
-		for pattern in ad_admin_patterns:
-			match = re.search(pattern, operational_hours_section, re.IGNORECASE | re.DOTALL)
-			if match:
-				hours = "H24" if "H24" in match.group(1).upper() else "NIL"
-				results.append({"day": "AD Administration", "hours": hours})
-				ad_admin_found = True
-				break
+		match = _AD_ADMIN_RE.search(operational_hours_section)
+		if match:
+			hours = "H24" if "H24" in match.group(1).upper() else "NIL"
+			results.append({"day": "AD Administration", "hours": hours})
+			ad_admin_found = True
 		
 		# Search for AD Operator (can have time ranges or H24)
-		ad_operator_patterns = [
-			r'MON-FRI\s*[:\-]\s*(\d{2}[:.]?\d{2})\s*[–\-]\s*(\d{2}[:.]?\d{2})',
-			r'(?:^|\s)AD\s+Operator.*?(H24|NIL)',
-		]
-		for pattern in ad_operator_patterns:
-			match = re.search(pattern, operational_hours_section, re.IGNORECASE | re.DOTALL)
+		for pattern in _AD_OPERATOR_RES:
+			match = pattern.search(operational_hours_section)
 			if match:
 				if len(match.groups()) >= 2 and match.group(1).isdigit():
 					# Time range
@@ -283,8 +571,7 @@ class EstoniaAIPScraperPlaywright:
 				break
 		
 		# Search for Customs and Immigration
-		customs_pattern = r'Customs.*?immigration.*?(H24|NIL|May be requested)'
-		customs_match = re.search(customs_pattern, operational_hours_section, re.IGNORECASE | re.DOTALL)
+		customs_match = _CUSTOMS_RE.search(operational_hours_section)
 		if customs_match:
 			hours_text = customs_match.group(1)
 			if 'May be requested' in hours_text:
@@ -295,8 +582,7 @@ class EstoniaAIPScraperPlaywright:
 			customs_found = True
 		
 		# Search for ATS
-		ats_pattern = r'(?<!Reporting )(?<!MET\s)ATS(?![A-Z]).*?(H24|NIL)'
-		ats_match = re.search(ats_pattern, operational_hours_section, re.IGNORECASE | re.DOTALL)
+		ats_match = _ATS_RE.search(operational_hours_section)
 		if ats_match:
 			hours = "H24" if "H24" in ats_match.group(1).upper() else "NIL"
 			results.append({"day": "ATS", "hours": hours})
@@ -314,11 +600,10 @@ class EstoniaAIPScraperPlaywright:
 		
 		return results
 
-	def _parse_contacts(self, text: str) -> List[Dict]:
+	def _parse_contacts(self, text: str, upper: str, ad_index: Dict[str, List[int]]) -> List[Dict]:
 		contacts: List[Dict] = []
 		
 		# Look specifically for the "AD operator, address, telephone, telefax, e-mail, AFS, URL" section
-		upper = text.upper()
 		start_idx = upper.find('AD OPERATOR, ADDRESS, TELEPHONE, TELEFAX, E-MAIL, AFS, URL')
 		if start_idx == -1:
 			start_idx = upper.find('AD OPERATOR')
@@ -327,29 +612,28 @@ class EstoniaAIPScraperPlaywright:
 			# Find the end of this section (next numbered item or end of AD 2.2)
 			end_idx = upper.find('7TYPES OF TRAFFIC', start_idx)
 			if end_idx == -1:
-				end_idx = upper.find('AD 2.3', start_idx)
+				end_idx = _find_ad(ad_index, 'AD 2.3', start_idx)
+			if end_idx == -1:
+				# Fallback: whichever section heading comes next, else the end of the page
+				end_idx = _find_ad(ad_index, 'AD 2.', start_idx + 1)
 			if end_idx == -1:
-				end_idx = start_idx + 2000  # Fallback: take next 2000 chars
+				end_idx = len(text)
 			
 			ad_operator_section = text[start_idx:end_idx]
 			
-			# Extract phone numbers specifically from this section
+			# Only three contacts are built, so stop scanning once three usable
+			# phone numbers (and three emails to pair with them) have been found
 			# Pattern for Estonian phone numbers: +372 followed by digits
-			phone_regex = r'(\+372[0-9\s]+)'
-			phones = re.findall(phone_regex, ad_operator_section)
+			phones = (m.group(1).strip() for m in _PHONE_RE.finditer(ad_operator_section))
 			
 			# Clean up phone numbers - remove extra spaces and limit length
-			phones = [re.sub(r'\s+', ' ', p.strip()) for p in phones if len(p.strip()) <= 20]
-			
-			# Extract emails from this section
-			email_regex = r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
-			emails = re.findall(email_regex, ad_operator_section)
+			phones = list(islice((_collapse_ws(p) for p in phones if len(p) <= 20), 3))
 			
-			# Clean up emails - remove any concatenated text after the email
-			emails = [re.sub(r'[A-Z]{2,}.*$', '', email) for email in emails]
+			# Extract emails from this section, removing any concatenated text after the email
+			emails = list(islice((_EMAIL_TAIL_RE.sub('', m.group(1)) for m in _EMAIL_RE.finditer(ad_operator_section)), 3))
 			
 			# Create contacts from the AD operator section
-			for i, phone in enumerate(phones[:3]):  # Limit to 3 phone numbers
+			for i, phone in enumerate(phones):
 				contacts.append({
 					"type": f"AD Operator Contact {i+1}",
 					"phone": phone.strip(),
@@ -370,57 +654,24 @@ class EstoniaAIPScraperPlaywright:
 		
 		return contacts
 	
-	def _extract_fire_fighting_category(self, text: str) -> str:
-		"""Extract AD Category for fire fighting from AD 2.6 section"""
-		try:
-			upper = text.upper()
-			start_idx = upper.find('AD 2.6')
-			if start_idx == -1:
-				start_idx = upper.find('RESCUE AND FIRE FIGHTING')
-			
-			if start_idx != -1:
-				end_idx = upper.find('AD 2.7', start_idx)
-				if end_idx == -1:
-					end_idx = start_idx + 2000
-				
-				fire_section = text[start_idx:end_idx]
-				
-				# Look for AD Category
-				category_patterns = [
-					r'AD\s+CATEGORY[:\s]+([0-9])',
-					r'Category[:\s]+([0-9])',
-					r'Category\s+([0-9])[:\s]+for',
-				]
-				
-				for pattern in category_patterns:
-					match = re.search(pattern, fire_section, re.IGNORECASE)
-					if match:
-						return match.group(1)
-			
-			return "Not specified"
-		except Exception as e:
-			logger.warning(f"Error extracting fire fighting category: {e}")
-			return "Not specified"
-	
-	def _extract_remarks(self, text: str) -> str:
+	def _extract_remarks(self, text: str, upper: str, ad_index: Dict[str, List[int]]) -> str:
 		"""Extract Remarks from text - must be in AD 2.3 section before OPERATIONAL HOURS"""
 		try:
-			upper = text.upper()
 			# Look for AD 2. section that has "Remarks:"
-			ad23_idx = upper.find('AD 2.3')
+			ad23_idx = _find_ad(ad_index, 'AD 2.3')
 			
 			if ad23_idx != -1:
 				# Look BEFORE AD 2.3 for remarks in AD 2.2 or early in AD 2.3
-				ad22_idx = upper.rfind('AD 2.2', 0, ad23_idx)
+				ad22_idx = _rfind_ad(ad_index, 'AD 2.2', ad23_idx)
 				if ad22_idx != -1:
 					# Search in AD 2.2 section
 					remarks_idx = upper.find('REMARKS', ad22_idx, ad23_idx)
 					if remarks_idx != -1:
 						end_idx = min(ad23_idx, remarks_idx + 500)
 						remarks_text = text[remarks_idx:end_idx]
-						remarks_text = re.sub(r'^REMARKS[:\s]*', '', remarks_text, flags=re.IGNORECASE)
-						remarks_text = re.sub(r'AD\s+2\.3.*$', '', remarks_text, flags=re.IGNORECASE | re.DOTALL)
-						remarks_text = re.sub(r'\s+', ' ', remarks_text.strip())
+						remarks_text = _REMARKS_HEAD_RE.sub('', remarks_text)
+						remarks_text = _AD23_TAIL_RE.sub('', remarks_text)
+						remarks_text = _collapse_ws(remarks_text)
 						if len(remarks_text) > 5:  # Not just "NIL" or empty
 							return remarks_text[:200]
 			
@@ -429,72 +680,112 @@ class EstoniaAIPScraperPlaywright:
 			logger.warning(f"Error extracting remarks: {e}")
 			return "NIL"
 	
-	def _extract_traffic_types(self, text: str) -> str:
-		"""Extract Types of traffic permitted from AD 2.2 section"""
-		try:
-			upper = text.upper()
-			start_idx = upper.find('AD 2.2')
-			if start_idx == -1:
-				start_idx = upper.find('AERODROME GEOGRAPHICAL')
-			
-			if start_idx != -1:
-				end_idx = upper.find('AD 2.3', start_idx)
-				if end_idx == -1:
-					end_idx = start_idx + 2000
-				
-				traffic_section = text[start_idx:end_idx]
-				
-				# Look for traffic type
-				traffic_patterns = [
-					r'Types?\s+of\s+traffic.*?(IFR[/, ]VFR|VFR[/, ]IFR|IFR|VFR)',
-					r'Traffic.*?(IFR[/, ]VFR|VFR[/, ]IFR|IFR|VFR)',
-					r'(IFR/VFR|VFR/IFR)',
-				]
-				
-				for pattern in traffic_patterns:
-					match = re.search(pattern, traffic_section, re.IGNORECASE)
-					if match:
-						return match.group(1)
+	def _extract_section_field(self, text: str, upper: str, ad_index: Dict[str, List[int]], heading: str, fallback_heading: str, next_heading: str, patterns) -> str:
+		"""Return the first pattern hit inside the section from heading up to next_heading."""
+		start_idx = _find_ad(ad_index, heading)
+		if start_idx == -1:
+			start_idx = upper.find(fallback_heading)
+		
+		if start_idx != -1:
+			end_idx = _find_ad(ad_index, next_heading, start_idx)
+			if end_idx == -1:
+				end_idx = _find_ad(ad_index, 'AD 2.', start_idx + 1)
+			if end_idx == -1:
+				end_idx = len(text)
 			
-			return "Not specified"
-		except Exception as e:
-			logger.warning(f"Error extracting traffic types: {e}")
-			return "Not specified"
+			# Slice the section once and run its patterns back to back
+			section = text[start_idx:end_idx]
+			for pattern in patterns:
+				match = pattern.search(section)
+				if match:
+					return match.group(1)
+		
+		return "Not specified"
 
 	def get_airport_info(self, airport_code: str) -> Dict:
-		# Setup browser for this request to avoid threading issues
-		self._setup_browser()
-		try:
-			self._open_eaip()
-			self._go_to_part3_ad2()
-			self._open_airport(airport_code)
-			text = self._extract_sections_text()
-			
-			# Extract operational hours from AD 2.3
-			operational_hours = self._parse_operational_hours(text)
-			
-			# Build fixed structure
-			info = {
-				"airportCode": airport_code.upper(),
-				"airportName": self._extract_airport_name(text, airport_code),
-				"contacts": self._parse_contacts(text),
-				# AD 2.3 OPERATIONAL HOURS section
-				"adAdministration": self._get_field_value(operational_hours, "AD Administration"),
-				"adOperator": self._get_field_value(operational_hours, "AD Operator"),
-				"customsAndImmigration": self._get_field_value(operational_hours, "Customs and immigration"),
-				"ats": self._get_field_value(operational_hours, "ATS"),
-				"operationalRemarks": self._extract_remarks(text),
-				# AD 2.2 AERODROME GEOGRAPHICAL AND ADMINISTRATIVE DATA
-				"trafficTypes": self._extract_traffic_types(text),
-				"administrativeRemarks": self._extract_administrative_remarks(text),
-				# AD 2.6 RESCUE AND FIREFIGHTING SERVICES
-				"fireFightingCategory": self._extract_fire_fighting_category(text),
-			}
-			logger.info(f"Extracted data for {airport_code}")
-			return info
-		finally:
-			# Clean up browser after each request
-			self.close()
+		"""
+		Get airport information for one airport.
+
+		The page is fetched over HTTP; the browser is only started when that
+		fails, and is then reused across calls from the same thread. Use the
+		scraper as a context manager (or call close()) to shut it down.
+		"""
+		airport_code = airport_code.upper().strip()
+		info = self._build_airport_info(airport_code, self._airport_text(airport_code))
+		logger.info(f"Extracted data for {airport_code}")
+		return info
+
+	def get_airports_info(self, airport_codes: List[str], max_workers: int = 8) -> Dict[str, Dict]:
+		"""
+		Get airport information for several airports in one browser session.
+
+		Pages are fetched over a pooled HTTP session by a small thread pool, so
+		the next downloads are in flight while the current page is parsed; if
+		one has to fall back to the browser, it is started and the eAIP menu
+		opened once for the batch. A failing airport is reported as
+		{'airportCode': ..., 'error': ...} without stopping the batch.
+		"""
+		codes = [code.upper().strip() for code in airport_codes]
+		results: Dict[str, Dict] = {}
+
+		def fetch(code: str) -> Optional[str]:
+			# executor.map re-raises in the loop below, outside the per-airport
+			# handling, so a failed fetch becomes a browser fallback here
+			try:
+				return self._fetch_airport_text(code)
+			except Exception as e:
+				logger.warning(f"HTTP fetch of {code} failed: {e}")
+				return None
+
+		with ThreadPoolExecutor(max_workers=max(min(max_workers, len(codes)), 1)) as executor:
+			fetched = executor.map(fetch, codes)
+			for code, text in zip(codes, fetched):
+				try:
+					if text is None:
+						text = self._render_airport_text(code)
+					else:
+						logger.info(f"Fetched {code} over HTTP, content length: {len(text)}")
+					results[code] = self._build_airport_info(code, text)
+					logger.info(f"Extracted data for {code}")
+				except Exception as e:
+					logger.error(f"Error fetching airport information for {code}: {e}")
+					results[code] = {'airportCode': code, 'error': f"Failed to fetch airport information: {str(e)}"}
+		return results
+
+	def _build_airport_info(self, airport_code: str, text: str) -> Dict:
+		"""Run the AD 2.x extractors over an airport page's text; airport_code is upper-cased by the callers."""
+		# Upper-cased and indexed once; every extractor locates its section from these
+		upper = text.upper()
+		ad_index = _build_ad_index(upper)
+		
+		# Extract operational hours from AD 2.3
+		operational_hours = self._parse_operational_hours(text, upper, ad_index)
+		
+		# Build fixed structure
+		info = {
+			"airportCode": airport_code,
+			"airportName": self._extract_airport_name(text, upper, ad_index, airport_code),
+			"contacts": self._parse_contacts(text, upper, ad_index),
+			# AD 2.3 OPERATIONAL HOURS section
+			"adAdministration": self._get_field_value(operational_hours, "AD Administration"),
+			"adOperator": self._get_field_value(operational_hours, "AD Operator"),
+			"customsAndImmigration": self._get_field_value(operational_hours, "Customs and immigration"),
+			"ats": self._get_field_value(operational_hours, "ATS"),
+			"operationalRemarks": self._extract_remarks(text, upper, ad_index),
+			# AD 2.2 AERODROME GEOGRAPHICAL AND ADMINISTRATIVE DATA
+			"trafficTypes": "Not specified",
+			"administrativeRemarks": self._extract_administrative_remarks(text, upper, ad_index),
+			# AD 2.6 RESCUE AND FIREFIGHTING SERVICES
+			"fireFightingCategory": "Not specified",
+		}
+		
+		# Pattern-list fields, one slice per section
+		for field, heading, fallback_heading, next_heading, patterns in _SECTION_FIELDS:
+			try:
+				info[field] = self._extract_section_field(text, upper, ad_index, heading, fallback_heading, next_heading, patterns)
+			except Exception as e:
+				logger.warning(f"Error extracting {field}: {e}")
+		return info
 	
 	def _get_field_value(self, operational_hours: List[Dict], field_name: str) -> str:
 		"""Get value for a specific field from operational hours"""
@@ -504,29 +795,30 @@ class EstoniaAIPScraperPlaywright:
 				return hour.get("hours", "NIL")
 		return "NIL"
 	
-	def _extract_administrative_remarks(self, text: str) -> str:
+	def _extract_administrative_remarks(self, text: str, upper: str, ad_index: Dict[str, List[int]]) -> str:
 		"""Extract Remarks from AD 2.2 section"""
 		try:
-			upper = text.upper()
-			ad22_start = upper.find('AD 2.2')
+			ad22_start = _find_ad(ad_index, 'AD 2.2')
 			if ad22_start == -1:
 				return "NIL"
 			
-			ad23_start = upper.find('AD 2.3', ad22_start)
+			ad23_start = _find_ad(ad_index, 'AD 2.3', ad22_start)
 			if ad23_start == -1:
-				ad23_start = ad22_start + 3000
+				ad23_start = _find_ad(ad_index, 'AD 2.', ad22_start + 1)
+			if ad23_start == -1:
+				ad23_start = len(text)
 			
 			remarks_idx = upper.find('REMARKS', ad22_start, ad23_start)
 			if remarks_idx != -1:
 				remarks_text = text[remarks_idx:min(ad23_start, remarks_idx + 1000)]
-				remarks_text = re.sub(r'^REMARKS[:\s]*', '', remarks_text, flags=re.IGNORECASE)
+				remarks_text = _REMARKS_HEAD_RE.sub('', remarks_text)
 				# Stop at next AD 2.X section
-				next_ad = re.search(r'\w+\s+AD\s+2\.\d+', remarks_text, re.IGNORECASE)
+				next_ad = _NEXT_AD_RE.search(remarks_text)
 				if next_ad:
 					remarks_text = remarks_text[:next_ad.start()]
-				remarks_text = re.sub(r'©.*$', '', remarks_text, flags=re.DOTALL)
-				remarks_text = re.sub(r'AIP\s+\w+\s+AIRAC.*$', '', remarks_text, flags=re.IGNORECASE | re.DOTALL)
-				remarks_text = re.sub(r'\s+', ' ', remarks_text.strip())
+				remarks_text = _COPYRIGHT_TAIL_RE.sub('', remarks_text)
+				remarks_text = _AIRAC_TAIL_RE.sub('', remarks_text)
+				remarks_text = _collapse_ws(remarks_text)
 				if len(remarks_text) > 5:
 					return remarks_text[:200]
 			return "NIL"
@@ -535,12 +827,65 @@ class EstoniaAIPScraperPlaywright:
 			return "NIL"
 
 	def close(self):
+		self.session.close()
 		if self.browser:
 			self.browser.close()
+		if self.chromium:
+			self.chromium.close()
 		if self.playwright:
 			self.playwright.stop()
+		self.playwright = None
+		self.chromium = None
+		self.browser = None
+		self.page = None
+		self.menu_opened = False
+		self.frames_url = None
+		self.nav_frame = None
+		self.content_frame = None
 		logger.info("Playwright browser closed")
 
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		self.close()
+
+
+def scrape_airports(airport_codes: List[str], max_workers: int = 4) -> Dict[str, Dict]:
+	"""
+	Scrape several airports in parallel, one browser per worker thread.
+
+	Playwright's sync API is bound to the thread that started it, so the codes
+	are dealt out round-robin and each worker runs a batch in its own scraper
+	(with its own profile directory), opening the eAIP menu once and closing
+	the browser from the same thread.
+
+	Args:
+		airport_codes: Airport codes (e.g., ['EETN', 'EETU'])
+		max_workers: Number of concurrent browsers
+
+	Returns:
+		Dictionary mapping airport code to its information (or {'error': ...})
+	"""
+	codes = [code.upper().strip() for code in airport_codes]
+	batches = [codes[i::max_workers] for i in range(min(max_workers, len(codes)))]
+
+	def scrape(worker: int) -> Dict[str, Dict]:
+		batch = batches[worker]
+		try:
+			with EstoniaAIPScraperPlaywright(profile_dir=f"{PROFILE_DIR}-{worker}") as scraper:
+				return scraper.get_airports_info(batch)
+		except Exception as e:
+			logger.error(f"Error scraping {', '.join(batch)}: {e}")
+			return {code: {'airportCode': code, 'error': str(e)} for code in batch}
+
+	results: Dict[str, Dict] = {}
+	with ThreadPoolExecutor(max_workers=max(len(batches), 1)) as executor:
+		for batch_results in executor.map(scrape, range(len(batches))):
+			results.update(batch_results)
+	# Report in the order the codes were asked for
+	return {code: results[code] for code in codes}
+
 
 def main():
 	scraper = EstoniaAIPScraperPlaywright()
@@ -4,22 +4,224 @@ Finland AIP scraper using Playwright for better JavaScript handling
 Handles the Finnish AIP structure with table-based effective day links
 """
 
+import os
+import json
 import time
 import re
+import html
 import logging
-from typing import Dict, List, Optional
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright, Browser, Page
 
+# Lexbor-backed parser is much faster than html.parser on large AIP pages; optional
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+EFFECTIVE_DAY_URL = "https://www.ais.fi/eaip/005-2025_2025_10_02/index.html"
+AIP_BASE_URL = "https://www.ais.fi/eaip/005-2025_2025_10_02/eAIP/"
+# Resolved airport URLs are persisted between runs; an AIRAC cycle lasts 28 days
+URL_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'clearway', 'finland_airport_urls.json')
+URL_CACHE_TTL = 25 * 24 * 3600
+# Resources that never affect the extracted text
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+_AIRPORT_CODE_RE = re.compile(r'EF[A-Z]{2}')
+# Returns the href of the navigation link for an airport code, preferring eAIP links
+_FIND_AIRPORT_HREF_JS = """(code) => {
+    const hrefs = Array.from(document.querySelectorAll('a[href]'), a => a.getAttribute('href'))
+        .filter(href => href.includes(code));
+    return hrefs.find(href => href.includes('eAIP')) || hrefs[0] || null;
+}"""
+# Body text as textContent concatenates it, minus script/style contents. innerText
+# would be smaller still, but its layout line breaks split the numbered table rows
+# ("2Customs and immigration") the extractors match on.
+_BODY_TEXT_JS = """() => {
+    if (!document.body) return '';
+    const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT, {
+        acceptNode: node => /^(SCRIPT|STYLE|NOSCRIPT)$/.test(node.parentNode.nodeName)
+            ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_ACCEPT
+    });
+    const parts = [];
+    while (walker.nextNode()) parts.push(walker.currentNode.nodeValue);
+    return parts.join('');
+}"""
+# Link hrefs containing "EF", i.e. what a[href*="EF"] selects, read straight from frame HTML
+_EF_HREF_RE = re.compile(r'(?i:<a\b[^>]*?\bhref\s*=\s*)(["\'])([^"\']*EF[^"\']*)\1')
+_AD22_END_MARKERS = ('AD 2.3 TOIMINTA-AJAT', 'AD 2.3 OPERATIONAL HOURS', 'AD 2.4')
+_AD_HEADING_RE = re.compile(r'AD 2\.(\d+)', re.ASCII)
+_DAY_TOKENS = ('MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT', 'SUN')
+_TIME_TBL = str.maketrans('.', ':')
+# Keyed by the upper-cased token: IGNORECASE also matches Unicode case variants
+# such as 'ſat', whose upper() is 'SAT' but whose lower() is no day name
+_DAY_CANON = {day: day for day in _DAY_TOKENS}
+_DAY_ALT = '(' + '|'.join(_DAY_TOKENS) + ')'
+_DAY_TIME_RE = re.compile(_DAY_ALT + r'(?:[-–]' + _DAY_ALT + r')?\s*[:\-]?\s*(\d{2}[:.]?\d{2})\s*[-–]\s*(\d{2}[:.]?\d{2})', re.IGNORECASE)
+_H24_RE = r'(H24|24H|24\s*HR)'
+_ROW_BREAK_RE = re.compile(r'^\d{1,2}\s')
+
+# Bilingual captions of the AD 2.3 rows, compiled once for the comprehensive service scan
+_SERVICE_SYNONYMS = tuple(
+    (caption, tuple(re.compile(pat, re.IGNORECASE) for pat in patterns))
+    for caption, patterns in (
+        ("Aerodrome operator", (r"^Lentopaikan\s+pitäjä", r"^Aerodrome\s+operator", r"^AD\s+operator")),
+        ("Customs and immigration", (r"^CUST,?\s*IMG", r"^Customs\s+and\s+immigration")),
+        ("Health and sanitation", (r"^Terveystarkastus", r"^Health\s+and\s+sanitation")),
+        ("AIS", (r"^AIS\s*$", r"^AIS\b")),
+        ("AIS Briefing Office", (r"^AIS\s+Briefing\s+Office",)),
+        ("ATS Reporting Office (ARO)", (r"^ARO\b", r"^ATS\s+Reporting\s+Office")),
+        ("MET", (r"^MET\s*$", r"^MET\b")),
+        ("MET Briefing Office", (r"^MET\s+Briefing\s+Office",)),
+        ("ATS", (r"^ATS\s*$", r"^ATS\b")),
+        ("Fuelling", (r"^Polttoaineiden\s+jakelu", r"^Tankkauspyynnöt", r"^Fuelling", r"^Refuelling\s+requests")),
+        ("Handling", (r"^Tavaran\s+käsittely", r"^Handling")),
+        ("Security", (r"^Turvatarkastus", r"^Security")),
+        ("De-icing", (r"^Jäänpoisto", r"^De-icing")),
+        ("RMK", (r"^RMK\b",)),
+    )
+)
+
+# Line-by-line fallback: (service caption pattern, hours pattern)
+_SERVICE_PATTERNS = tuple(
+    (re.compile(service), re.compile(hours, re.IGNORECASE))
+    for service, hours in (
+        (r'AD\s+operator[:\s]*', _DAY_TIME_RE.pattern),
+        (r'AD\s+Operational\s+hours[:\s]*', _H24_RE),
+        (r'Customs\s+and\s+immigration[:\s]*', _H24_RE),
+        (r'Health\s+and\s+sanitation[:\s]*', _H24_RE),
+        (r'AIS\s+Briefing\s+Office[:\s]*', _H24_RE),
+        (r'ATS\s+Reporting\s+Office[:\s]*', _H24_RE),
+        (r'MET\s+Briefing\s+Office[:\s]*', r'(H24|24H|24\s*HR|NIL)'),
+        (r'ATS[:\s]*', _H24_RE),
+        (r'Fuelling[:\s]*', _H24_RE),
+        (r'Handling[:\s]*', _H24_RE),
+        (r'Security[:\s]*', _H24_RE),
+        (r'De-icing[:\s]*', _H24_RE),
+    )
+)
+
+# Numbered rows of the AD 2.3 operational hours line: (caption, pattern, values reported)
+# Plain ASCII captions, so re.ASCII keeps the case-insensitive literal matching cheap
+_FI_SERVICES = (
+    ("Customs and immigration", re.compile(r'2Customs and immigration.*?(H24|NIL|May be requested)', re.IGNORECASE | re.ASCII), ("On request", "H24", "NIL")),
+    ("Health and sanitation", re.compile(r'3Health and sanitation.*?(H24|NIL)', re.IGNORECASE | re.ASCII), ("H24",)),
+    ("AIS Briefing Office", re.compile(r'4AIS Briefing Office.*?(H24|NIL)', re.IGNORECASE | re.ASCII), ("H24",)),
+    ("ATS Reporting Office (ARO)", re.compile(r'5ATS Reporting Office \(ARO\).*?(H24|NIL)', re.IGNORECASE | re.ASCII), ("NIL", "H24")),
+    ("MET Briefing Office", re.compile(r'6MET Briefing Office.*?(H24|NIL)', re.IGNORECASE | re.ASCII), ("H24",)),
+    ("ATS", re.compile(r'7ATS.*?(H24|NIL)', re.IGNORECASE | re.ASCII), ("H24",)),
+    ("Fuelling", re.compile(r'8Fuelling.*?(H24|NIL)', re.IGNORECASE | re.ASCII), ("H24",)),
+    ("Handling", re.compile(r'9Handling.*?(H24|NIL)', re.IGNORECASE | re.ASCII), ("H24",)),
+    ("Security", re.compile(r'10Security.*?(H24|NIL)', re.IGNORECASE | re.ASCII), ("H24",)),
+    ("De-icing", re.compile(r'11De-icing.*?(H24|NIL)', re.IGNORECASE | re.ASCII), ("H24",)),
+)
+
+_NAME_SUFFIX_RE = re.compile(r'\s*(lentokenttä|Airport|Aerodrome)$', re.IGNORECASE)
+_NAME_AD_TAIL_RE = re.compile(r'\s*AD\s*2\.\d+.*$', re.IGNORECASE)
+
+# Comprehensive service scan: hours found in a row's window of lines
+_TWR_RE = re.compile(r"TWR\s*:\s*(H24|24H)", re.IGNORECASE)
+_NIL_WORD_RE = re.compile(r"\bNIL\b", re.IGNORECASE)
+_H24_WORD_RE = re.compile(r"\b(H24|24H|24\s*HR)\b", re.IGNORECASE)
+
+# AD operator day ranges on the structured operational hours line
+_OPERATOR_HOURS = (
+    ("AD Operator Hours (MON-FRI)", re.compile(r'MON-FRI\s*:\s*(\d{2}[:.]?\d{2})\s*[-–]\s*(\d{2}[:.]?\d{2})', re.IGNORECASE)),
+    ("AD Operator Hours (MON-THU)", re.compile(r'MON-THU:\s*(\d{2}[:.]?\d{2})\s*[-–]\s*(\d{2}[:.]?\d{2})', re.IGNORECASE)),
+    ("AD Operator Hours (FRI)", re.compile(r'FRI:\s*(\d{2}[:.]?\d{2})\s*[-–]\s*(\d{2}[:.]?\d{2})', re.IGNORECASE)),
+)
+
+# AD 2.2 contacts: Finnish phone numbers, emails and operator organisations
+_PHONE_RES = (
+    re.compile(r'(\+358[0-9\s\-]+)'),
+    re.compile(r'(\+358\s*\d{2,3}\s*\d{3,4}\s*\d{3,4})'),
+)
+_EMAIL_RE = re.compile(r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})')
+_EMAIL_TAIL_RE = re.compile(r'[A-Z]{2,}.*$')
+_ORG_RE = re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Oyj|Oy|Ltd|Ltd\.|Inc\.?|Corp\.?|Corporation))')
+
+
+def _collapse_ws(s: str) -> str:
+    """Collapse whitespace runs to single spaces and trim the ends, without the regex engine"""
+    return ' '.join(s.split())
+
+
+def _first_unique(values, limit: int) -> List[str]:
+    """The first `limit` distinct values in order; the rest of the iterable is never consumed"""
+    found: Dict[str, None] = {}
+    for value in values:
+        if value not in found:
+            found[value] = None
+            if len(found) == limit:
+                break
+    return list(found)
+
+
+def _build_ad_index(upper: str) -> Dict[str, List[int]]:
+    """
+    Offsets of every 'AD 2.x' heading in the upper-cased page, found in one scan.
+    Keys follow str.find semantics, so 'AD 2.21' is listed under 'AD 2.2' as well;
+    'AD 2.' lists every heading, for finding whichever one comes next.
+    """
+    index: Dict[str, List[int]] = {}
+    for match in _AD_HEADING_RE.finditer(upper):
+        index.setdefault('AD 2.', []).append(match.start())
+        number = match.group(1)
+        for i in range(1, len(number) + 1):
+            index.setdefault(f'AD 2.{number[:i]}', []).append(match.start())
+    return index
+
+
+def _find_ad(upper: str, ad_index: Dict[str, List[int]], heading: str, start: int = 0) -> int:
+    """
+    Index equivalent of upper.find(heading, start) for a heading starting 'AD 2.x':
+    only the indexed offsets of that 'AD 2.x' are checked, not the whole page.
+    """
+    key = ' '.join(heading.split(' ', 2)[:2])
+    offsets = ad_index.get(key, ())
+    for i in range(bisect_left(offsets, start), len(offsets)):
+        if key == heading or upper.startswith(heading, offsets[i]):
+            return offsets[i]
+    return -1
+
+
+@lru_cache(maxsize=256)
+def _name_regexes(code: str) -> Tuple[re.Pattern, re.Pattern, re.Pattern]:
+    """Per-airport name patterns: 'CODE — NAME' up to the next CODE, a trailing CODE, and a line holding CODE"""
+    escaped = re.escape(code)
+    return (
+        re.compile(rf'{escaped}\s*[—–-]\s*(.+?)(?=\s*{escaped})', re.IGNORECASE),
+        re.compile(rf'\s*{escaped}.*$', re.IGNORECASE),
+        re.compile(rf'^[^\n]*{escaped}[^\n]*$', re.MULTILINE),
+    )
+
 class FinlandAIPScraperPlaywright:
     def __init__(self):
         """Initialize the Finland AIP scraper with Playwright"""
         self.browser = None
         self.page = None
         self.playwright = None
+        self.airport_urls: Dict[str, str] = {}
+        # Pooled HTTP session for static AIP pages (keep-alive across batch requests).
+        # requests' default Accept-Encoding already advertises br when brotli is installed.
+        self.session = requests.Session()
+        self.session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=16))
+        self.session.headers.update({
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'User-Agent': USER_AGENT
+        })
         self.setup_browser()
     
     def setup_browser(self):
@@ -58,6 +260,8 @@ class FinlandAIPScraperPlaywright:
         
         # Create new page with JavaScript enabled
         self.page = self.browser.new_page()
+        # Scripts still run (the navigation frame needs them); only page assets are dropped
+        self.page.route("**/*", self._route_request)
         
         # Set realistic headers to avoid detection
         self.page.set_extra_http_headers({
@@ -67,7 +271,7 @@ class FinlandAIPScraperPlaywright:
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            'User-Agent': USER_AGENT
         })
         
         # Enable JavaScript explicitly
@@ -90,34 +294,47 @@ class FinlandAIPScraperPlaywright:
         
         logger.info("Playwright browser initialized for Finland AIP with anti-detection measures")
     
+    @staticmethod
+    def _route_request(route):
+        """Abort images, fonts, media and stylesheets; let everything else through."""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+    
     def _discover_airports(self) -> List[str]:
         """Discover all available airports from the navigation menu"""
         try:
             logger.info("Discovering airports from navigation menu...")
             
             # Navigate to the effective day page
-            effective_day_url = "https://www.ais.fi/eaip/005-2025_2025_10_02/index.html"
+            effective_day_url = EFFECTIVE_DAY_URL
             logger.info(f"Navigating to effective day page: {effective_day_url}")
-            self.page.goto(effective_day_url, wait_until="networkidle")
+            self.page.goto(effective_day_url, wait_until="load")
             
-            # Wait for the page to load
-            self.page.wait_for_timeout(3000)
+            # The load event covers the frameset; wait for the navigation div itself
+            # rather than a fixed delay, in case script fills it in afterwards
+            try:
+                self.page.wait_for_selector("frame[name='eAISNavigation']", state="attached", timeout=10000)
+                self.page.frame(name='eAISNavigation').wait_for_selector("#eAISNav", state="attached", timeout=10000)
+            except Exception as e:
+                logger.info(f"Navigation div not seen yet, probing frames anyway: {e}")
             
             # Get all frames
             frames = self.page.frames
             logger.info(f"Found {len(frames)} frames on the effective day page")
             
-            # Check all frames for the navigation div
+            # The navigation div lives in the eAISNavigation frame; look it up by name
+            # and only probe the other frames if the frameset is laid out differently
             nav_frame = None
-            nav_div = None
+            named_frame = self.page.frame(name='eAISNavigation')
+            candidates = [named_frame] if named_frame else frames
             
-            for frame in frames:
+            for frame in candidates:
                 try:
                     # Check if this frame has the navigation div
-                    nav_div_check = frame.query_selector('#eAISNav')
-                    if nav_div_check:
+                    if frame.evaluate("() => !!document.getElementById('eAISNav')"):
                         nav_frame = frame
-                        nav_div = nav_div_check
                         logger.info(f"Found navigation div in frame: {frame.name}")
                         break
                 except Exception as e:
@@ -125,77 +342,47 @@ class FinlandAIPScraperPlaywright:
                     continue
             
             # If navigation div found, use it to extract airports
-            if nav_div and nav_frame:
+            if nav_frame:
                 logger.info("Found navigation div with airport links")
                 
-                # Extract all airport links from the navigation div
-                airport_links = nav_frame.query_selector_all('#eAISNav a[href*="EF"]')
-                logger.info(f"Found {len(airport_links)} airport links in navigation")
-                
-                airports = []
-                for link in airport_links:
-                    try:
-                        href = link.get_attribute('href')
-                        if href and 'EF' in href:
-                            # Extract airport code from href - handle multiple formats:
-                            # - Simple: "EFHK.html" -> "EFHK"
-                            # - Complex: "EF-AD%202%20EFHK%20-%20HELSINKI-VANTAA%201-fi-FI.html" -> "EFHK"
-                            # - With path: "eAIP/EF-AD%202%20EFHK..." -> "EFHK"
-                            
-                            # Try to find EF followed by 2 letters (airport code pattern)
-                            match = re.search(r'EF[A-Z]{2}', href.upper())
-                            if match:
-                                airport_code = match.group(0)
-                                if len(airport_code) == 4:
-                                    airports.append(airport_code)
-                    except Exception as e:
-                        logger.debug(f"Error extracting airport from link: {e}")
-                        continue
+                # Scan the frame HTML once instead of a get_attribute round-trip per link.
+                # Hrefs come in several formats, all carrying the EFxx code:
+                # - Simple: "EFHK.html"
+                # - Complex: "EF-AD%202%20EFHK%20-%20HELSINKI-VANTAA%201-fi-FI.html"
+                # - With path: "eAIP/EF-AD%202%20EFHK..."
+                airport_hrefs = self._airport_hrefs(nav_frame.content())
+                logger.info(f"Found {len(airport_hrefs)} airport links in navigation")
+                airports = self._codes_from_hrefs(airport_hrefs)
                 
                 if airports:
-                    airports = sorted(list(set(airports)))
                     logger.info(f"Discovered {len(airports)} airports from navigation: {airports[:10]}...")
                     return airports
             
             # Fallback: search for airport links in the content
             logger.info("Navigation div not found, searching for airport links in content...")
             
-            # Find content frame for fallback
-            content_frame = None
+            # Find content frame for fallback. Frame sizes are measured in the browser
+            # so that only the chosen frame's HTML is serialized back.
+            content_html = None
             for frame in frames:
                 try:
-                    frame_text = frame.content()
-                    if len(frame_text) > 100000:  # Look for frame with substantial content
-                        content_frame = frame
+                    frame_length = frame.evaluate("() => document.documentElement.outerHTML.length")
+                    if frame_length > 100000:  # Look for frame with substantial content
+                        content_html = frame.content()
                         logger.info(f"Found content frame for fallback: {frame.name}")
                         break
                 except Exception as e:
                     logger.debug(f"Could not get content from frame {frame.name}: {e}")
                     continue
             
-            if not content_frame:
+            if content_html is None:
                 logger.warning("No content frame found, using main page")
-                content_frame = self.page
+                content_html = self.page.content()
             
-            airport_links = content_frame.query_selector_all('a[href*="EF"]')
-            logger.info(f"Found {len(airport_links)} airport links in content")
+            airport_hrefs = self._airport_hrefs(content_html)
+            logger.info(f"Found {len(airport_hrefs)} airport links in content")
             
-            airports = []
-            for link in airport_links[:1000]:  # Limit to first 1000 links for speed
-                try:
-                    href = link.get_attribute('href')
-                    if href and 'EF' in href:
-                        # Extract airport code from href using regex pattern
-                        match = re.search(r'EF[A-Z]{2}', href.upper())
-                        if match:
-                            airport_code = match.group(0)
-                            if len(airport_code) == 4:
-                                airports.append(airport_code)
-                except Exception as e:
-                    logger.debug(f"Error extracting airport from link: {e}")
-                    continue
-            
-            airports = sorted(list(set(airports)))
+            airports = self._codes_from_hrefs(airport_hrefs[:1000])  # Limit to first 1000 links for speed
             logger.info(f"Discovered {len(airports)} airports: {airports[:10]}...")
             return airports
             
@@ -203,10 +390,258 @@ class FinlandAIPScraperPlaywright:
             logger.error(f"Error discovering airports: {e}")
             return []
 
+    @staticmethod
+    def _airport_hrefs(page_html: str) -> List[str]:
+        """Return the unescaped hrefs of all links containing EF in a frame's HTML"""
+        return [html.unescape(m.group(2)) for m in _EF_HREF_RE.finditer(page_html)]
+
+    @staticmethod
+    def _codes_from_hrefs(hrefs: List[str]) -> List[str]:
+        """Extract the sorted, unique EFxx airport codes from link hrefs"""
+        airports = set()
+        for href in hrefs:
+            match = _AIRPORT_CODE_RE.search(href.upper())
+            if match:
+                airports.add(match.group(0))
+        return sorted(airports)
+
     def get_all_airports(self) -> List[str]:
         """Get all available airports"""
         return self._discover_airports()
 
+    def _absolute_aip_url(self, href: str) -> str:
+        """Make an AIP href from the navigation frame absolute"""
+        if href.startswith('http'):
+            return href
+        if href.startswith('/'):
+            return f"https://www.ais.fi{href}"
+        return AIP_BASE_URL + href.lstrip('/')
+
+    def _load_cached_airport_urls(self) -> Dict[str, str]:
+        """Load airport URLs resolved by an earlier run, if still fresh for this effective day"""
+        try:
+            with open(URL_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if cached.get('effective_day_url') != EFFECTIVE_DAY_URL:
+            return {}
+        if time.time() - cached.get('resolved_at', 0) > URL_CACHE_TTL:
+            return {}
+        return cached.get('airport_urls') or {}
+
+    def _save_cached_airport_urls(self, airport_urls: Dict[str, str]) -> None:
+        """Persist resolved airport URLs for later runs"""
+        try:
+            os.makedirs(os.path.dirname(URL_CACHE_FILE), exist_ok=True)
+            with open(URL_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'effective_day_url': EFFECTIVE_DAY_URL,
+                    'resolved_at': time.time(),
+                    'airport_urls': airport_urls
+                }, f)
+        except OSError as e:
+            logger.warning(f"Could not write airport URL cache: {e}")
+
+    def _resolve_airport_urls(self) -> Dict[str, str]:
+        """Map every airport code in the navigation frame to its AIP page URL (resolved once)"""
+        if self.airport_urls:
+            return self.airport_urls
+
+        cached = self._load_cached_airport_urls()
+        if cached:
+            logger.info(f"Using cached AIP URLs for {len(cached)} airports")
+            self.airport_urls = cached
+            return cached
+
+        logger.info(f"Resolving airport AIP URLs from {EFFECTIVE_DAY_URL}")
+        self.page.goto(EFFECTIVE_DAY_URL, wait_until="load")
+        nav_frame = self.page.frame(name='eAISNavigation')
+        if not nav_frame:
+            raise Exception("Could not find eAISNavigation frame")
+
+        airport_urls: Dict[str, str] = {}
+        for href in self._airport_hrefs(nav_frame.content()):
+            match = _AIRPORT_CODE_RE.search(href.upper())
+            if not match:
+                continue
+            # Prefer eAIP page links, same as the single-airport lookup
+            code = match.group(0)
+            if code not in airport_urls or ('eAIP' in href and 'eAIP' not in airport_urls[code]):
+                airport_urls[code] = self._absolute_aip_url(href)
+
+        logger.info(f"Resolved AIP URLs for {len(airport_urls)} airports")
+        self.airport_urls = airport_urls
+        if airport_urls:
+            self._save_cached_airport_urls(airport_urls)
+        return airport_urls
+
+    def _fetch_airport_text(self, url: str) -> str:
+        """Fetch a static AIP page over HTTP and return its body text"""
+        response = self.session.get(url, timeout=30)
+        response.raise_for_status()
+        # Parse the raw bytes: both parsers sniff the charset themselves, which saves
+        # decoding the whole page into a str first.
+        # Same text as Playwright's text_content('body'): text nodes concatenated as-is
+        if HTMLParser is not None:
+            tree = HTMLParser(response.content)
+            return (tree.body or tree.root).text(separator='')
+        soup = BeautifulSoup(response.content, 'html.parser')
+        return (soup.body or soup).get_text()
+
+    def get_airports_info(self, airport_codes: List[str], max_workers: int = 8) -> Dict[str, Dict]:
+        """
+        Get airport information for several airports concurrently
+
+        The navigation frame is read once with Playwright; the AIP pages themselves
+        are static and are fetched in parallel over a pooled HTTP session.
+
+        Args:
+            airport_codes: 4 letter airport codes (e.g., ['EFHK', 'EFTU'])
+            max_workers: Maximum number of concurrent page fetches
+
+        Returns:
+            Dictionary mapping airport code to its information (or {'error': ...})
+        """
+        codes = [code.upper().strip() for code in airport_codes]
+        airport_urls = self._resolve_airport_urls()
+
+        def fetch(code: str) -> Dict:
+            url = airport_urls.get(code)
+            if not url:
+                return {'airportCode': code, 'error': f"Could not find airport link for {code} in navigation frame"}
+            try:
+                return self._build_airport_info(code, self._fetch_airport_text(url))
+            except Exception as e:
+                logger.error(f"Error fetching airport information for {code}: {e}")
+                return {'airportCode': code, 'error': f"Failed to fetch airport information: {str(e)}"}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(codes, executor.map(fetch, codes)))
+
+    def _build_airport_info(self, airport_code: str, body_text: str) -> Dict:
+        """Run the text extractors over an AIP page"""
+        # Upper-cased and indexed once; every extractor locates its section from these
+        upper = body_text.upper()
+        ad_index = _build_ad_index(upper)
+        return {
+            'airportCode': airport_code,
+            'airportName': self._extract_airport_name_from_text(body_text, upper, ad_index, airport_code),
+            'towerHours': self._extract_operational_hours_from_text(body_text, upper, ad_index),
+            'contacts': self._extract_contacts_from_text(body_text, upper, ad_index)
+        }
+
+    def _find_airport_url(self, airport_code: str) -> str:
+        """Navigate to the effective day and read the airport's AIP URL from the navigation frame"""
+        # Step 1: Navigate to the base AIP directory
+        logger.info(f"Step 1: Navigating to base AIP directory")
+        main_url = "https://www.ais.fi/eaip/"
+        self.page.goto(main_url, wait_until="load")
+        logger.info(f"Main page loaded. Current URL: {self.page.url}")
+
+        if "0.0.7.128" in self.page.url:
+            logger.error(f"Main page redirected to IP: {self.page.url}")
+            raise Exception(f"Main page redirected to IP address")
+
+        # Step 2: Click effective day link
+        logger.info(f"Step 2: Clicking effective day link")
+        effective_day_link = self.page.locator("a:has-text('02 Oct 2025')").first
+        if effective_day_link.is_visible():
+            effective_day_link.click()
+            # The next step only needs the navigation frame and its links
+            self.page.wait_for_load_state("domcontentloaded")
+            self.page.wait_for_selector("frame[name='eAISNavigation']", state="attached", timeout=10000)
+            logger.info(f"Effective day page loaded. Current URL: {self.page.url}")
+
+            if "0.0.7.128" in self.page.url:
+                logger.error(f"Effective day page redirected to IP: {self.page.url}")
+                raise Exception(f"Effective day page redirected to IP address")
+        else:
+            raise Exception("Could not find effective day link")
+
+        # Step 3: Find airport link in navigation frame
+        logger.info(f"Step 3: Looking for {airport_code} link in navigation frame")
+
+        # Find navigation frame
+        nav_frame = self.page.frame(name='eAISNavigation')
+        if not nav_frame:
+            raise Exception("Could not find eAISNavigation frame")
+        logger.info(f"Found navigation frame: {nav_frame.name}")
+        nav_frame.wait_for_selector("a[href]", state="attached", timeout=10000)
+
+        # Pick the airport link in one round-trip: the first eAIP link containing the
+        # code, else the first link containing it (all point to the same AIP page)
+        href = nav_frame.evaluate(_FIND_AIRPORT_HREF_JS, airport_code)
+        if not href:
+            raise Exception(f"Could not find airport link for {airport_code} in navigation frame")
+        logger.info(f"Found {airport_code} AIP URL: {href}")
+
+        # Make absolute URL
+        href = self._absolute_aip_url(href)
+
+        logger.info(f"Absolute AIP URL: {href}")
+        return href
+
+    def _sync_session_cookies(self) -> None:
+        """Copy the browser's cookies into the HTTP session"""
+        if not self.page:
+            return
+        for cookie in self.page.context.cookies():
+            self.session.cookies.set(cookie['name'], cookie['value'],
+                                     domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
+
+    def _render_airport_text(self, href: str) -> str:
+        """Load an AIP page in the browser and return its body text"""
+        self.page.goto(href, wait_until="load")
+        logger.info(f"AIP page loaded. Current URL: {self.page.url}")
+
+        if "0.0.7.128" in self.page.url:
+            logger.error(f"AIP page redirected to IP: {self.page.url}")
+            raise Exception(f"AIP page redirected to IP address")
+
+        # Accept cookies if present
+        try:
+            accept_button = self.page.locator("button:has-text('Accept')")
+            if accept_button.is_visible():
+                accept_button.click()
+                accept_button.wait_for(state="hidden", timeout=5000)
+                logger.info("Accepted cookies")
+        except:
+            logger.info("No cookie banner found")
+
+        # Step 3: Extract content from AIP page (contains both Finnish and English)
+        logger.info("Step 3: Extracting content from AIP page")
+
+        # Get content from the main page (AIP pages are usually single page, not frameset)
+        # Only the body text is parsed, so avoid serializing the full HTML as well
+        try:
+            body_text = self.page.evaluate(_BODY_TEXT_JS)
+            logger.info(f"Extracted content from AIP page: {len(body_text)} characters")
+        except Exception as e:
+            logger.warning(f"Could not get content from AIP page: {e}")
+            # Fallback: pick the frame with the most text, measured in the browser
+            frames = self.page.frames
+            content_frame = None
+            max_content_length = 0
+
+            for frame in frames:
+                try:
+                    frame_length = frame.evaluate("() => document.body ? document.body.textContent.length : 0")
+                    if frame_length > max_content_length:
+                        max_content_length = frame_length
+                        content_frame = frame
+                except Exception as e:
+                    logger.debug(f"Could not get content from frame {frame.name}: {e}")
+                    continue
+
+            if content_frame:
+                body_text = content_frame.evaluate(_BODY_TEXT_JS)
+                logger.info(f"Extracted content from frame: {len(body_text)} characters")
+            else:
+                body_text = "Content extraction failed"
+
+        return body_text
+
     def get_airport_info(self, airport_code: str) -> Dict:
         """
         Get airport information from Finnish AIP
@@ -222,134 +657,29 @@ class FinlandAIPScraperPlaywright:
         logger.info(f"Fetching Finland AIP information for {airport_code}")
         
         try:
-            # Step 1: Navigate to the base AIP directory
-            logger.info(f"Step 1: Navigating to base AIP directory")
-            main_url = "https://www.ais.fi/eaip/"
-            self.page.goto(main_url, wait_until="networkidle")
-            time.sleep(3)
-            logger.info(f"Main page loaded. Current URL: {self.page.url}")
-            
-            if "0.0.7.128" in self.page.url:
-                logger.error(f"Main page redirected to IP: {self.page.url}")
-                raise Exception(f"Main page redirected to IP address")
-            
-            # Step 2: Click effective day link
-            logger.info(f"Step 2: Clicking effective day link")
-            effective_day_link = self.page.locator("a:has-text('02 Oct 2025')").first
-            if effective_day_link.is_visible():
-                effective_day_link.click()
-                self.page.wait_for_load_state("networkidle")
-                time.sleep(3)
-                logger.info(f"Effective day page loaded. Current URL: {self.page.url}")
-                
-                if "0.0.7.128" in self.page.url:
-                    logger.error(f"Effective day page redirected to IP: {self.page.url}")
-                    raise Exception(f"Effective day page redirected to IP address")
+            # Steps 1-3: resolve the AIP page URL, from the cache when an earlier
+            # lookup (in this or a previous run) already found it
+            href = (self.airport_urls or self._load_cached_airport_urls()).get(airport_code)
+            if href:
+                logger.info(f"Using cached AIP URL for {airport_code}: {href}")
             else:
-                raise Exception("Could not find effective day link")
+                href = self._find_airport_url(airport_code)
             
-            # Step 3: Find airport link in navigation frame
-            logger.info(f"Step 3: Looking for {airport_code} link in navigation frame")
+            # Step 4: The AIP page is static, so fetch it over HTTP with the
+            # browser's cookies; render it in the browser only if that fails
+            body_text = None
+            try:
+                self._sync_session_cookies()
+                body_text = self._fetch_airport_text(href)
+                logger.info(f"Step 4: Fetched AIP page over HTTP: {len(body_text)} characters")
+            except Exception as e:
+                logger.warning(f"HTTP fetch of AIP page failed, rendering in browser: {e}")
             
-            # Look for links containing the airport code
-            # Find navigation frame
-            frames = self.page.frames
-            nav_frame = None
-            for frame in frames:
-                if frame.name == 'eAISNavigation':
-                    nav_frame = frame
-                    logger.info(f"Found navigation frame: {frame.name}")
-                    break
-            
-            if not nav_frame:
-                raise Exception("Could not find eAISNavigation frame")
-            
-            # Find airport links in navigation frame
-            airport_links = nav_frame.query_selector_all(f'a[href*="{airport_code}"][href*="eAIP"]')
-            if not airport_links:
-                airport_links = nav_frame.query_selector_all(f'a[href*="{airport_code}"]')
-            logger.info(f"Found {len(airport_links)} links containing {airport_code}")
-            
-            if airport_links:
-                # Get the first link (all point to the same AIP page)
-                href = airport_links[0].get_attribute('href')
-                logger.info(f"Found {airport_code} AIP URL: {href}")
-                
-                # Make absolute URL
-                if not href.startswith('http'):
-                    base_url = "https://www.ais.fi/eaip/005-2025_2025_10_02/eAIP/"
-                    if href.startswith('/'):
-                        href = f"https://www.ais.fi{href}"
-                    else:
-                        href = base_url + href.lstrip('/')
-                
-                logger.info(f"Absolute AIP URL: {href}")
-                
-                # Step 4: Navigate to AIP page
+            if body_text is None:
                 logger.info(f"Step 4: Navigating to AIP page")
-                self.page.goto(href, wait_until="networkidle")
-                time.sleep(3)
-                logger.info(f"AIP page loaded. Current URL: {self.page.url}")
-                
-                if "0.0.7.128" in self.page.url:
-                    logger.error(f"AIP page redirected to IP: {self.page.url}")
-                    raise Exception(f"AIP page redirected to IP address")
-            else:
-                raise Exception(f"Could not find airport link for {airport_code} in navigation frame")
+                body_text = self._render_airport_text(href)
             
-            # Accept cookies if present
-            try:
-                accept_button = self.page.locator("button:has-text('Accept')")
-                if accept_button.is_visible():
-                    accept_button.click()
-                    time.sleep(2)
-                    logger.info("Accepted cookies")
-            except:
-                logger.info("No cookie banner found")
-            
-            # Step 3: Extract content from AIP page (contains both Finnish and English)
-            logger.info("Step 3: Extracting content from AIP page")
-            
-            # Wait for the AIP page to load completely
-            self.page.wait_for_load_state("networkidle")
-            time.sleep(3)
-            
-            # Get content from the main page (AIP pages are usually single page, not frameset)
-            try:
-                body_text = self.page.text_content("body")
-                page_content = self.page.content()
-                logger.info(f"Extracted content from AIP page: {len(body_text)} characters")
-            except Exception as e:
-                logger.warning(f"Could not get content from AIP page: {e}")
-                # Fallback: try to get content from frames if any
-                frames = self.page.frames
-                content_frame = None
-                max_content_length = 0
-                
-                for frame in frames:
-                    try:
-                        frame_text = frame.content()
-                        if len(frame_text) > max_content_length:
-                            max_content_length = len(frame_text)
-                            content_frame = frame
-                    except Exception as e:
-                        logger.debug(f"Could not get content from frame {frame.name}: {e}")
-                        continue
-                
-                if content_frame:
-                    body_text = content_frame.text_content("body")
-                    page_content = content_frame.content()
-                    logger.info(f"Extracted content from frame: {len(body_text)} characters")
-                else:
-                    body_text = "Content extraction failed"
-                    page_content = ""
-            
-            airport_info = {
-                'airportCode': airport_code,
-                'airportName': self._extract_airport_name_from_text(body_text, airport_code),
-                'towerHours': self._extract_operational_hours_from_text(body_text),
-                'contacts': self._extract_contacts_from_text(body_text)
-            }
+            airport_info = self._build_airport_info(airport_code, body_text)
             
             logger.info(f"Successfully extracted information for {airport_code}")
             return airport_info
@@ -358,72 +688,71 @@ class FinlandAIPScraperPlaywright:
             logger.error(f"Error fetching airport information for {airport_code}: {e}")
             raise Exception(f"Failed to fetch airport information: {str(e)}")
     
-    def _extract_airport_name_from_text(self, text: str, airport_code: str) -> str:
-        """Extract airport name from text content (Estonia-style)"""
+    def _extract_airport_name_from_text(self, text: str, upper: str, ad_index: Dict[str, List[int]], code_upper: str) -> str:
+        """Extract airport name from text content (Estonia-style); the code is already upper-cased"""
         try:
             # Look for the "AERODROME LOCATION INDICATOR AND NAME" section
-            upper = text.upper()
             start_idx = upper.find('AERODROME LOCATION INDICATOR AND NAME')
             if start_idx == -1:
-                start_idx = upper.find('AD 2.1')
+                start_idx = _find_ad(upper, ad_index, 'AD 2.1')
             
             if start_idx != -1:
                 # Find the end of this section
-                end_idx = upper.find('AD 2.2', start_idx)
+                end_idx = _find_ad(upper, ad_index, 'AD 2.2', start_idx)
                 if end_idx == -1:
-                    end_idx = start_idx + 500  # Fallback
+                    # Fallback: whichever section heading comes next, else the end of the page
+                    end_idx = _find_ad(upper, ad_index, 'AD 2.', start_idx + 1)
+                    if end_idx == -1:
+                        end_idx = len(text)
                 
                 name_section = text[start_idx:end_idx]
                 
                 # Look for pattern like "EFHK — HELSINKI-VANTAA"
-                code_upper = airport_code.upper()
-                
                 # Pattern: CODE — NAME (with optional additional info)
-                name_pattern = rf'{re.escape(code_upper)}\s*[—–-]\s*(.+?)(?=\s*{re.escape(code_upper)})'
-                name_match = re.search(name_pattern, name_section, re.IGNORECASE)
+                name_re, code_tail_re, _ = _name_regexes(code_upper)
+                name_match = name_re.search(name_section)
                 
                 if name_match:
                     airport_name = name_match.group(1).strip()
                     # Clean up the name - remove extra whitespace and common suffixes
-                    airport_name = re.sub(r'\s+', ' ', airport_name)
-                    airport_name = re.sub(r'\s*(lentokenttä|Airport|Aerodrome)$', '', airport_name, flags=re.IGNORECASE)
+                    airport_name = _collapse_ws(airport_name)
+                    airport_name = _NAME_SUFFIX_RE.sub('', airport_name)
                     # Remove any remaining AD 2.2 or similar text
-                    airport_name = re.sub(r'\s*AD\s*2\.\d+.*$', '', airport_name, flags=re.IGNORECASE)
+                    airport_name = _NAME_AD_TAIL_RE.sub('', airport_name)
                     # Remove any remaining airport code duplicates
-                    airport_name = re.sub(rf'\s*{re.escape(code_upper)}.*$', '', airport_name, flags=re.IGNORECASE)
+                    airport_name = code_tail_re.sub('', airport_name)
                     # Remove trailing slash and clean up
                     airport_name = airport_name.rstrip(' /').strip()
                     return f"{code_upper} — {airport_name}"
             
-            # Fallback: try to find any line with the airport code
-            lines = [ln.strip() for ln in text.split('\n') if ln.strip()]
-            code_upper = airport_code.upper()
-            
-            for line in lines[:50]:  # Check first 50 lines
-                if code_upper in line and len(line) <= 150:
+            # Fallback: the first short line near the top of the page with the airport
+            # code, found by one regex over the first 5000 characters
+            line_re = _name_regexes(code_upper)[2]
+            for line_match in line_re.finditer(text, 0, 5000):
+                line = line_match.group(0).strip()
+                if len(line) <= 150:
                     # Look for dash or em dash pattern
                     if '—' in line or '–' in line or '-' in line:
-                        return line.strip()
+                        return line
                     # If no dash, return the line if it looks like a name
                     elif any(ch.isalpha() for ch in line.replace(code_upper, '')):
-                        return line.strip()
+                        return line
             
             # Final fallback
-            return airport_code.upper()
+            return code_upper
             
         except Exception as e:
             logger.warning(f"Error extracting airport name: {e}")
-            return airport_code.upper()
+            return code_upper
     
-    def _extract_operational_hours_from_text(self, text: str) -> List[Dict]:
+    def _extract_operational_hours_from_text(self, text: str, upper: str, ad_index: Dict[str, List[int]]) -> List[Dict]:
         """Extract operational hours from AD 2.3 TOIMINTA-AJAT section"""
         results: List[Dict] = []
         # Look specifically for the Finnish section "AD 2.3 TOIMINTA-AJAT"
-        upper = text.upper()
-        start_idx = upper.find('AD 2.3 TOIMINTA-AJAT')
+        start_idx = _find_ad(upper, ad_index, 'AD 2.3 TOIMINTA-AJAT')
         if start_idx == -1:
             # Fallback to English section
-            start_idx = upper.find('AD 2.3 OPERATIONAL HOURS')
+            start_idx = _find_ad(upper, ad_index, 'AD 2.3 OPERATIONAL HOURS')
         if start_idx == -1:
             # Additional fallbacks
             start_idx = upper.find('TOIMINTA-AJAT')
@@ -433,11 +762,14 @@ class FinlandAIPScraperPlaywright:
             start_idx = upper.find('OPERATIONAL HOURS')
         
         # Find the end of this section (next AD 2.4 section)
-        end_idx = upper.find('AD 2.4', start_idx) if start_idx != -1 else -1
-        if end_idx == -1:
-            end_idx = upper.find('AD 2.5', start_idx) if start_idx != -1 else -1
+        end_idx = _find_ad(upper, ad_index, 'AD 2.4', start_idx) if start_idx != -1 else -1
         if end_idx == -1:
-            end_idx = start_idx + 2000 if start_idx != -1 else -1  # Fallback: take next 2000 chars
+            end_idx = _find_ad(upper, ad_index, 'AD 2.5', start_idx) if start_idx != -1 else -1
+        if end_idx == -1 and start_idx != -1:
+            # Fallback: whichever section heading comes next, else the end of the page
+            end_idx = _find_ad(upper, ad_index, 'AD 2.', start_idx + 1)
+            if end_idx == -1:
+                end_idx = len(text)
         
         segment = text[start_idx:end_idx] if start_idx != -1 and end_idx != -1 else text
 
@@ -447,34 +779,13 @@ class FinlandAIPScraperPlaywright:
         # Comprehensive bilingual service scan to extract all rows like in the table
         # This complements the structured parsing below and ensures captions are always present
         try:
-            service_synonyms = {
-                "Aerodrome operator": [r"^Lentopaikan\s+pitäjä", r"^Aerodrome\s+operator", r"^AD\s+operator"],
-                "Customs and immigration": [r"^CUST,?\s*IMG", r"^Customs\s+and\s+immigration"],
-                "Health and sanitation": [r"^Terveystarkastus", r"^Health\s+and\s+sanitation"],
-                "AIS": [r"^AIS\s*$", r"^AIS\b"],
-                "AIS Briefing Office": [r"^AIS\s+Briefing\s+Office"],
-                "ATS Reporting Office (ARO)": [r"^ARO\b", r"^ATS\s+Reporting\s+Office"],
-                "MET": [r"^MET\s*$", r"^MET\b"],
-                "MET Briefing Office": [r"^MET\s+Briefing\s+Office"],
-                "ATS": [r"^ATS\s*$", r"^ATS\b"],
-                "Fuelling": [r"^Polttoaineiden\s+jakelu", r"^Tankkauspyynnöt", r"^Fuelling", r"^Refuelling\s+requests"],
-                "Handling": [r"^Tavaran\s+käsittely", r"^Handling"],
-                "Security": [r"^Turvatarkastus", r"^Security"],
-                "De-icing": [r"^Jäänpoisto", r"^De-icing"],
-                "RMK": [r"^RMK\b"]
-            }
-
-            # Helper to detect if a line looks like the start of a new numbered row
-            def is_row_break(text_line: str) -> bool:
-                return bool(re.match(r"^\d{1,2}\s", text_line))
-
             # Build a quick index of line positions for synonym matches
             line_count = len(lines)
             found_blocks = {}
             for idx, line in enumerate(lines):
-                for caption, patterns in service_synonyms.items():
+                for caption, patterns in _SERVICE_SYNONYMS:
                     for pat in patterns:
-                        if re.search(pat, line, re.IGNORECASE):
+                        if pat.search(line):
                             # Record the earliest index for this caption
                             if caption not in found_blocks:
                                 found_blocks[caption] = idx
@@ -489,16 +800,16 @@ class FinlandAIPScraperPlaywright:
                     next_line = lines[j]
                     # Stop if we hit another service caption or a numbered row
                     other_service = False
-                    for other_caption, patterns in service_synonyms.items():
+                    for other_caption, patterns in _SERVICE_SYNONYMS:
                         if other_caption == caption:
                             continue
                         for pat in patterns:
-                            if re.search(pat, next_line, re.IGNORECASE):
+                            if pat.search(next_line):
                                 other_service = True
                                 break
                         if other_service:
                             break
-                    if other_service or is_row_break(next_line):
+                    if other_service or _ROW_BREAK_RE.match(next_line):
                         break
                     window_lines.append(next_line)
                     # Limit window to avoid runaway
@@ -511,24 +822,24 @@ class FinlandAIPScraperPlaywright:
                 hours_text = None
 
                 # Specific patterns first
-                twr_match = re.search(r"TWR\s*:\s*(H24|24H)", window_text, re.IGNORECASE)
+                twr_match = _TWR_RE.search(window_text)
                 if caption == "ATS" and twr_match:
                     hours_text = f"TWR: {twr_match.group(1).upper()}"
 
                 if hours_text is None:
-                    if re.search(r"\bNIL\b", window_text, re.IGNORECASE):
+                    if _NIL_WORD_RE.search(window_text):
                         hours_text = "NIL"
-                    elif re.search(r"\b(H24|24H|24\s*HR)\b", window_text, re.IGNORECASE):
+                    elif _H24_WORD_RE.search(window_text):
                         hours_text = "H24"
                     else:
                         # Day range with times
-                        dtm = re.search(r"(MON|TUE|WED|THU|FRI|SAT|SUN)(?:[-–](MON|TUE|WED|THU|FRI|SAT|SUN))?\s*:?\s*(\d{2}[:.]?\d{2})\s*[-–]\s*(\d{2}[:.]?\d{2})", window_text, re.IGNORECASE)
+                        dtm = _DAY_TIME_RE.search(window_text)
                         if dtm:
-                            day_start = dtm.group(1).upper()
+                            day_start = _DAY_CANON[dtm.group(1).upper()]
                             day_end = dtm.group(2)
-                            t1 = dtm.group(3).replace('.', ':')
-                            t2 = dtm.group(4).replace('.', ':')
-                            day_range = f"{day_start}-{day_end.upper()}" if day_end else day_start
+                            t1 = dtm.group(3).translate(_TIME_TBL)
+                            t2 = dtm.group(4).translate(_TIME_TBL)
+                            day_range = f"{day_start}-{_DAY_CANON[day_end.upper()]}" if day_end else day_start
                             hours_text = f"{day_range} {t1}-{t2}"
 
                 # Only output hours; do not append phones, emails, URLs
@@ -542,299 +853,172 @@ class FinlandAIPScraperPlaywright:
             # Do not fail overall parsing if the comprehensive scan has issues
             pass
 
-        # Look for the specific service patterns with their hours
-        service_patterns = [
-            (r'AD\s+operator[:\s]*', r'(MON|TUE|WED|THU|FRI|SAT|SUN)(?:[-–](MON|TUE|WED|THU|FRI|SAT|SUN))?\s*[:\-]?\s*(\d{2}[:.]?\d{2})\s*[-–]\s*(\d{2}[:.]?\d{2})'),
-            (r'AD\s+Operational\s+hours[:\s]*', r'(H24|24H|24\s*HR)'),
-            (r'Customs\s+and\s+immigration[:\s]*', r'(H24|24H|24\s*HR)'),
-            (r'Health\s+and\s+sanitation[:\s]*', r'(H24|24H|24\s*HR)'),
-            (r'AIS\s+Briefing\s+Office[:\s]*', r'(H24|24H|24\s*HR)'),
-            (r'ATS\s+Reporting\s+Office[:\s]*', r'(H24|24H|24\s*HR)'),
-            (r'MET\s+Briefing\s+Office[:\s]*', r'(H24|24H|24\s*HR|NIL)'),
-            (r'ATS[:\s]*', r'(H24|24H|24\s*HR)'),
-            (r'Fuelling[:\s]*', r'(H24|24H|24\s*HR)'),
-            (r'Handling[:\s]*', r'(H24|24H|24\s*HR)'),
-            (r'Security[:\s]*', r'(H24|24H|24\s*HR)'),
-            (r'De-icing[:\s]*', r'(H24|24H|24\s*HR)')
-        ]
-        
         # First, look for the main operational hours line that contains all services
         operational_hours_line = None
         for line in lines:
-            if 'OPERATIONAL HOURS' in line.upper() and ('AD OPERATOR' in line.upper() or 'MON-THU' in line.upper() or 'FRI:' in line.upper() or 'MON-FRI' in line.upper()):
+            line_upper = line.upper()
+            if 'OPERATIONAL HOURS' in line_upper and ('AD OPERATOR' in line_upper or 'MON-THU' in line_upper or 'FRI:' in line_upper or 'MON-FRI' in line_upper):
                 operational_hours_line = line
                 break
         
         if operational_hours_line:
-            # Extract MON-FRI hours (single range like EETN)
-            mon_fri_match = re.search(r'MON-FRI\s*:\s*(\d{2}[:.]?\d{2})\s*[-–]\s*(\d{2}[:.]?\d{2})', operational_hours_line, re.IGNORECASE)
-            if mon_fri_match:
-                time_start = mon_fri_match.group(1).replace('.', ':')
-                time_end = mon_fri_match.group(2).replace('.', ':')
-                results.append({
-                    "day": "AD Operator Hours (MON-FRI)",
-                    "hours": f"{time_start}-{time_end}"
-                })
-            
-            # Extract MON-THU hours (separate range like EEEI)
-            mon_thu_match = re.search(r'MON-THU:\s*(\d{2}[:.]?\d{2})\s*[-–]\s*(\d{2}[:.]?\d{2})', operational_hours_line, re.IGNORECASE)
-            if mon_thu_match:
-                time_start = mon_thu_match.group(1).replace('.', ':')
-                time_end = mon_thu_match.group(2).replace('.', ':')
-                results.append({
-                    "day": "AD Operator Hours (MON-THU)",
-                    "hours": f"{time_start}-{time_end}"
-                })
-            
-            # Extract FRI hours (separate range like EEEI)
-            fri_match = re.search(r'FRI:\s*(\d{2}[:.]?\d{2})\s*[-–]\s*(\d{2}[:.]?\d{2})', operational_hours_line, re.IGNORECASE)
-            if fri_match:
-                time_start = fri_match.group(1).replace('.', ':')
-                time_end = fri_match.group(2).replace('.', ':')
-                results.append({
-                    "day": "AD Operator Hours (FRI)",
-                    "hours": f"{time_start}-{time_end}"
-                })
-            
-            # Extract individual services that are actually present in the document
-            # Parse each service individually based on the actual document structure
-            
-            # 2Customs and immigration - May be requested with PPR
-            customs_match = re.search(r'2Customs and immigration.*?(H24|NIL|May be requested)', operational_hours_line, re.IGNORECASE | re.DOTALL)
-            if customs_match:
-                hours_text = customs_match.group(1)
-                if 'May be requested' in hours_text:
+            # Extract AD operator hours: a single MON-FRI range (like EETN) or
+            # separate MON-THU and FRI ranges (like EEEI)
+            for caption, hours_re in _OPERATOR_HOURS:
+                hours_match = hours_re.search(operational_hours_line)
+                if hours_match:
+                    time_start = hours_match.group(1).translate(_TIME_TBL)
+                    time_end = hours_match.group(2).translate(_TIME_TBL)
                     results.append({
-                        "day": "Customs and immigration",
-                        "hours": "On request"
-                    })
-                elif 'H24' in hours_text.upper():
-                    results.append({
-                        "day": "Customs and immigration",
-                        "hours": "H24"
-                    })
-                elif 'NIL' in hours_text.upper():
-                    results.append({
-                        "day": "Customs and immigration",
-                        "hours": "NIL"
+                        "day": caption,
+                        "hours": f"{time_start}-{time_end}"
                     })
             
-            # 3Health and sanitation - H24
-            health_match = re.search(r'3Health and sanitation.*?(H24|NIL)', operational_hours_line, re.IGNORECASE | re.DOTALL)
-            if health_match and 'H24' in health_match.group(1).upper():
-                results.append({
-                    "day": "Health and sanitation",
-                    "hours": "H24"
-                })
-            
-            # 4AIS Briefing Office - H24 (MIL)
-            ais_match = re.search(r'4AIS Briefing Office.*?(H24|NIL)', operational_hours_line, re.IGNORECASE | re.DOTALL)
-            if ais_match and 'H24' in ais_match.group(1).upper():
-                results.append({
-                    "day": "AIS Briefing Office",
-                    "hours": "H24"
-                })
-            
-            # 5ATS Reporting Office (ARO) - NIL
-            aro_match = re.search(r'5ATS Reporting Office \(ARO\).*?(H24|NIL)', operational_hours_line, re.IGNORECASE | re.DOTALL)
-            if aro_match:
-                hours_text = aro_match.group(1)
-                if 'NIL' in hours_text.upper():
-                    results.append({
-                        "day": "ATS Reporting Office (ARO)",
-                        "hours": "NIL"
-                    })
-                elif 'H24' in hours_text.upper():
+            # Extract individual services that are actually present in the document.
+            # The line is newline-free, so compact non-DOTALL patterns anchored on the
+            # row number are enough; each service is checked once against it.
+            for caption, service_re, reported in _FI_SERVICES:
+                service_match = service_re.search(operational_hours_line)
+                if not service_match:
+                    continue
+                value = service_match.group(1).upper()
+                hours = "On request" if value == 'MAY BE REQUESTED' else value
+                if hours in reported:
                     results.append({
-                        "day": "ATS Reporting Office (ARO)",
-                        "hours": "H24"
+                        "day": caption,
+                        "hours": hours
                     })
-            
-            # 6MET Briefing Office - H24
-            met_match = re.search(r'6MET Briefing Office.*?(H24|NIL)', operational_hours_line, re.IGNORECASE | re.DOTALL)
-            if met_match and 'H24' in met_match.group(1).upper():
-                results.append({
-                    "day": "MET Briefing Office",
-                    "hours": "H24"
-                })
-            
-            # 7ATS - H24
-            ats_match = re.search(r'7ATS.*?(H24|NIL)', operational_hours_line, re.IGNORECASE | re.DOTALL)
-            if ats_match and 'H24' in ats_match.group(1).upper():
-                results.append({
-                    "day": "ATS",
-                    "hours": "H24"
-                })
-            
-            # 8Fuelling - H24
-            fuelling_match = re.search(r'8Fuelling.*?(H24|NIL)', operational_hours_line, re.IGNORECASE | re.DOTALL)
-            if fuelling_match and 'H24' in fuelling_match.group(1).upper():
-                results.append({
-                    "day": "Fuelling",
-                    "hours": "H24"
-                })
-            
-            # 9Handling - H24
-            handling_match = re.search(r'9Handling.*?(H24|NIL)', operational_hours_line, re.IGNORECASE | re.DOTALL)
-            if handling_match and 'H24' in handling_match.group(1).upper():
-                results.append({
-                    "day": "Handling",
-                    "hours": "H24"
-                })
-            
-            # 10Security - H24
-            security_match = re.search(r'10Security.*?(H24|NIL)', operational_hours_line, re.IGNORECASE | re.DOTALL)
-            if security_match and 'H24' in security_match.group(1).upper():
-                results.append({
-                    "day": "Security",
-                    "hours": "H24"
-                })
-            
-            # 11De-icing - H24
-            deicing_match = re.search(r'11De-icing.*?(H24|NIL)', operational_hours_line, re.IGNORECASE | re.DOTALL)
-            if deicing_match and 'H24' in deicing_match.group(1).upper():
-                results.append({
-                    "day": "De-icing",
-                    "hours": "H24"
-                })
         
-        # Fallback: parse line by line if no structured line found
+        # Fallback: parse line by line if no structured line found. Service rows and
+        # bare day/time ranges are collected in the same pass over the lines; service
+        # rows win, bare day/time ranges are used only when no service row matched.
         if not results:
+            service_rows: List[Dict] = []
+            day_time_rows: List[Dict] = []
             for line in lines:
                 line_upper = line.upper()
                 
                 # Check each service pattern
-                for service_regex, hours_regex in service_patterns:
-                    service_match = re.search(service_regex, line_upper)
+                for service_regex, hours_regex in _SERVICE_PATTERNS:
+                    service_match = service_regex.search(line_upper)
                     if service_match:
                         # Extract the service name
                         service_name = service_match.group(0).strip().rstrip(':').strip()
                         
                         # Look for hours pattern after the service name
-                        hours_match = re.search(hours_regex, line, re.IGNORECASE)
+                        hours_match = hours_regex.search(line)
                         if hours_match:
                             if 'H24' in hours_match.group(1).upper() or '24H' in hours_match.group(1).upper():
-                                results.append({
+                                service_rows.append({
                                     "day": service_name,
                                     "hours": "H24"
                                 })
                             elif 'NIL' in hours_match.group(1).upper():
-                                results.append({
+                                service_rows.append({
                                     "day": service_name,
                                     "hours": "NIL"
                                 })
                             elif len(hours_match.groups()) >= 4:  # Day range with times
-                                day_start = hours_match.group(1).upper()
+                                day_start = _DAY_CANON[hours_match.group(1).upper()]
                                 day_end = hours_match.group(2)
-                                time_start = hours_match.group(3).replace('.', ':')
-                                time_end = hours_match.group(4).replace('.', ':')
+                                time_start = hours_match.group(3).translate(_TIME_TBL)
+                                time_end = hours_match.group(4).translate(_TIME_TBL)
                                 
                                 if day_end:
-                                    day_range = f"{day_start}-{day_end.upper()}"
+                                    day_range = f"{day_start}-{_DAY_CANON[day_end.upper()]}"
                                 else:
                                     day_range = day_start
                                 
-                                results.append({
+                                service_rows.append({
                                     "day": f"{service_name} ({day_range})",
                                     "hours": f"{time_start}-{time_end}"
                                 })
-                        break  # Found a match, move to next line
-        
-        # If no structured data found, fallback to simple patterns
-        if not results:
-            # Look for any day ranges with times
-            day_time_pattern = r'(MON|TUE|WED|THU|FRI|SAT|SUN)(?:[-–](MON|TUE|WED|THU|FRI|SAT|SUN))?\s*[:\-]?\s*(\d{2}[:.]?\d{2})\s*[-–]\s*(\d{2}[:.]?\d{2})'
-            for line in lines:
-                match = re.search(day_time_pattern, line, re.IGNORECASE)
+                        break  # Found a match, move to the day/time check
+                
+                # Any day range with times. Once a service row is found these are
+                # never used, so skip them; most lines carry no day token at all.
+                if service_rows or not any(tok in line_upper for tok in _DAY_TOKENS):
+                    continue
+                match = _DAY_TIME_RE.search(line)
                 if match:
-                    day_start = match.group(1).upper()
+                    day_start = _DAY_CANON[match.group(1).upper()]
                     day_end = match.group(2)
-                    time_start = match.group(3).replace('.', ':')
-                    time_end = match.group(4).replace('.', ':')
+                    time_start = match.group(3).translate(_TIME_TBL)
+                    time_end = match.group(4).translate(_TIME_TBL)
                     
                     if day_end:
-                        day_range = f"{day_start}-{day_end.upper()}"
+                        day_range = f"{day_start}-{_DAY_CANON[day_end.upper()]}"
                     else:
                         day_range = day_start
                     
-                    results.append({
+                    day_time_rows.append({
                         "day": day_range,
                         "hours": f"{time_start}-{time_end}"
                     })
             
-            # Look for H24 patterns
+            results = service_rows or day_time_rows
+            
+            # Look for H24 anywhere in the section - one C-level scan instead of a regex per line
             if not results:
-                h24_pattern = r'\b(H24|24H|24\s*HR)\b'
-                for line in lines:
-                    if re.search(h24_pattern, line, re.IGNORECASE):
-                        # Use a descriptive caption rather than repeating H24
-                        results.append({"day": "AD Operational Hours", "hours": "H24"})
-                        break
+                # Slice of the page's upper-cased copy rather than a new upper() of the segment
+                segment_upper = upper[start_idx:end_idx] if start_idx != -1 and end_idx != -1 else upper
+                if segment_upper.find('H24') >= 0 or segment_upper.find('24H') >= 0 or '24 HR' in segment_upper:
+                    # Use a descriptive caption rather than repeating H24
+                    results.append({"day": "AD Operational Hours", "hours": "H24"})
         
-        # Deduplicate while preserving order
-        unique: List[Dict] = []
-        seen = set()
+        # Deduplicate while preserving order (dicts keep insertion order)
+        uniq: Dict[tuple, Dict] = {}
         for r in results:
-            key = (r.get('day'), r.get('hours'))
-            if key not in seen:
-                seen.add(key)
-                unique.append(r)
+            uniq.setdefault((r.get('day'), r.get('hours')), r)
+        unique: List[Dict] = list(uniq.values())
         
         if not unique:
             unique.append({"day": "General", "hours": "Hours information not available"})
         
         return unique
     
-    def _extract_contacts_from_text(self, text: str) -> List[Dict]:
+    def _extract_contacts_from_text(self, text: str, upper: str, ad_index: Dict[str, List[int]]) -> List[Dict]:
         """Extract contact information from AD 2.2 LENTOPAIKAN SIJAINTI JA HALLINTO section"""
         contacts: List[Dict] = []
         
         # Look for the Finnish section "AD 2.2 LENTOPAIKAN SIJAINTI JA HALLINTO"
-        upper = text.upper()
-        start_idx = upper.find('AD 2.2 LENTOPAIKAN SIJAINTI JA HALLINTO')
+        start_idx = _find_ad(upper, ad_index, 'AD 2.2 LENTOPAIKAN SIJAINTI JA HALLINTO')
         if start_idx == -1:
             # Fallback to English section
-            start_idx = upper.find('AD 2.2 AERODROME LOCATION AND ADMINISTRATION')
+            start_idx = _find_ad(upper, ad_index, 'AD 2.2 AERODROME LOCATION AND ADMINISTRATION')
         
         if start_idx != -1:
-            # Find the end of this section (next AD 2.3 section)
-            end_idx = upper.find('AD 2.3 TOIMINTA-AJAT', start_idx)
+            # Find the end of this section: the first of the next-section markers,
+            # each searched once (fallback: the next section heading, else the page end)
+            end_positions = (_find_ad(upper, ad_index, marker, start_idx) for marker in _AD22_END_MARKERS)
+            end_idx = min((idx for idx in end_positions if idx != -1), default=-1)
             if end_idx == -1:
-                end_idx = upper.find('AD 2.3 OPERATIONAL HOURS', start_idx)
+                end_idx = _find_ad(upper, ad_index, 'AD 2.', start_idx + 1)
             if end_idx == -1:
-                end_idx = start_idx + 3000  # Fallback: take next 3000 chars
+                end_idx = len(text)
             
             ad_section = text[start_idx:end_idx]
             
             # Extract phone numbers from this section
-            # Pattern for Finnish phone numbers: +358 followed by digits
-            phone_regex = r'(\+358[0-9\s\-]+)'
-            phones = re.findall(phone_regex, ad_section)
-            
-            # Also look for other phone patterns
-            phone_regex2 = r'(\+358\s*\d{2,3}\s*\d{3,4}\s*\d{3,4})'
-            phones2 = re.findall(phone_regex2, ad_section)
-            phones.extend(phones2)
-            
-            # Clean up phone numbers - remove extra spaces and limit length
-            phones = [re.sub(r'\s+', ' ', p.strip()) for p in phones if len(p.strip()) <= 25]
-            phones = list(set(phones))  # Remove duplicates
+            # At most three contacts are built from the first three distinct phones,
+            # emails and organisations, so each scan stops once it has found three
             
-            # Extract emails from this section
-            email_regex = r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
-            emails = re.findall(email_regex, ad_section)
+            # Finnish phone numbers (+358 followed by digits), then the stricter grouped
+            # form, which only runs if the first leaves fewer than three. Spaces are
+            # collapsed, overlong matches dropped and duplicates removed in document
+            # order (orgs[i] pairing below relies on it)
+            phones = _first_unique((_collapse_ws(m.group(1)) for phone_re in _PHONE_RES
+                                    for m in phone_re.finditer(ad_section)
+                                    if 0 < len(m.group(1).strip()) <= 25), 3)
             
-            # Clean up emails - remove any concatenated text after the email
-            emails = [re.sub(r'[A-Z]{2,}.*$', '', email) for email in emails]
-            emails = list(set(emails))  # Remove duplicates
+            # Extract emails from this section, removing any concatenated text after the email
+            emails = _first_unique((_EMAIL_TAIL_RE.sub('', m.group(1)) for m in _EMAIL_RE.finditer(ad_section)), 3)
             
             # Extract organization names (look for patterns like "Finavia Oyj" or similar)
-            org_regex = r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Oyj|Oy|Ltd|Ltd\.|Inc\.?|Corp\.?|Corporation))'
-            orgs = re.findall(org_regex, ad_section)
-            orgs = list(set(orgs))  # Remove duplicates
+            orgs = _first_unique((m.group(1) for m in _ORG_RE.finditer(ad_section)), 3)
             
             # Create contacts from the AD 2.2 section (using same caption structure as Estonia)
-            for i, phone in enumerate(phones[:3]):  # Limit to 3 phone numbers
+            for i, phone in enumerate(phones):
                 contacts.append({
                     "type": f"AD Operator Contact {i+1}",
                     "phone": phone.strip(),
@@ -867,6 +1051,7 @@ class FinlandAIPScraperPlaywright:
     
     def close(self):
         """Close the browser"""
+        self.session.close()
         if self.browser:
             self.browser.close()
         if self.playwright:
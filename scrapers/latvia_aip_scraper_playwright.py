@@ -4,50 +4,398 @@ Latvia AIP scraper using Playwright
 Handles the Latvian AIP structure from ais.lgs.lv
 """
 
+import os
 import re
+import copy
+import calendar
+import json
 import time
 import logging
-from typing import Dict, List
+import threading
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright
 
+# Lexbor-backed parser is much faster than html.parser on large AIP pages; optional
+try:
+	from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+	HTMLParser = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# The discovered base URL is persisted between runs; an AIRAC cycle lasts 28 days
+BASE_URL_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'clearway', 'latvia_base_url.json')
+BASE_URL_CACHE_TTL = 28 * 24 * 3600
+# Effective date of the issue in its base URL (".../data/2025-10-30/html")
+_ISSUE_DATE_RE = re.compile(r'/(\d{4}-\d{2}-\d{2})/')
+# Parsed airport information per (airport code, base URL); a new AIRAC issue has a new base URL.
+# Bounded: past INFO_CACHE_SIZE entries the oldest is dropped
+INFO_CACHE_SIZE = 256
+_INFO_CACHE: Dict[Tuple[str, str], Dict] = {}
+_INFO_CACHE_LOCK = threading.Lock()
+# Resources that never affect the extracted text. Stylesheets are let through: the
+# navigation menu's folding, which the link visibility checks rely on, is CSS-driven
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+_WS_RE = re.compile(r'\s+')
+_NAME_SUFFIX_RE = re.compile(r'\s*(Aerodrome)$', re.IGNORECASE)
+_NAME_HEADING_TAIL_RE = re.compile(r'\s*AD\s*2\.\d+.*$', re.IGNORECASE)
+# AD 2.3 OPERATIONAL HOURS row captions, all found in one scan; a row's value is
+# the first H24/NIL after its caption (for customs, after "immigration")
+_HOURS_ROW_RE = re.compile(
+	r'(?P<admin>(?<!\S)AD\s+Administration)'
+	r'|(?P<operator>(?<!\S)AD\s+Operator)'
+	r'|(?P<operator_row>1AD)'
+	r'|(?P<customs>Customs)'
+	r'|(?P<ats>(?<!Reporting )(?<!MET\s)ATS(?![A-Z]))',
+	re.IGNORECASE
+)
+_HOURS_VALUE_RE = re.compile(r'H24|NIL', re.IGNORECASE)
+_IMMIGRATION_RE = re.compile(r'immigration', re.IGNORECASE)
+_CUSTOMS_VALUE_RE = re.compile(r'H24|NIL|May be requested', re.IGNORECASE)
+# AD operator contacts (Latvian phone numbers: +371), both found in one scan
+_CONTACT_RE = re.compile(r'(?P<phone>\+371[0-9\s]+)|(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})')
+_EMAIL_TAIL_RE = re.compile(r'[A-Z]{2,}.*$')
+_CATEGORY_RES = (
+	re.compile(r'AD\s+CATEGORY[:\s]+([0-9])', re.IGNORECASE),
+	re.compile(r'Category[:\s]+([0-9])', re.IGNORECASE),
+	re.compile(r'Category\s+([0-9])[:\s]+for', re.IGNORECASE),
+)
+_TRAFFIC_RES = (
+	re.compile(r'Types?\s+of\s+traffic.*?(IFR[/, ]VFR|VFR[/, ]IFR|IFR|VFR)', re.IGNORECASE),
+	re.compile(r'Traffic.*?(IFR[/, ]VFR|VFR[/, ]IFR|IFR|VFR)', re.IGNORECASE),
+	re.compile(r'(IFR/VFR|VFR/IFR)', re.IGNORECASE),
+)
+# Remarks clean-up
+_REMARKS_PREFIX_RE = re.compile(r'^REMARKS[:\s]*', re.IGNORECASE)
+_AD23_TAIL_RE = re.compile(r'AD\s+2\.3.*$', re.IGNORECASE | re.DOTALL)
+_NEXT_AD_RE = re.compile(r'\w+\s+AD\s+2\.\d+', re.IGNORECASE)
+_COPYRIGHT_RE = re.compile(r'©.*$', re.DOTALL)
+_AIP_FOOTER_RE = re.compile(r'AIP\s+\w+\s+AIRAC.*$', re.IGNORECASE | re.DOTALL)
+
+# Section headings the extractors slice on, matched case-insensitively on the raw
+# text instead of finding them in an upper-cased copy of it
+_AD_HEADING_RE = re.compile(r'AD 2\.(\d+)', re.IGNORECASE | re.ASCII)
+_SECTION_RES = {
+	marker: re.compile(re.escape(marker), re.IGNORECASE)
+	for marker in (
+		'AD 2.1',
+		'AD 2.2',
+		'AD 2.3',
+		'AD 2.3 OPERATIONAL HOURS',
+		'AD 2.4',
+		'AD 2.6',
+		'AD 2.7',
+		'7TYPES OF TRAFFIC',
+		'AD OPERATOR',
+		'AD OPERATOR, ADDRESS, TELEPHONE, TELEFAX, E-MAIL, AFS, URL',
+		'AERODROME GEOGRAPHICAL',
+		'AERODROME LOCATION INDICATOR AND NAME',
+		'OPERATIONAL HOURS',
+		'REMARKS',
+		'RESCUE AND FIRE FIGHTING',
+	)
+}
+
+
+def _build_section_index(text: str) -> Dict[str, List[int]]:
+	"""
+	Offsets of every 'AD 2.x' heading in the page, found in one case-insensitive scan.
+	Keys follow str.find semantics, so 'AD 2.21' is listed under 'AD 2.2' as well.
+	"""
+	index: Dict[str, List[int]] = {}
+	for match in _AD_HEADING_RE.finditer(text):
+		number = match.group(1)
+		for i in range(1, len(number) + 1):
+			index.setdefault(f'AD 2.{number[:i]}', []).append(match.start())
+	return index
+
+
+def _section_key(marker: str) -> Optional[str]:
+	"""The 'AD 2.x' index key a heading starts with, or None for other headings"""
+	key = ' '.join(marker.split(' ', 2)[:2])
+	return key if _AD_HEADING_RE.fullmatch(key) else None
+
+
+def _find_section(text: str, section_index: Dict[str, List[int]], marker: str,
+		start: int = 0, end: Optional[int] = None) -> int:
+	"""
+	Offset of a section heading in text[start:end], or -1; a case-insensitive str.find.
+	'AD 2.x' headings are looked up in the section index instead of scanning the page.
+	"""
+	end = len(text) if end is None else end
+	pattern = _SECTION_RES[marker]
+	key = _section_key(marker)
+	if key is None:
+		match = pattern.search(text, start, end)
+		return match.start() if match else -1
+	offsets = section_index.get(key, ())
+	for i in range(bisect_left(offsets, start), bisect_right(offsets, end - len(marker))):
+		if key == marker or pattern.match(text, offsets[i], end):
+			return offsets[i]
+	return -1
+
+
+def _rfind_section(text: str, section_index: Dict[str, List[int]], marker: str,
+		start: int = 0, end: Optional[int] = None) -> int:
+	"""Offset of the last section heading in text[start:end], or -1; a case-insensitive str.rfind"""
+	end = len(text) if end is None else end
+	pattern = _SECTION_RES[marker]
+	key = _section_key(marker)
+	if key is None:
+		last = -1
+		for match in pattern.finditer(text, start, end):
+			last = match.start()
+		return last
+	offsets = section_index.get(key, ())
+	for i in reversed(range(bisect_left(offsets, start), bisect_right(offsets, end - len(marker)))):
+		if key == marker or pattern.match(text, offsets[i], end):
+			return offsets[i]
+	return -1
+
+def invalidate_airport_info(airport_code: Optional[str] = None) -> None:
+	"""Drop cached airport information, for one airport or for all of them"""
+	with _INFO_CACHE_LOCK:
+		for key in [key for key in _INFO_CACHE if airport_code is None or key[0] == airport_code.upper().strip()]:
+			del _INFO_CACHE[key]
+
+
+def _parse_page(html) -> Tuple[str, Optional['HTMLParser']]:
+	"""
+	The body's textContent (text nodes concatenated as-is) parsed from HTML, and
+	the parsed tree for structured lookups; the tree is None without selectolax.
+	"""
+	if HTMLParser is not None:
+		tree = HTMLParser(html)
+		return (tree.body or tree.root).text(separator=''), tree
+	soup = BeautifulSoup(html, 'html.parser')
+	return (soup.body or soup).get_text(), None
+
+
+def _section_rows(tree: 'HTMLParser', airport_code: str, section: int) -> List[List[str]]:
+	"""
+	Cell texts of the table rows of an airport's AD 2.x section. The eAIP gives
+	each section a '{CODE}-AD-2.x' anchor id; the rows are inside the anchored
+	element or in the first table after it, before the next section's anchor.
+	Empty when the page has no such anchor or table.
+	"""
+	node = tree.css_first(f'[id="{airport_code}-AD-2.{section}"]')
+	if node is None:
+		return []
+	rows = node.css('tr')
+	if not rows:
+		# A heading anchor may sit inside the heading element: walk the siblings of
+		# the anchor, then of each enclosing element, up to the first table
+		holder = node
+		while holder is not None and holder.tag not in ('body', 'html') and not rows:
+			sibling = holder.next
+			while sibling is not None:
+				# Stop at the next section, whether the sibling is its anchor or holds it
+				if '-AD-2.' in ((sibling.attributes or {}).get('id') or '') or sibling.css_first('[id*="-AD-2."]') is not None:
+					return []
+				table = sibling if sibling.tag == 'table' else sibling.css_first('table')
+				if table is not None:
+					rows = table.css('tr')
+					break
+				sibling = sibling.next
+			holder = holder.parent
+	return [[_WS_RE.sub(' ', cell.text()).strip() for cell in row.css('td, th')] for row in rows]
+
+
+def _structured_hours(tree: 'HTMLParser', airport_code: str) -> Dict[str, str]:
+	"""
+	AD 2.3 hours read from the section's table: the caption cells name the row
+	and the last cell holds its hours. Every row with a recognised caption is
+	returned, as "NIL" when its cell has no H24/NIL (e.g. "MON-FRI 0600-1500"),
+	so the row's own cell wins over whatever the text scan found further on.
+	"""
+	fields = {
+		'admin': "AD Administration",
+		'operator': "AD Operator",
+		'operator_row': "AD Operator",
+		'customs': "Customs and immigration",
+		'ats': "ATS",
+	}
+	hours: Dict[str, str] = {}
+	for cells in _section_rows(tree, airport_code, 3):
+		if len(cells) < 2:
+			continue
+		caption = _HOURS_ROW_RE.search(' ' + ' '.join(cells[:-1]))
+		if not caption or fields[caption.lastgroup] in hours:
+			continue
+		field = fields[caption.lastgroup]
+		if field == "Customs and immigration":
+			value = _CUSTOMS_VALUE_RE.search(cells[-1])
+			if value and value.group(0).upper() == 'MAY BE REQUESTED':
+				hours[field] = "On request"
+				continue
+		else:
+			value = _HOURS_VALUE_RE.search(cells[-1])
+		hours[field] = "H24" if value and "H24" in value.group(0).upper() else "NIL"
+	return hours
+
+
+def _base_url_from_href(href: str) -> str:
+	"""eAIP base URL (the issue's html directory) from an eAIPfiles link on the AIP page"""
+	if href.startswith("eAIPfiles"):
+		return f"https://ais.lgs.lv/{href.rsplit('/', 1)[0]}"
+	if href.startswith("/"):
+		return f"https://ais.lgs.lv{href.rsplit('/', 1)[0]}"
+	return href.rsplit('/', 1)[0]
+
+
+def _name_after_code(section: str, code_upper: str) -> Optional[str]:
+	"""
+	NAME from the first 'CODE — NAME' in section, up to the next CODE or the end
+	of the line, found with plain substring scans; None when there is none.
+	"""
+	upper = section.upper()
+	size = len(section)
+	i = upper.find(code_upper)
+	while i != -1:
+		k = i + len(code_upper)
+		while k < size and section[k].isspace():
+			k += 1
+		if k < size and section[k] in '—–-':
+			k += 1
+			while k < size and section[k].isspace():
+				k += 1
+			end = upper.find(code_upper, k + 1)
+			name = section[k:end if end != -1 else size].split('\n', 1)[0].strip()
+			if name:
+				return name
+		i = upper.find(code_upper, i + 1)
+	return None
+
+
 class LatviaAIPScraperPlaywright:
+	# One browser per thread (the sync API is bound to the thread that started it),
+	# shared by that thread's scrapers and shut down when the last one closes
+	_pool = threading.local()
+
 	def __init__(self):
 		"""Initialize the Latvia AIP scraper"""
 		self.aip_page_url = "https://ais.lgs.lv/aiseaip"
 		self.base_url = None  # Will be fetched from the page
-		self.playwright = None
+		self.base_url_from_cache = False
+		# The browser is acquired by the first lookup that needs it and released by close()
 		self.browser = None
+		self.context = None
 		self.page = None
+		self.eaip_opened = False
+		# eAIP frames, remembered until the page navigates away from the frameset
+		self.frames_url = None
+		self.nav_frame = None
+		self.content_frame = None
+		# Plain HTTP session for cheap checks that need no browser
+		self.session = requests.Session()
+		self.session.headers.update({'User-Agent': USER_AGENT})
+
+	@classmethod
+	def _acquire_browser(cls):
+		"""This thread's shared browser, launched on first use; one reference per caller."""
+		pool = cls._pool
+		if getattr(pool, 'browser', None) is None:
+			pool.playwright = sync_playwright().start()
+			try:
+				pool.browser = pool.playwright.chromium.launch(headless=True, args=['--window-size=1600,1000'])
+			except Exception:
+				pool.playwright.stop()
+				pool.playwright = None
+				raise
+			pool.refcount = 0
+			logger.info("Playwright browser initialized for Latvia AIP (headless)")
+		pool.refcount += 1
+		return pool.browser
+
+	@classmethod
+	def _release_browser(cls):
+		"""Drop one reference to this thread's browser, shutting it down with the last one."""
+		pool = cls._pool
+		pool.refcount -= 1
+		if pool.refcount > 0:
+			return
+		try:
+			pool.browser.close()
+		except Exception:
+			pass
+		try:
+			pool.playwright.stop()
+		except Exception:
+			pass
+		pool.browser = pool.playwright = None
+		logger.info("Playwright browser closed")
 
 	def _setup_browser(self):
-		"""Setup Playwright browser in headless mode."""
+		"""Open a page in a fresh context of this thread's shared headless browser."""
 		try:
-			self.playwright = sync_playwright().start()
-			self.browser = self.playwright.chromium.launch(headless=True, args=['--window-size=1600,1000'])
-			self.page = self.browser.new_page()
+			self.browser = self._acquire_browser()
+			self.context = self.browser.new_context()
+			# Routed on the context so requests from the eAIP frames are covered too
+			self.context.route("**/*", self._route_request)
+			self.page = self.context.new_page()
 			self.page.set_default_timeout(30000)
-			logger.info("Playwright browser initialized for Latvia AIP (headless)")
 		except Exception as e:
 			logger.error(f"Failed to initialize Playwright browser: {e}")
+			if self.browser is not None:
+				self.browser = None
+				self._release_browser()
 			raise
 
+	@staticmethod
+	def _route_request(route):
+		"""Abort images, fonts and media; let everything else through."""
+		if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+			route.abort()
+		else:
+			route.continue_()
+
+	def _ensure_session(self):
+		"""Start the browser and open the eAIP frameset on first use only."""
+		if self.browser is None:
+			self._setup_browser()
+		if not self.eaip_opened:
+			self._open_eaip()
+			self.eaip_opened = True
+
 	def _get_base_url(self):
 		"""Get the current AIP base URL from the Latvia AIP page"""
 		if self.base_url:
 			return self.base_url
+		
+		cached = self._load_cached_base_url()
+		if cached:
+			logger.info(f"Using cached base URL: {cached}")
+			self.base_url = cached
+			self.base_url_from_cache = True
+			return self.base_url
 			
 		logger.info("Fetching Latvia AIP base URL")
 		
+		# The links are in the static page; the browser is only needed if that fails
+		fetched = self._fetch_base_url()
+		if fetched:
+			self.base_url = fetched
+			logger.info(f"Base URL: {self.base_url}")
+			self._save_cached_base_url(self.base_url)
+			return self.base_url
+		
 		# Navigate to the AIP page
+		if self.browser is None:
+			self._setup_browser()
 		self.page.goto(self.aip_page_url, wait_until="domcontentloaded")
-		time.sleep(2)
 		
 		# Look for the "CURRENT ISSUE" button with href
 		try:
-			# Find all buttons with eAIPfiles links
+			# Find all buttons with eAIPfiles links; all() does not auto-wait, so wait for the first one
+			self.page.wait_for_selector("a[href*='eAIPfiles']", state="attached", timeout=10000)
 			buttons = self.page.locator("a[href*='eAIPfiles']").all()
 			logger.info(f"Found {len(buttons)} buttons with eAIPfiles links")
 			
@@ -62,14 +410,10 @@ class LatviaAIPScraperPlaywright:
 					if button_text.strip().startswith("AIRAC"):
 						logger.info(f"Found AIRAC button {i}: {button_text.strip()}")
 						if href:
-							if href.startswith("eAIPfiles"):
-								self.base_url = f"https://ais.lgs.lv/{href.rsplit('/', 1)[0]}"
-							elif href.startswith("/"):
-								self.base_url = f"https://ais.lgs.lv{href.rsplit('/', 1)[0]}"
-							else:
-								self.base_url = href.rsplit('/', 1)[0]
+							self.base_url = _base_url_from_href(href)
 							
 							logger.info(f"Base URL: {self.base_url}")
+							self._save_cached_base_url(self.base_url)
 							return self.base_url
 				except Exception as e:
 					logger.info(f"Error checking button {i}: {e}")
@@ -81,12 +425,8 @@ class LatviaAIPScraperPlaywright:
 					href = button.get_attribute("href")
 					logger.info(f"Found AIP button (fallback) with href: {href}")
 					if href:
-						if href.startswith("eAIPfiles"):
-							self.base_url = f"https://ais.lgs.lv/{href.rsplit('/', 1)[0]}"
-						elif href.startswith("/"):
-							self.base_url = f"https://ais.lgs.lv{href.rsplit('/', 1)[0]}"
-						else:
-							self.base_url = href.rsplit('/', 1)[0]
+						self.base_url = _base_url_from_href(href)
+						self._save_cached_base_url(self.base_url)
 						return self.base_url
 		
 		except Exception as e:
@@ -97,75 +437,135 @@ class LatviaAIPScraperPlaywright:
 		logger.info(f"Using default base URL: {self.base_url}")
 		return self.base_url
 
+	def _fetch_base_url(self):
+		"""Read the current AIRAC issue's base URL from the AIP page over HTTP, or None"""
+		try:
+			response = self.session.get(self.aip_page_url, timeout=10)
+		except requests.RequestException as e:
+			logger.info(f"HTTP fetch of the AIP page failed: {e}")
+			return None
+		if response.status_code != 200:
+			logger.info(f"HTTP fetch of the AIP page returned {response.status_code}")
+			return None
+		soup = BeautifulSoup(response.content, 'html.parser')
+		for link in soup.select("a[href*='eAIPfiles']"):
+			# Current issues are the AIRAC buttons, listed first
+			if link.get_text().strip().startswith("AIRAC"):
+				logger.info(f"Found AIRAC link: {link.get_text().strip()}")
+				return _base_url_from_href(link['href'])
+		logger.info("No AIRAC link in the AIP page, falling back to the browser")
+		return None
+
+	def _load_cached_base_url(self):
+		"""Load the base URL discovered by an earlier run, if still fresh"""
+		try:
+			with open(BASE_URL_CACHE_FILE, 'r', encoding='utf-8') as f:
+				cached = json.load(f)
+		except (OSError, ValueError):
+			return None
+		if time.time() - cached.get('discovered_at', 0) > BASE_URL_CACHE_TTL:
+			return None
+		base_url = cached.get('base_url')
+		# The next AIRAC issue takes over 28 days after this one took effect
+		match = _ISSUE_DATE_RE.search(base_url or '')
+		if match:
+			effective = calendar.timegm(time.strptime(match.group(1), '%Y-%m-%d'))
+			if time.time() > effective + BASE_URL_CACHE_TTL:
+				return None
+		return base_url
+
+	def _save_cached_base_url(self, base_url: str) -> None:
+		"""Persist the discovered base URL for later runs"""
+		try:
+			os.makedirs(os.path.dirname(BASE_URL_CACHE_FILE), exist_ok=True)
+			# Written aside and renamed, so concurrent scrapers never read a partial file
+			tmp_file = f"{BASE_URL_CACHE_FILE}.{os.getpid()}.{threading.get_ident()}.tmp"
+			with open(tmp_file, 'w', encoding='utf-8') as f:
+				json.dump({'base_url': base_url, 'discovered_at': time.time()}, f)
+			os.replace(tmp_file, BASE_URL_CACHE_FILE)
+		except OSError as e:
+			logger.warning(f"Could not write base URL cache: {e}")
+
 	def _open_eaip(self):
 		"""Open the Latvia eAIP"""
 		self._get_base_url()  # This will set self.base_url
 		start_url = f"{self.base_url}/index.html"
 		logger.info(f"Opening Latvia eAIP: {start_url}")
-		self.page.goto(start_url, wait_until="domcontentloaded")
-		self.page.wait_for_load_state("networkidle")
-		time.sleep(3)
+		response = self.page.goto(start_url, wait_until="domcontentloaded")
+		if response is not None and response.status == 404 and self.base_url_from_cache:
+			# A new issue replaced the cached one; discover it again
+			logger.info("Cached base URL is gone, rediscovering")
+			self.base_url = None
+			self.base_url_from_cache = False
+			try:
+				os.remove(BASE_URL_CACHE_FILE)
+			except OSError:
+				pass
+			self._open_eaip()
+			return
+		# The frameset's load event waits for its navigation and content frames
+		self.page.wait_for_load_state("load")
 
 	def _go_to_part3_ad2(self, airport_code: str):
 		"""Navigate to Part 3 Aerodromes → AD 2 → Airport"""
 		logger.info("Navigating to Part 3 Aerodromes → AD 2")
 		
 		# Find the navigation frame and navigate through it
-		nav_frame = None
-		for frame in self.page.frames:
-			name = frame.name or ''
-			if 'navigation' in name.lower() or 'eaisnavigation' in name.lower():
-				nav_frame = frame
-				logger.info(f"Found navigation frame: {name}")
-				break
+		nav_frame, content_frame = self._frames()
 		
 		if not nav_frame:
 			logger.error("No navigation frame found")
 			raise Exception("No navigation frame found")
 		
 		try:
-			nav_frame.wait_for_load_state("networkidle")
-			time.sleep(2)
+			# The text read and the locator actions below wait for the frame themselves
+			nav_frame.wait_for_load_state("domcontentloaded")
 			
 			# Get navigation content
 			nav_text = nav_frame.text_content("body")
 			logger.info(f"Navigation content length: {len(nav_text)}")
 			
+			# Once AERODROMES is expanded by an earlier lookup in this session the
+			# airport links are already shown; clicking the headings again would fold them
+			airport_code = airport_code.upper().strip()
+			expanded = nav_frame.locator(f"//a[contains(., '{airport_code}')]").first.is_visible()
+			
 			# Look for Part 3
-			if "Part 3" in nav_text or "PART 3" in nav_text:
+			if not expanded and ("Part 3" in nav_text or "PART 3" in nav_text):
 				logger.info("Found Part 3 in navigation")
 				# Try to click Part 3 link
 				part3_link = nav_frame.locator("//a[contains(., 'Part 3')]").first
 				if part3_link.is_visible():
 					part3_link.click()
-					time.sleep(1)
 					logger.info("Clicked Part 3")
 			
 			# Look for Aerodromes or AERODROMES
-			if "AERODROMES" in nav_text or "Aerodromes" in nav_text:
+			if not expanded and ("AERODROMES" in nav_text or "Aerodromes" in nav_text):
 				logger.info("Found AERODROMES in navigation")
 				aerodromes_link = nav_frame.locator("//a[contains(., 'AERODROMES') or contains(., 'Aerodromes')]").first
 				if aerodromes_link.is_visible():
 					aerodromes_link.click()
-					time.sleep(1)
 					logger.info("Clicked AERODROMES")
 			
 			# Look for the airport code
-			airport_code = airport_code.upper().strip()
 			airport_link = nav_frame.locator(f"//a[contains(., '{airport_code}')]").first
 			if airport_link.is_visible():
-				airport_link.click()
-				time.sleep(2)
+				if content_frame:
+					# The click loads the airport page into the content frame
+					with content_frame.expect_navigation(wait_until="domcontentloaded", timeout=10000):
+						airport_link.click()
+				else:
+					airport_link.click()
+					self.page.wait_for_load_state("domcontentloaded")
 				logger.info(f"Clicked airport {airport_code}")
-			else:
-				logger.warning(f"Could not find airport {airport_code} link, trying direct navigation")
-				# Direct navigation as fallback
-				self._open_airport_direct(airport_code)
+				return
+			logger.warning(f"Could not find airport {airport_code} link, trying direct navigation")
 			
 		except Exception as e:
 			logger.warning(f"Error navigating in frames: {e}")
-			# Fallback to direct navigation
-			self._open_airport_direct(airport_code)
+		
+		# Fallback to direct navigation
+		self._open_airport_direct(airport_code)
 
 	def _open_airport_direct(self, airport_code: str):
 		"""Navigate to airport page directly"""
@@ -177,47 +577,102 @@ class LatviaAIPScraperPlaywright:
 		airport_url = f"{self.base_url}/eAIP/EV-AD-2.{airport_code}-en-GB.html#{airport_code}-AD-2.1"
 		logger.info(f"Direct URL: {airport_url}")
 		
+		# A HEAD request settles whether the page exists before paying for a navigation
+		try:
+			status = self.session.head(airport_url.split('#', 1)[0], allow_redirects=True, timeout=5).status_code
+		except requests.RequestException as e:
+			logger.info(f"HEAD probe for {airport_code} failed, navigating anyway: {e}")
+			status = None
+		if status == 404:
+			raise Exception(f"No AIP page for airport {airport_code}")
+		
 		try:
+			# The page leaves the frameset; the next lookup has to reopen it
+			self.eaip_opened = False
 			self.page.goto(airport_url, wait_until="domcontentloaded")
-			time.sleep(2)
 			logger.info(f"Successfully navigated to {airport_code} page")
 		except Exception as e:
 			logger.error(f"Failed to navigate to {airport_code} page: {e}")
+			raise Exception(f"Failed to navigate to airport {airport_code} page")
 
-	def _extract_sections_text(self) -> str:
-		"""Extract visible text from current page"""
-		time.sleep(2)
-		
+	def _fetch_airport_page(self, airport_code: str) -> Optional[Tuple[str, Optional['HTMLParser']]]:
+		"""
+		Fetch an airport page over HTTP and return its text and parsed tree, or
+		None when the page is missing or does not mention the airport.
+		"""
+		url = f"{self._get_base_url()}/eAIP/EV-AD-2.{airport_code}-en-GB.html"
+		try:
+			response = self.session.get(url, timeout=15)
+		except requests.RequestException as e:
+			logger.info(f"HTTP fetch of {airport_code} failed: {e}")
+			return None
+		if response.status_code != 200:
+			logger.info(f"HTTP fetch of {airport_code} returned {response.status_code}")
+			return None
+		text, tree = _parse_page(response.content)
+		if airport_code not in text:
+			logger.info(f"HTTP page for {airport_code} does not mention the airport")
+			return None
+		return text, tree
+
+	def _airport_page(self, airport_code: str) -> Tuple[str, Optional['HTMLParser']]:
+		"""Text and parsed tree of an airport page: over HTTP, or through the browser as a fallback."""
+		page = self._fetch_airport_page(airport_code)
+		if page is not None:
+			logger.info(f"Fetched {airport_code} over HTTP, content length: {len(page[0])}")
+			return page
+		self._ensure_session()
+		self._go_to_part3_ad2(airport_code)
+		return self._extract_sections_page()
+
+	def _frames(self):
+		"""
+		Return (navigation frame, content frame) of the eAIP frameset, either None
+		when missing. Frames are looked up by their standard eAIP names, with a
+		scan of frame names as a fallback, and remembered for the current page URL.
+		"""
+		if self.frames_url != self.page.url or not (self.nav_frame and self.content_frame):
+			self.nav_frame = self.page.frame(name='eAISNavigation') or self._frame_named_like('navigation')
+			self.content_frame = self.page.frame(name='eAISContent') or self._frame_named_like('content')
+			self.frames_url = self.page.url
+			if self.nav_frame:
+				logger.info(f"Found navigation frame: {self.nav_frame.name}")
+			if self.content_frame:
+				logger.info(f"Found content frame: {self.content_frame.name}")
+		return self.nav_frame, self.content_frame
+
+	def _frame_named_like(self, keyword: str):
+		"""First frame whose name contains keyword, ignoring case"""
+		return next((frame for frame in self.page.frames if keyword in (frame.name or '').lower()), None)
+
+	def _extract_sections_page(self) -> Tuple[str, Optional['HTMLParser']]:
+		"""Extract the text (and parsed tree) of the current page"""
 		# Try to find content frame
-		content_frame = None
-		for frame in self.page.frames:
-			name = frame.name or ''
-			if 'content' in name.lower() or 'eaiscontent' in name.lower():
-				content_frame = frame
-				logger.info(f"Found content frame: {name}")
-				break
+		_, content_frame = self._frames()
 		
 		if content_frame:
-			text = content_frame.text_content('body')
+			content_frame.wait_for_load_state("domcontentloaded")
+			html = content_frame.content()
 		else:
 			logger.info("No content frame found, using main page")
-			text = self.page.text_content('body')
+			html = self.page.content()
+		# One serialised copy of the DOM, parsed locally like an HTTP-fetched page
+		text, tree = _parse_page(html)
 		
 		logger.info(f"Content length: {len(text)}")
 		if len(text) > 100:
-			logger.info(f"Preview: {text[:500]}")
-		return text
+			logger.debug(f"Preview: {text[:500]}")
+		return text, tree
 
-	def _extract_airport_name(self, text: str, airport_code: str) -> str:
+	def _extract_airport_name(self, text: str, section_index: Dict[str, List[int]], airport_code: str) -> str:
 		"""Extract airport name from the AERODROME LOCATION INDICATOR AND NAME section"""
 		try:
-			upper = text.upper()
-			start_idx = upper.find('AERODROME LOCATION INDICATOR AND NAME')
+			start_idx = _find_section(text, section_index, 'AERODROME LOCATION INDICATOR AND NAME')
 			if start_idx == -1:
-				start_idx = upper.find('AD 2.1')
+				start_idx = _find_section(text, section_index, 'AD 2.1')
 			
 			if start_idx != -1:
-				end_idx = upper.find('AD 2.2', start_idx)
+				end_idx = _find_section(text, section_index, 'AD 2.2', start_idx)
 				if end_idx == -1:
 					end_idx = start_idx + 500
 				
@@ -225,15 +680,12 @@ class LatviaAIPScraperPlaywright:
 				
 				code_upper = airport_code.upper()
 				# Pattern: CODE — NAME
-				name_pattern = rf'{re.escape(code_upper)}\s*[—–-]\s*(.+?)(?=\s*{re.escape(code_upper)}|$)'
-				name_match = re.search(name_pattern, name_section, re.IGNORECASE)
+				airport_name = _name_after_code(name_section, code_upper)
 				
-				if name_match:
-					airport_name = name_match.group(1).strip()
-					airport_name = re.sub(r'\s+', ' ', airport_name)
-					airport_name = re.sub(r'\s*(Aerodrome)$', '', airport_name, flags=re.IGNORECASE)
-					airport_name = re.sub(r'\s*AD\s*2\.\d+.*$', '', airport_name, flags=re.IGNORECASE)
-					airport_name = re.sub(rf'\s*{re.escape(code_upper)}.*$', '', airport_name, flags=re.IGNORECASE)
+				if airport_name:
+					airport_name = _WS_RE.sub(' ', airport_name)
+					airport_name = _NAME_SUFFIX_RE.sub('', airport_name)
+					airport_name = _NAME_HEADING_TAIL_RE.sub('', airport_name)
 					airport_name = airport_name.rstrip(' /').strip()
 					return f"{code_upper} — {airport_name}"
 			
@@ -252,108 +704,86 @@ class LatviaAIPScraperPlaywright:
 			logger.warning(f"Error extracting airport name: {e}")
 			return airport_code.upper()
 
-	def _parse_operational_hours(self, text: str) -> List[Dict]:
-		"""Parse operational hours from AD 2.3 - return all fields"""
-		results: List[Dict] = []
-		upper = text.upper()
-		start_idx = upper.find('AD 2.3 OPERATIONAL HOURS')
+	def _parse_operational_hours(self, text: str, section_index: Dict[str, List[int]]) -> Dict[str, str]:
+		"""Parse operational hours from AD 2.3 - return all fields, NIL when not found"""
+		results = {field: "NIL" for field in ("AD Administration", "AD Operator", "Customs and immigration", "ATS")}
+		start_idx = _find_section(text, section_index, 'AD 2.3 OPERATIONAL HOURS')
 		if start_idx == -1:
-			start_idx = upper.find('OPERATIONAL HOURS')
+			start_idx = _find_section(text, section_index, 'OPERATIONAL HOURS')
 		
-		end_idx = upper.find('AD 2.4') if start_idx != -1 else -1
+		end_idx = _find_section(text, section_index, 'AD 2.4') if start_idx != -1 else -1
 		segment = text[start_idx:end_idx] if start_idx != -1 and end_idx != -1 else text
 		operational_hours_section = segment
 
-		# Track found fields
-		ad_admin_found = False
-		ad_operator_found = False
-		customs_found = False
-		ats_found = False
+		# End of the first caption of each row, from a single pass over the section
+		captions: Dict[str, int] = {}
+		for caption in _HOURS_ROW_RE.finditer(operational_hours_section):
+			captions.setdefault(caption.lastgroup, caption.end())
+			if len(captions) == 5:
+				break
 		
-		# Search for AD Administration
-		ad_admin_patterns = [
-			r'(?:^|\s)AD\s+Administration.*?(H24|NIL)',
-		]
-		for pattern in ad_admin_patterns:
-			match = re.search(pattern, operational_hours_section, re.IGNORECASE | re.DOTALL)
+		def hours_after(pos: int):
+			match = _HOURS_VALUE_RE.search(operational_hours_section, pos)
 			if match:
-				hours = "H24" if "H24" in match.group(1).upper() else "NIL"
-				results.append({"day": "AD Administration", "hours": hours})
-				ad_admin_found = True
-				break
+				return "H24" if "H24" in match.group(0).upper() else "NIL"
+			return None
+		
+		# Search for AD Administration
+		hours = hours_after(captions['admin']) if 'admin' in captions else None
+		if hours:
+			results["AD Administration"] = hours
 		
 		# Search for AD Operator
-		ad_operator_patterns = [
-			r'(?:^|\s)AD\s+Operator.*?(H24|NIL)',
-			r'1AD.*?(H24|NIL)',
-		]
-		for pattern in ad_operator_patterns:
-			match = re.search(pattern, operational_hours_section, re.IGNORECASE | re.DOTALL)
-			if match:
-				hours = "H24" if "H24" in match.group(1).upper() else "NIL"
-				results.append({"day": "AD Operator", "hours": hours})
-				ad_operator_found = True
+		for row in ('operator', 'operator_row'):
+			hours = hours_after(captions[row]) if row in captions else None
+			if hours:
+				results["AD Operator"] = hours
 				break
 		
 		# Search for Customs and Immigration
-		customs_pattern = r'Customs.*?immigration.*?(H24|NIL|May be requested)'
-		customs_match = re.search(customs_pattern, operational_hours_section, re.IGNORECASE | re.DOTALL)
+		immigration = _IMMIGRATION_RE.search(operational_hours_section, captions['customs']) if 'customs' in captions else None
+		customs_match = _CUSTOMS_VALUE_RE.search(operational_hours_section, immigration.end()) if immigration else None
 		if customs_match:
-			hours_text = customs_match.group(1)
+			hours_text = customs_match.group(0)
 			if 'May be requested' in hours_text:
-				results.append({"day": "Customs and immigration", "hours": "On request"})
+				results["Customs and immigration"] = "On request"
 			else:
-				hours = "H24" if "H24" in hours_text.upper() else "NIL"
-				results.append({"day": "Customs and immigration", "hours": hours})
-			customs_found = True
+				results["Customs and immigration"] = "H24" if "H24" in hours_text.upper() else "NIL"
 		
 		# Search for ATS
-		ats_pattern = r'(?<!Reporting )(?<!MET\s)ATS(?![A-Z]).*?(H24|NIL)'
-		ats_match = re.search(ats_pattern, operational_hours_section, re.IGNORECASE | re.DOTALL)
-		if ats_match:
-			hours = "H24" if "H24" in ats_match.group(1).upper() else "NIL"
-			results.append({"day": "ATS", "hours": hours})
-			ats_found = True
-		
-		# Add NIL for missing fields
-		if not ad_admin_found:
-			results.append({"day": "AD Administration", "hours": "NIL"})
-		if not ad_operator_found:
-			results.append({"day": "AD Operator", "hours": "NIL"})
-		if not customs_found:
-			results.append({"day": "Customs and immigration", "hours": "NIL"})
-		if not ats_found:
-			results.append({"day": "ATS", "hours": "NIL"})
+		hours = hours_after(captions['ats']) if 'ats' in captions else None
+		if hours:
+			results["ATS"] = hours
 		
 		return results
 
-	def _parse_contacts(self, text: str) -> List[Dict]:
+	def _parse_contacts(self, text: str, section_index: Dict[str, List[int]]) -> List[Dict]:
 		"""Parse contacts from text"""
 		contacts: List[Dict] = []
 		
-		upper = text.upper()
-		start_idx = upper.find('AD OPERATOR, ADDRESS, TELEPHONE, TELEFAX, E-MAIL, AFS, URL')
+		start_idx = _find_section(text, section_index, 'AD OPERATOR, ADDRESS, TELEPHONE, TELEFAX, E-MAIL, AFS, URL')
 		if start_idx == -1:
-			start_idx = upper.find('AD OPERATOR')
+			start_idx = _find_section(text, section_index, 'AD OPERATOR')
 		
 		if start_idx != -1:
-			end_idx = upper.find('7TYPES OF TRAFFIC', start_idx)
+			end_idx = _find_section(text, section_index, '7TYPES OF TRAFFIC', start_idx)
 			if end_idx == -1:
-				end_idx = upper.find('AD 2.3', start_idx)
+				end_idx = _find_section(text, section_index, 'AD 2.3', start_idx)
 			if end_idx == -1:
 				end_idx = start_idx + 2000
 			
 			ad_operator_section = text[start_idx:end_idx]
 			
-			# Extract phone numbers (Latvian format: +371)
-			phone_regex = r'(\+371[0-9\s]+)'
-			phones = re.findall(phone_regex, ad_operator_section)
-			phones = [re.sub(r'\s+', ' ', p.strip()) for p in phones if len(p.strip()) <= 20]
-			
-			# Extract emails
-			email_regex = r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
-			emails = re.findall(email_regex, ad_operator_section)
-			emails = [re.sub(r'[A-Z]{2,}.*$', '', email) for email in emails]
+			# Extract phone numbers (Latvian format: +371) and emails
+			phones: List[str] = []
+			emails: List[str] = []
+			for match in _CONTACT_RE.finditer(ad_operator_section):
+				if match.lastgroup == 'phone':
+					phone = match.group().strip()
+					if len(phone) <= 20:
+						phones.append(_WS_RE.sub(' ', phone))
+				else:
+					emails.append(_EMAIL_TAIL_RE.sub('', match.group()))
 			
 			# Create contacts
 			for i, phone in enumerate(phones[:3]):
@@ -376,30 +806,23 @@ class LatviaAIPScraperPlaywright:
 		
 		return contacts
 	
-	def _extract_fire_fighting_category(self, text: str) -> str:
+	def _extract_fire_fighting_category(self, text: str, section_index: Dict[str, List[int]]) -> str:
 		"""Extract AD Category for fire fighting from AD 2.6 section"""
 		try:
-			upper = text.upper()
-			start_idx = upper.find('AD 2.6')
+			start_idx = _find_section(text, section_index, 'AD 2.6')
 			if start_idx == -1:
-				start_idx = upper.find('RESCUE AND FIRE FIGHTING')
+				start_idx = _find_section(text, section_index, 'RESCUE AND FIRE FIGHTING')
 			
 			if start_idx != -1:
-				end_idx = upper.find('AD 2.7', start_idx)
+				end_idx = _find_section(text, section_index, 'AD 2.7', start_idx)
 				if end_idx == -1:
 					end_idx = start_idx + 2000
 				
 				fire_section = text[start_idx:end_idx]
 				
 				# Look for AD Category
-				category_patterns = [
-					r'AD\s+CATEGORY[:\s]+([0-9])',
-					r'Category[:\s]+([0-9])',
-					r'Category\s+([0-9])[:\s]+for',
-				]
-				
-				for pattern in category_patterns:
-					match = re.search(pattern, fire_section, re.IGNORECASE)
+				for pattern in _CATEGORY_RES:
+					match = pattern.search(fire_section)
 					if match:
 						return match.group(1)
 			
@@ -408,26 +831,25 @@ class LatviaAIPScraperPlaywright:
 			logger.warning(f"Error extracting fire fighting category: {e}")
 			return "Not specified"
 	
-	def _extract_remarks(self, text: str) -> str:
+	def _extract_remarks(self, text: str, section_index: Dict[str, List[int]]) -> str:
 		"""Extract Remarks from text - must be standalone remarks, not operational hours"""
 		try:
-			upper = text.upper()
 			# Look for AD 2. section that has "Remarks:" or standalone remarks
 			# Skip AD 2.3 OPERATIONAL HOURS
-			ad23_idx = upper.find('AD 2.3')
+			ad23_idx = _find_section(text, section_index, 'AD 2.3')
 			
 			if ad23_idx != -1:
 				# Look BEFORE AD 2.3 for remarks in AD 2.2 or early in AD 2.3
-				ad22_idx = upper.rfind('AD 2.2', 0, ad23_idx)
+				ad22_idx = _rfind_section(text, section_index, 'AD 2.2', 0, ad23_idx)
 				if ad22_idx != -1:
 					# Search in AD 2.2 section
-					remarks_idx = upper.find('REMARKS', ad22_idx, ad23_idx)
+					remarks_idx = _find_section(text, section_index, 'REMARKS', ad22_idx, ad23_idx)
 					if remarks_idx != -1:
 						end_idx = min(ad23_idx, remarks_idx + 500)
 						remarks_text = text[remarks_idx:end_idx]
-						remarks_text = re.sub(r'^REMARKS[:\s]*', '', remarks_text, flags=re.IGNORECASE)
-						remarks_text = re.sub(r'AD\s+2\.3.*$', '', remarks_text, flags=re.IGNORECASE | re.DOTALL)
-						remarks_text = re.sub(r'\s+', ' ', remarks_text.strip())
+						remarks_text = _REMARKS_PREFIX_RE.sub('', remarks_text)
+						remarks_text = _AD23_TAIL_RE.sub('', remarks_text)
+						remarks_text = _WS_RE.sub(' ', remarks_text.strip())
 						if len(remarks_text) > 5:  # Not just "NIL" or empty
 							return remarks_text[:200]
 			
@@ -436,30 +858,23 @@ class LatviaAIPScraperPlaywright:
 			logger.warning(f"Error extracting remarks: {e}")
 			return "NIL"
 	
-	def _extract_traffic_types(self, text: str) -> str:
+	def _extract_traffic_types(self, text: str, section_index: Dict[str, List[int]]) -> str:
 		"""Extract Types of traffic permitted from AD 2.2 section"""
 		try:
-			upper = text.upper()
-			start_idx = upper.find('AD 2.2')
+			start_idx = _find_section(text, section_index, 'AD 2.2')
 			if start_idx == -1:
-				start_idx = upper.find('AERODROME GEOGRAPHICAL')
+				start_idx = _find_section(text, section_index, 'AERODROME GEOGRAPHICAL')
 			
 			if start_idx != -1:
-				end_idx = upper.find('AD 2.3', start_idx)
+				end_idx = _find_section(text, section_index, 'AD 2.3', start_idx)
 				if end_idx == -1:
 					end_idx = start_idx + 2000
 				
 				traffic_section = text[start_idx:end_idx]
 				
 				# Look for traffic type
-				traffic_patterns = [
-					r'Types?\s+of\s+traffic.*?(IFR[/, ]VFR|VFR[/, ]IFR|IFR|VFR)',
-					r'Traffic.*?(IFR[/, ]VFR|VFR[/, ]IFR|IFR|VFR)',
-					r'(IFR/VFR|VFR/IFR)',
-				]
-				
-				for pattern in traffic_patterns:
-					match = re.search(pattern, traffic_section, re.IGNORECASE)
+				for pattern in _TRAFFIC_RES:
+					match = pattern.search(traffic_section)
 					if match:
 						return match.group(1)
 			
@@ -469,75 +884,116 @@ class LatviaAIPScraperPlaywright:
 			return "Not specified"
 
 	def get_airport_info(self, airport_code: str) -> Dict:
-		"""Get airport information with fixed field structure"""
-		self._setup_browser()
-		try:
-			self._open_eaip()
-			self._go_to_part3_ad2(airport_code)
-			text = self._extract_sections_text()
-			
-			# Extract operational hours from AD 2.3
-			operational_hours = self._parse_operational_hours(text)
-			
-			# Build fixed structure
-			info = {
-				"airportCode": airport_code.upper(),
-				"airportName": self._extract_airport_name(text, airport_code),
-				"contacts": self._parse_contacts(text),
-				# AD 2.3 OPERATIONAL HOURS section
-				"adAdministration": self._get_field_value(operational_hours, "AD Administration"),
-				"adOperator": self._get_field_value(operational_hours, "AD Operator"),
-				"customsAndImmigration": self._get_field_value(operational_hours, "Customs and immigration"),
-				"ats": self._get_field_value(operational_hours, "ATS"),
-				"operationalRemarks": self._extract_operational_remarks(text),
-				# AD 2.2 AERODROME GEOGRAPHICAL AND ADMINISTRATIVE DATA
-				"trafficTypes": self._extract_traffic_types(text),
-				"administrativeRemarks": self._extract_administrative_remarks(text),
-				# AD 2.6 RESCUE AND FIREFIGHTING SERVICES
-				"fireFightingCategory": self._extract_fire_fighting_category(text),
-			}
-			logger.info(f"Extracted data for {airport_code}")
+		"""
+		Get airport information with fixed field structure.
+
+		The browser is reused across calls; use the scraper as a context manager
+		(or call close()) to shut it down. Results are cached per AIRAC issue
+		for the life of the process; see invalidate_airport_info.
+		"""
+		return self._cached_airport_info(airport_code.upper().strip())
+
+	def get_airports_info(self, airport_codes: List[str]) -> Dict[str, Dict]:
+		"""
+		Get airport information for several airports in one browser session.
+
+		Pages are fetched over a pooled HTTP session; if one has to fall back to
+		the browser, the base URL is resolved and the eAIP opened once, and each
+		airport then only costs its navigation click. A failing airport is
+		reported as {'airportCode': ..., 'error': ...} without stopping the batch.
+		"""
+		codes = [code.upper().strip() for code in airport_codes]
+		results: Dict[str, Dict] = {}
+		for code in codes:
+			try:
+				results[code] = self._cached_airport_info(code)
+			except Exception as e:
+				logger.error(f"Error fetching airport information for {code}: {e}")
+				results[code] = {'airportCode': code, 'error': f"Failed to fetch airport information: {str(e)}"}
+		return results
+
+	def _cached_airport_info(self, airport_code: str) -> Dict:
+		"""
+		Airport information from the process-wide cache, fetched and parsed on a
+		miss. Callers get a copy, so changing it leaves the cached entry intact.
+		"""
+		key = (airport_code, self._get_base_url())
+		with _INFO_CACHE_LOCK:
+			info = _INFO_CACHE.get(key)
+		if info is not None:
+			logger.info(f"Using cached data for {airport_code}")
+			return copy.deepcopy(info)
+		text, tree = self._airport_page(airport_code)
+		info = self._build_airport_info(airport_code, text, tree)
+		logger.info(f"Extracted data for {airport_code}")
+		if airport_code not in text:
+			# Whatever page the browser ended up on, it is not this airport's
+			logger.warning(f"Page for {airport_code} does not mention the airport; not caching it")
 			return info
-		finally:
-			self.close()
-	
-	def _get_field_value(self, operational_hours: List[Dict], field_name: str) -> str:
-		"""Get value for a specific field from operational hours"""
-		for hour in operational_hours:
-			if hour.get("day", "") == field_name:
-				return hour.get("hours", "NIL")
-		return "NIL"
+		# The browser fallback may have replaced a stale base URL; key on the one used
+		with _INFO_CACHE_LOCK:
+			while len(_INFO_CACHE) >= INFO_CACHE_SIZE:
+				del _INFO_CACHE[next(iter(_INFO_CACHE))]
+			_INFO_CACHE[(airport_code, self.base_url)] = info
+		return copy.deepcopy(info)
+
+	def _build_airport_info(self, airport_code: str, text: str, tree: Optional['HTMLParser'] = None) -> Dict:
+		"""Run the AD 2.x extractors over an airport page's text, preferring its tables where parsed."""
+		# Locate every AD 2.x heading once for all extractors
+		section_index = _build_section_index(text)
+		# Extract operational hours from AD 2.3
+		operational_hours = self._parse_operational_hours(text, section_index)
+		if tree is not None:
+			# Rows read from the AD 2.3 table override the text scan's guesses
+			operational_hours.update(_structured_hours(tree, airport_code.upper()))
+		
+		# Build fixed structure
+		return {
+			"airportCode": airport_code.upper(),
+			"airportName": self._extract_airport_name(text, section_index, airport_code),
+			"contacts": self._parse_contacts(text, section_index),
+			# AD 2.3 OPERATIONAL HOURS section
+			"adAdministration": operational_hours["AD Administration"],
+			"adOperator": operational_hours["AD Operator"],
+			"customsAndImmigration": operational_hours["Customs and immigration"],
+			"ats": operational_hours["ATS"],
+			"operationalRemarks": self._extract_operational_remarks(text, section_index),
+			# AD 2.2 AERODROME GEOGRAPHICAL AND ADMINISTRATIVE DATA
+			"trafficTypes": self._extract_traffic_types(text, section_index),
+			"administrativeRemarks": self._extract_administrative_remarks(text, section_index),
+			# AD 2.6 RESCUE AND FIREFIGHTING SERVICES
+			"fireFightingCategory": self._extract_fire_fighting_category(text, section_index),
+		}
 	
-	def _extract_operational_remarks(self, text: str) -> str:
+	def _extract_operational_remarks(self, text: str, section_index: Dict[str, List[int]]) -> str:
 		"""Extract Remarks from AD 2.3 OPERATIONAL HOURS section"""
-		return self._extract_remarks(text)
+		return self._extract_remarks(text, section_index)
 	
-	def _extract_administrative_remarks(self, text: str) -> str:
+	def _extract_administrative_remarks(self, text: str, section_index: Dict[str, List[int]]) -> str:
 		"""Extract Remarks from AD 2.2 section"""
 		try:
-			upper = text.upper()
-			ad22_start = upper.find('AD 2.2')
+			ad22_start = _find_section(text, section_index, 'AD 2.2')
 			if ad22_start == -1:
 				return "NIL"
 			
-			ad23_start = upper.find('AD 2.3', ad22_start)
+			ad23_start = _find_section(text, section_index, 'AD 2.3', ad22_start)
 			if ad23_start == -1:
 				ad23_start = ad22_start + 3000
 			
 			ad22_section = text[ad22_start:ad23_start]
-			remarks_idx = upper.find('REMARKS', ad22_start, ad23_start)
+			remarks_idx = _find_section(text, section_index, 'REMARKS', ad22_start, ad23_start)
 			
 			if remarks_idx != -1:
 				remarks_text = text[remarks_idx:min(ad23_start, remarks_idx + 1000)]
-				remarks_text = re.sub(r'^REMARKS[:\s]*', '', remarks_text, flags=re.IGNORECASE)
+				remarks_text = _REMARKS_PREFIX_RE.sub('', remarks_text)
 				# Stop at next AD 2.X section
-				next_ad = re.search(r'\w+\s+AD\s+2\.\d+', remarks_text, re.IGNORECASE)
+				next_ad = _NEXT_AD_RE.search(remarks_text)
 				if next_ad:
 					remarks_text = remarks_text[:next_ad.start()]
 				# Remove copyright and AIP footer patterns
-				remarks_text = re.sub(r'©.*$', '', remarks_text, flags=re.DOTALL)
-				remarks_text = re.sub(r'AIP\s+\w+\s+AIRAC.*$', '', remarks_text, flags=re.IGNORECASE | re.DOTALL)
-				remarks_text = re.sub(r'\s+', ' ', remarks_text.strip())
+				remarks_text = _COPYRIGHT_RE.sub('', remarks_text)
+				remarks_text = _AIP_FOOTER_RE.sub('', remarks_text)
+				remarks_text = _WS_RE.sub(' ', remarks_text.strip())
 				if len(remarks_text) > 5:
 					return remarks_text[:200]
 			
@@ -547,34 +1003,75 @@ class LatviaAIPScraperPlaywright:
 			return "NIL"
 
 	def close(self):
-		"""Close browser"""
-		try:
-			if self.browser:
-				self.browser.close()
-		except:
-			pass
+		"""Close this scraper's context and release the shared browser"""
+		self.session.close()
+		if self.browser is not None:
+			try:
+				if self.context:
+					self.context.close()
+			except:
+				pass
+			self.browser = None
+			self._release_browser()
+		self.context = None
+		self.page = None
+		self.eaip_opened = False
+		self.frames_url = self.nav_frame = self.content_frame = None
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		self.close()
+
+
+def scrape_airports(airport_codes: List[str], max_workers: int = 3) -> Dict[str, Dict]:
+	"""
+	Scrape several airports in parallel, one warm browser per worker thread.
+
+	Playwright's sync API is bound to the thread that started it, so the codes
+	are dealt out round-robin and each worker runs a batch in its own scraper,
+	opening the eAIP once and closing the browser from the same thread.
+
+	Args:
+		airport_codes: Airport codes (e.g., ['EVRA', 'EVLA'])
+		max_workers: Number of concurrent browsers
+
+	Returns:
+		Dictionary mapping airport code to its information (or {'error': ...})
+	"""
+	codes = [code.upper().strip() for code in airport_codes]
+	batches = [codes[i::max_workers] for i in range(min(max_workers, len(codes)))]
+
+	def scrape(worker: int) -> Dict[str, Dict]:
+		batch = batches[worker]
 		try:
-			if self.playwright:
-				self.playwright.stop()
-		except:
-			pass
-		logger.info("Playwright browser closed")
+			with LatviaAIPScraperPlaywright() as scraper:
+				return scraper.get_airports_info(batch)
+		except Exception as e:
+			logger.error(f"Error scraping {', '.join(batch)}: {e}")
+			return {code: {'airportCode': code, 'error': str(e)} for code in batch}
+
+	results: Dict[str, Dict] = {}
+	with ThreadPoolExecutor(max_workers=max(len(batches), 1)) as executor:
+		for batch_results in executor.map(scrape, range(len(batches))):
+			results.update(batch_results)
+	# Report in the order the codes were asked for
+	return {code: results[code] for code in codes}
 
 
 def main():
 	"""Test the Latvia AIP scraper"""
-	scraper = LatviaAIPScraperPlaywright()
 	try:
 		# Test with a Latvian airport (e.g., EVRA - Riga)
-		result = scraper.get_airport_info("EVRA")
+		with LatviaAIPScraperPlaywright() as scraper:
+			result = scraper.get_airport_info("EVRA")
 		print("\n=== RESULTS ===")
 		print(result)
 	except Exception as e:
 		print(f"Error: {e}")
 		import traceback
 		traceback.print_exc()
-	finally:
-		scraper.close()
 
 if __name__ == "__main__":
 	main()
@@ -6,9 +6,15 @@ This allows fast, accurate extraction
 import json
 import re
 import PyPDF2
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+@lru_cache(maxsize=1024)
+def _header_pattern(code: str) -> re.Pattern:
+    """'CODE —' airport header pattern, compiled once per code rather than per page"""
+    return re.compile(rf'{code}\s*[—\-]')
+
 def analyze_pdf(pdf_path: Path) -> Dict:
     """Analyze a single PDF and build index of airports and sections"""
 
@@ -58,8 +64,7 @@ def analyze_pdf(pdf_path: Path) -> Dict:
                         continue
 
                     # Check if this code appears with airport name format
-                    code_pattern = rf'{code}\s*[—\-]'
-                    has_airport_header = bool(re.search(code_pattern, text))
+                    has_airport_header = bool(_header_pattern(code).search(text))
 
                     if code not in result['airports']:
                         result['airports'][code] = {
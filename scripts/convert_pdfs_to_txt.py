@@ -13,31 +13,42 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 def convert_pdf_to_txt(pdf_path: Path, txt_path: Path) -> bool:
-    """Convert a single PDF file to TXT format"""
+    """
+    Convert a single PDF file to TXT format
+    Pages are written as they are extracted rather than collected first, so a
+    large AIP never holds its whole text in memory; the partial file is only
+    moved into place once the conversion succeeded
+    """
+    part_path = txt_path.with_name(txt_path.name + '.part')
     try:
         reader = PdfReader(str(pdf_path))
-        text_content = []
+        pages_written = 0
         
-        for page_num, page in enumerate(reader.pages, 1):
-            try:
-                text = page.extract_text()
+        with open(part_path, 'w', encoding='utf-8') as f:
+            for page_num, page in enumerate(reader.pages, 1):
+                try:
+                    text = page.extract_text()
+                except Exception as e:
+                    logger.warning(f"Error extracting text from page {page_num} of {pdf_path.name}: {e}")
+                    continue
                 if text:
-                    text_content.append(f"=== Page {page_num} ===\n{text}\n")
-            except Exception as e:
-                logger.warning(f"Error extracting text from page {page_num} of {pdf_path.name}: {e}")
-                continue
+                    if pages_written:
+                        f.write('\n')
+                    f.write(f"=== Page {page_num} ===\n{text}\n")
+                    pages_written += 1
         
-        if text_content:
-            with open(txt_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(text_content))
+        if pages_written:
+            part_path.replace(txt_path)
             logger.info(f"Converted: {pdf_path.name} -> {txt_path.name} ({len(reader.pages)} pages)")
             return True
         else:
+            part_path.unlink()
             logger.warning(f"No text extracted from {pdf_path.name}")
             return False
             
     except Exception as e:
         logger.error(f"Error converting {pdf_path.name}: {e}")
+        part_path.unlink(missing_ok=True)
         return False
 
 def backup_pdf(pdf_path: Path, backup_dir: Path) -> Path:
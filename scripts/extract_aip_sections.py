@@ -9,6 +9,7 @@ Extract specific information from AIP TXT files:
 import json
 import re
 import logging
+from bisect import bisect_right
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
@@ -17,25 +18,46 @@ from datetime import datetime
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def find_section_content(text: str, section_pattern: str, airport_code: Optional[str] = None) -> Optional[str]:
+# Any AD 2.x heading; ends the section being collected
+NEXT_SECTION_PATTERN = re.compile(r'AD\s*[-\.]?\s*2\.\d+', re.IGNORECASE)
+# Longest section kept, in lines after the heading
+MAX_SECTION_LINES = 101
+
+def index_heading_lines(lines: List[str]) -> List[int]:
+    """
+    Indices of the lines holding any AD 2.x heading, in one pass over the document
+    Every section heading (AD 2.1, 2.2, 2.3, 2.6) is also such a line, so section
+    lookups only need to look at these instead of every line
+    """
+    return [i for i, line in enumerate(lines) if NEXT_SECTION_PATTERN.search(line)]
+
+def find_section_content(text: str, section_pattern: str, airport_code: Optional[str] = None,
+                         lines: Optional[List[str]] = None,
+                         heading_lines: Optional[List[int]] = None) -> Optional[str]:
     """
     Find content of a specific section (e.g., AD 2.2, AD 2.3, AD 2.6)
     Returns the text content of that section
+    Callers extracting several sections from one document pass its lines,
+    split once, and their heading index instead of having every lookup
+    re-split and re-scan the whole text
     """
     # Pattern to match section header
     pattern = re.compile(section_pattern, re.IGNORECASE | re.MULTILINE)
     
-    lines = text.split('\n')
+    if lines is None:
+        lines = text.split('\n')
+    if heading_lines is None:
+        heading_lines = index_heading_lines(lines)
+    code_upper = airport_code.upper() if airport_code else None
     section_start = None
     
     # Find section start
-    for i, line in enumerate(lines):
-        if pattern.search(line):
+    for i in heading_lines:
+        if pattern.search(lines[i]):
             # If airport code is specified, check if it's in nearby lines
-            if airport_code:
+            if code_upper:
                 # Check previous and next few lines for airport code
-                context = '\n'.join(lines[max(0, i-5):min(i+20, len(lines))])
-                if airport_code.upper() not in context.upper():
+                if not any(code_upper in nearby.upper() for nearby in lines[max(0, i-5):i+20]):
                     continue
             section_start = i
             break
@@ -44,33 +66,30 @@ def find_section_content(text: str, section_pattern: str, airport_code: Optional
         return None
     
     # Extract section content until next AD section or end of document
-    section_lines = []
-    next_section_pattern = re.compile(r'AD\s*[-\.]?\s*2\.\d+', re.IGNORECASE)
+    current_section_num = section_pattern.split(r'2\.')[1].split(r'\.')[0]
+    own_heading = 'AD 2.' + current_section_num
+    end = min(section_start + 1 + MAX_SECTION_LINES, len(lines))
     
-    for i in range(section_start + 1, len(lines)):
+    for i in heading_lines[bisect_right(heading_lines, section_start):]:
+        if i >= end:
+            break
         line = lines[i]
         
         # Stop if we hit another AD 2.x section (but not subsections like 2.2.1)
-        if next_section_pattern.search(line) and not line.strip().startswith('AD 2.' + section_pattern.split(r'2\.')[1].split(r'\.')[0]):
+        match = NEXT_SECTION_PATTERN.search(line)
+        if not line.strip().startswith(own_heading):
             # Check if it's a different main section (2.2, 2.3, etc.)
-            current_section_num = section_pattern.split(r'2\.')[1].split(r'\.')[0]
-            match = next_section_pattern.search(line)
-            if match:
-                found_section = match.group(0)
-                if current_section_num not in found_section:
-                    break
-        
-        section_lines.append(line)
-        
-        # Limit section length (stop after 100 lines or empty section marker)
-        if len(section_lines) > 100:
-            break
+            if current_section_num not in match.group(0):
+                end = i
+                break
     
-    return '\n'.join(section_lines)
+    # The section is a contiguous run of lines, joined once
+    return '\n'.join(lines[section_start + 1:end])
 
-def extract_ad22_info(text: str, airport_code: Optional[str] = None) -> Dict:
+def extract_ad22_info(text: str, airport_code: Optional[str] = None, lines: Optional[List[str]] = None,
+                     heading_lines: Optional[List[int]] = None) -> Dict:
     """Extract AD 2.2 information: Types of traffic permitted and Remarks"""
-    section_text = find_section_content(text, r'AD\s*[-\.]?\s*2\.2', airport_code)
+    section_text = find_section_content(text, r'AD\s*[-\.]?\s*2\.2', airport_code, lines, heading_lines)
     
     if not section_text:
         return {
@@ -113,9 +132,10 @@ def extract_ad22_info(text: str, airport_code: Optional[str] = None) -> Dict:
     
     return result
 
-def extract_ad23_info(text: str, airport_code: Optional[str] = None) -> Dict:
+def extract_ad23_info(text: str, airport_code: Optional[str] = None, lines: Optional[List[str]] = None,
+                     heading_lines: Optional[List[int]] = None) -> Dict:
     """Extract AD 2.3 information: AD Administrator/Operator, Customs, ATS, Remarks"""
-    section_text = find_section_content(text, r'AD\s*[-\.]?\s*2\.3', airport_code)
+    section_text = find_section_content(text, r'AD\s*[-\.]?\s*2\.3', airport_code, lines, heading_lines)
     
     if not section_text:
         return {
@@ -205,9 +225,10 @@ def extract_ad23_info(text: str, airport_code: Optional[str] = None) -> Dict:
     
     return result
 
-def extract_ad26_info(text: str, airport_code: Optional[str] = None) -> Dict:
+def extract_ad26_info(text: str, airport_code: Optional[str] = None, lines: Optional[List[str]] = None,
+                     heading_lines: Optional[List[int]] = None) -> Dict:
     """Extract AD 2.6 information: AD Category for fire fighting"""
-    section_text = find_section_content(text, r'AD\s*[-\.]?\s*2\.6', airport_code)
+    section_text = find_section_content(text, r'AD\s*[-\.]?\s*2\.6', airport_code, lines, heading_lines)
     
     if not section_text:
         return {
@@ -269,10 +290,13 @@ def process_txt_file(txt_path: Path) -> Dict:
         
         airports = {}
         lines = text.split('\n')
+        # AD 2.1 lines are AD 2.x heading lines too, so this index serves both
+        # the airport scan below and every section lookup
+        heading_lines = index_heading_lines(lines)
         
         # Find each AD 2.1 section and extract airport code
-        for i, line in enumerate(lines):
-            if ad21_pattern.search(line):
+        for i in heading_lines:
+            if ad21_pattern.search(lines[i]):
                 # Look for airport code in nearby lines
                 context = '\n'.join(lines[max(0, i-2):min(i+10, len(lines))])
                 codes = set()
@@ -290,9 +314,9 @@ def process_txt_file(txt_path: Path) -> Dict:
                     if airport_code not in airports:
                         airports[airport_code] = {
                             'airport_code': airport_code,
-                            'ad22': extract_ad22_info(text, airport_code),
-                            'ad23': extract_ad23_info(text, airport_code),
-                            'ad26': extract_ad26_info(text, airport_code)
+                            'ad22': extract_ad22_info(text, airport_code, lines, heading_lines),
+                            'ad23': extract_ad23_info(text, airport_code, lines, heading_lines),
+                            'ad26': extract_ad26_info(text, airport_code, lines, heading_lines)
                         }
         
         # If no airports found via AD 2.1, try to extract from filename or text
@@ -301,9 +325,9 @@ def process_txt_file(txt_path: Path) -> Dict:
             if airport_code:
                 airports[airport_code] = {
                     'airport_code': airport_code,
-                    'ad22': extract_ad22_info(text, airport_code),
-                    'ad23': extract_ad23_info(text, airport_code),
-                    'ad26': extract_ad26_info(text, airport_code)
+                    'ad22': extract_ad22_info(text, airport_code, lines, heading_lines),
+                    'ad23': extract_ad23_info(text, airport_code, lines, heading_lines),
+                    'ad26': extract_ad26_info(text, airport_code, lines, heading_lines)
                 }
         
         return airports